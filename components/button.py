@@ -2,12 +2,15 @@
 Button Component - Tombol interaktif dengan animasi
 """
 
-import pygame
 import cairo
 import math
+from core.pointer import POINTER_DOWN, POINTER_MOVE, POINTER_UP, MOUSE_ID
+
+# Laju animasi scale (setara "scale += (target - scale) * 10 * dt")
+SCALE_RATE = 10
 
 class Button:
-    def __init__(self, x, y, width, height, text, color, text_color=(255, 255, 255)):
+    def __init__(self, x, y, width, height, text, color, text_color=(255, 255, 255), tweens=None):
         self.x = x
         self.y = y
         self.width = width
@@ -19,41 +22,65 @@ class Button:
         # Animation states
         self.hover = False
         self.pressed = False
+        self.pressed_by = None  # ID pointer yang sedang menekan tombol
         self.scale = 1.0
         self.target_scale = 1.0
+        self.tweens = tweens  # TweenEngine opsional dari GameEngine
         
-        # Callback function
+        # Callback functions
         self.on_click = None
+        self.on_press = None  # Dipanggil langsung saat ditekan (feedback suara)
     
-    def handle_event(self, event):
-        """Handle mouse events"""
-        mouse_pos = pygame.mouse.get_pos()
-        
-        # Check if mouse is over button
-        self.hover = (self.x <= mouse_pos[0] <= self.x + self.width and
-                      self.y <= mouse_pos[1] <= self.y + self.height)
+    def handle_pointer(self, pointer):
+        """Handle pointer events (mouse atau sentuhan, lihat core/pointer.py)"""
+        inside = self.is_point_inside(pointer.x, pointer.y)
         
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if self.hover:
+        if pointer.kind == POINTER_DOWN:
+            if inside and self.pressed_by is None:
                 self.pressed = True
-                self.target_scale = 0.95
-        
-        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-            if self.pressed and self.hover:
-                # Trigger click callback
-                if self.on_click:
-                    self.on_click()
+                self.pressed_by = pointer.id
+                self.hover = True
+                self._set_target_scale(0.95)
+                if self.on_press:
+                    self.on_press()
+        
+        elif pointer.kind == POINTER_MOVE:
+            # Hover mengikuti mouse, atau jari yang sedang menekan tombol
+            if pointer.id == self.pressed_by or (self.pressed_by is None and pointer.id == MOUSE_ID):
+                self.hover = inside
+        
+        elif pointer.kind == POINTER_UP and pointer.id == self.pressed_by:
             self.pressed = False
-            self.target_scale = 1.1 if self.hover else 1.0
+            self.pressed_by = None
+            # Jari yang diangkat tidak lagi "melayang" di atas tombol
+            self.hover = inside and pointer.id == MOUSE_ID
+            self._set_target_scale(1.1 if self.hover else 1.0)
+            if inside and self.on_click:
+                # Trigger click callback
+                self.on_click()
+    
+    def is_point_inside(self, px, py):
+        """Check if point is inside button"""
+        return (self.x <= px <= self.x + self.width and
+                self.y <= py <= self.y + self.height)
     
     def update(self, dt):
         """Update animations"""
-        # Smooth scale animation
-        self.scale += (self.target_scale - self.scale) * 10 * dt
-        
         # Update target scale based on hover
         if not self.pressed:
-            self.target_scale = 1.1 if self.hover else 1.0
+            self._set_target_scale(1.1 if self.hover else 1.0)
+        
+        # Tanpa tween engine: animasi manual (independen dari frame rate)
+        if self.tweens is None:
+            self.scale = self.target_scale + (self.scale - self.target_scale) * math.exp(-SCALE_RATE * dt)
+    
+    def _set_target_scale(self, target):
+        """Ganti target scale dan daftarkan tween bila perlu"""
+        if target == self.target_scale == self.scale:
+            return
+        self.target_scale = target
+        if self.tweens is not None:
+            self.tweens.approach(self, "scale", target, SCALE_RATE)
     
     def render(self, ctx):
         """Render button dengan Cairo"""
@@ -69,6 +96,13 @@ class Button:
         ctx.scale(self.scale, self.scale)
         ctx.translate(-center_x, -center_y)
         
+        self.draw_shape(ctx)
+        
+        # Restore context
+        ctx.restore()
+    
+    def draw_shape(self, ctx):
+        """Gambar tombol di posisi x, y tanpa transform animasi"""
         # Draw rounded rectangle with gradient
         radius = 20
         
@@ -124,9 +158,6 @@ class Button:
         )
         ctx.move_to(text_x, text_y)
         ctx.show_text(self.text)
-        
-        # Restore context
-        ctx.restore()
     
     def _draw_rounded_rect(self, ctx, x, y, width, height, radius):
         """Helper untuk menggambar rounded rectangle"""
@@ -2,12 +2,20 @@
 Draggable Component - Object yang bisa di-drag & drop
 """
 
-import pygame
 import cairo
 import math
+from core.tween import DAMPING_RATE
+from core.hittest import shape, piece_matrix
+from core.pointer import POINTER_DOWN, POINTER_MOVE, POINTER_UP
+
+# Laju animasi scale (setara "scale += (target - scale) * 10 * dt")
+SCALE_RATE = 10
+
+# Radius sudut tile (gambar & bentuk hit-test)
+CORNER_RADIUS = 15
 
 class DraggableObject:
-    def __init__(self, x, y, width, height, content, color=(100, 150, 255)):
+    def __init__(self, x, y, width, height, content, color=(100, 150, 255), tweens=None):
         self.x = x
         self.y = y
         self.original_x = x
@@ -19,6 +27,9 @@ class DraggableObject:
         
         # Drag state
         self.dragging = False
+        self.pointer = None  # ID pointer pemilik drag
+        self.pointer_x = 0  # Posisi terakhir pointer pemilik
+        self.pointer_y = 0
         self.offset_x = 0
         self.offset_y = 0
         
@@ -26,57 +37,103 @@ class DraggableObject:
         self.scale = 1.0
         self.target_scale = 1.0
         self.rotation = 0
+        self.tweens = tweens  # TweenEngine opsional dari GameEngine
+        if tweens is not None:
+            # Rotasi saat drag diubah langsung di update(): ikut diinterpolasi saat render
+            tweens.track(self, "rotation")
         
         # Snap target (untuk puzzle)
         self.snap_target = None
         self.snapped = False
+        
+        # Bentuk hit-test (HitShape); None = tile bersudut bulat seukuran objek
+        self.shape = None
+        self._hit_key = None
+        self._hit = None
+        
+        # Callback functions: on_drag_start(obj), on_drop(obj, snapped)
+        self.on_drag_start = None
+        self.on_drop = None
     
-    def handle_event(self, event):
-        """Handle mouse events untuk dragging"""
-        mouse_pos = pygame.mouse.get_pos()
+    def handle_pointer(self, pointer):
+        """Handle pointer events untuk dragging; return True jika berhasil snap
         
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            # Check if click is inside object
-            if self.is_point_inside(mouse_pos[0], mouse_pos[1]):
+        Setiap tile dimiliki paling banyak satu pointer, sehingga beberapa
+        tile bisa di-drag bersamaan oleh jari yang berbeda.
+        """
+        if pointer.kind == POINTER_DOWN:
+            # Check if pointer is inside object
+            if not self.dragging and self.is_point_inside(pointer.x, pointer.y):
                 self.dragging = True
-                self.offset_x = mouse_pos[0] - self.x
-                self.offset_y = mouse_pos[1] - self.y
-                self.target_scale = 1.2
-                
-        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-            if self.dragging:
-                self.dragging = False
-                self.target_scale = 1.0
-                
-                # Check if snapped to target
-                if self.snap_target:
-                    if self._check_snap():
-                        self.snapped = True
-                        self.x = self.snap_target['x']
-                        self.y = self.snap_target['y']
-                        return True  # Berhasil snap
-                    else:
-                        # Kembali ke posisi awal
-                        self.x = self.original_x
-                        self.y = self.original_y
-        
-        elif event.type == pygame.MOUSEMOTION:
-            if self.dragging:
-                self.x = mouse_pos[0] - self.offset_x
-                self.y = mouse_pos[1] - self.offset_y
+                self.pointer = pointer.id
+                self.pointer_x, self.pointer_y = pointer.x, pointer.y
+                self.offset_x = pointer.x - self.x
+                self.offset_y = pointer.y - self.y
+                self._set_target_scale(1.2)
+                if self.tweens is not None:
+                    # Rotasi dikendalikan update() selama drag
+                    self.tweens.cancel(self, "rotation")
+                if self.on_drag_start:
+                    self.on_drag_start(self)
+            return False
+        
+        if not self.dragging or pointer.id != self.pointer:
+            return False
+        self.pointer_x, self.pointer_y = pointer.x, pointer.y
+        
+        if pointer.kind == POINTER_MOVE:
+            self.x, self.y = self.drag_position(pointer)
+        
+        elif pointer.kind == POINTER_UP:
+            self.x, self.y = self.drag_position(pointer)
+            self.dragging = False
+            self.pointer = None
+            self._set_target_scale(1.0)
+            if self.tweens is not None:
+                self.tweens.approach(self, "rotation", 0.0, DAMPING_RATE)
+            
+            # Check if snapped to target
+            if self.snap_target:
+                if self._check_snap():
+                    self.snapped = True
+                    self.x = self.snap_target['x']
+                    self.y = self.snap_target['y']
+                    if self.on_drop:
+                        self.on_drop(self, True)
+                    return True  # Berhasil snap
+                else:
+                    # Kembali ke posisi awal
+                    self.x = self.original_x
+                    self.y = self.original_y
+            
+            if self.on_drop:
+                self.on_drop(self, False)
         
         return False
     
+    def drag_position(self, pointer):
+        """Posisi objek jika di-drag ke posisi pointer ini (tanpa mengubah state)"""
+        return pointer.x - self.offset_x, pointer.y - self.offset_y
+    
     def update(self, dt):
         """Update animations"""
-        # Smooth scale animation
-        self.scale += (self.target_scale - self.scale) * 10 * dt
-        
         # Gentle rotation when dragging
         if self.dragging:
             self.rotation += dt * 2
-        else:
-            self.rotation *= 0.9
+        
+        # Tanpa tween engine: animasi manual (independen dari frame rate)
+        if self.tweens is None:
+            self.scale = self.target_scale + (self.scale - self.target_scale) * math.exp(-SCALE_RATE * dt)
+            if not self.dragging:
+                self.rotation *= math.exp(-DAMPING_RATE * dt)
+    
+    def _set_target_scale(self, target):
+        """Ganti target scale dan daftarkan tween bila perlu"""
+        if target == self.target_scale == self.scale:
+            return
+        self.target_scale = target
+        if self.tweens is not None:
+            self.tweens.approach(self, "scale", target, SCALE_RATE)
     
     def render(self, ctx):
         """Render draggable object"""
@@ -92,16 +149,22 @@ class DraggableObject:
         ctx.scale(self.scale, self.scale)
         ctx.translate(-center_x, -center_y)
         
+        self.draw_shape(ctx)
+        
+        ctx.restore()
+    
+    def draw_shape(self, ctx):
+        """Gambar tile di posisi x, y tanpa transform animasi"""
         # Draw shadow if dragging
         if self.dragging:
-            radius = 15
+            radius = CORNER_RADIUS
             self._draw_rounded_rect(ctx, self.x + 5, self.y + 5, 
                                    self.width, self.height, radius)
             ctx.set_source_rgba(0, 0, 0, 0.3)
             ctx.fill()
         
         # Draw main shape (rounded rectangle)
-        radius = 15
+        radius = CORNER_RADIUS
         self._draw_rounded_rect(ctx, self.x, self.y, self.width, self.height, radius)
         
         # Gradient fill
@@ -141,20 +204,60 @@ class DraggableObject:
         ctx.set_source_rgb(1, 1, 1)
         ctx.move_to(text_x, text_y)
         ctx.show_text(text)
+    
+    def hit_shape(self):
+        """Bentuk hit-test (dibagi semua tile berukuran sama)"""
+        if self.shape is not None:
+            return self.shape
+        width, height = self.width, self.height
+        return shape(
+            ("tile", width, height),
+            lambda ctx: self._draw_rounded_rect(ctx, 0, 0, width, height, CORNER_RADIUS),
+            width, height,
+        )
+    
+    def _hit_transform(self):
+        """(matrix, invers, bounding box) untuk posisi/rotasi/skala sekarang
         
-        ctx.restore()
+        Dihitung ulang hanya jika transform berubah; tile yang diam
+        memakai hasil cache.
+        """
+        hit_shape = self.hit_shape()
+        key = (self.x, self.y, self.width, self.height, self.rotation, self.scale, hit_shape)
+        if key != self._hit_key:
+            matrix = piece_matrix(hit_shape, self.x, self.y, self.width, self.height,
+                                  self.rotation, self.scale)
+            inverse = cairo.Matrix(matrix.xx, matrix.yx, matrix.xy, matrix.yy, matrix.x0, matrix.y0)
+            inverse.invert()
+            self._hit = (matrix, inverse, hit_shape.bounds(matrix))
+            self._hit_key = key
+        return self._hit
     
     def is_point_inside(self, px, py):
-        """Check if point is inside object"""
-        return (self.x <= px <= self.x + self.width and
-                self.y <= py <= self.y + self.height)
+        """Check if point is inside object (bentuk sebenarnya, termasuk rotasi & skala)"""
+        matrix, inverse, (x1, y1, x2, y2) = self._hit_transform()
+        if not (x1 <= px <= x2 and y1 <= py <= y2):
+            return False
+        return self.hit_shape().contains(*inverse.transform_point(px, py))
+    
+    def overlap(self, x, y, width, height):
+        """Bagian luas bentuk (0..1) yang berada di persegi (x, y, width, height)"""
+        matrix, _, (x1, y1, x2, y2) = self._hit_transform()
+        if x2 < x or x1 > x + width or y2 < y or y1 > y + height:
+            return 0.0
+        return self.hit_shape().overlap(matrix, x, y, width, height)
     
-    def set_snap_target(self, x, y, tolerance=50):
-        """Set target untuk snapping"""
+    def set_snap_target(self, x, y, tolerance=50, overlap=None):
+        """Set target untuk snapping
+        
+        overlap: jika diisi (0..1), snap berdasarkan bagian bentuk yang
+        menutupi kotak target seukuran objek, bukan jarak pojok kiri atas.
+        """
         self.snap_target = {
             'x': x,
             'y': y,
-            'tolerance': tolerance
+            'tolerance': tolerance,
+            'overlap': overlap,
         }
     
     def _check_snap(self):
@@ -162,11 +265,15 @@ class DraggableObject:
         if not self.snap_target:
             return False
         
-        dx = self.x - self.snap_target['x']
-        dy = self.y - self.snap_target['y']
+        target = self.snap_target
+        if target.get('overlap') is not None:
+            return self.overlap(target['x'], target['y'], self.width, self.height) >= target['overlap']
+        
+        dx = self.x - target['x']
+        dy = self.y - target['y']
         distance = math.sqrt(dx*dx + dy*dy)
         
-        return distance < self.snap_target['tolerance']
+        return distance < target['tolerance']
     
     def _draw_rounded_rect(self, ctx, x, y, width, height, radius):
         """Helper untuk menggambar rounded rectangle"""
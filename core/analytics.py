@@ -0,0 +1,225 @@
+"""
+Analytics - Pencatat event pembelajaran berbiaya rendah
+
+Event dari hot path (drag, drop, snap, ronde selesai) ditulis ke ring buffer
+numpy yang sudah dialokasikan di awal. Thread latar belakang mengosongkan
+buffer secara batch ke file log berformat kolom (columnar).
+"""
+
+import os
+import struct
+import threading
+import time
+import numpy as np
+
+# Tipe event
+EVENT_DRAG_START = 1
+EVENT_DROP = 2
+EVENT_SNAP_OK = 3
+EVENT_SNAP_FAIL = 4
+EVENT_TIME_TO_SOLVE = 5
+EVENT_ROUND_COMPLETE = 6
+
+EVENT_NAMES = {
+    EVENT_DRAG_START: "drag_start",
+    EVENT_DROP: "drop",
+    EVENT_SNAP_OK: "snap_ok",
+    EVENT_SNAP_FAIL: "snap_fail",
+    EVENT_TIME_TO_SOLVE: "time_to_solve",
+    EVENT_ROUND_COMPLETE: "round_complete",
+}
+
+# Sumber event (scene)
+SOURCE_ANGKA = 1
+SOURCE_HURUF = 2
+SOURCE_HITUNG = 3
+
+SOURCE_NAMES = {
+    SOURCE_ANGKA: "angka",
+    SOURCE_HURUF: "huruf",
+    SOURCE_HITUNG: "hitung",
+}
+
+# Skema kolom log: urutan di sini = urutan kolom di setiap blok file
+COLUMNS = (
+    ("kind", np.uint8),
+    ("source", np.uint8),
+    ("content", np.int32),
+    ("t", np.float64),
+    ("value", np.float32),
+    ("x", np.float32),
+    ("y", np.float32),
+)
+
+# Header blok: magic, jumlah event, waktu epoch awal sesi
+BLOCK_MAGIC = b"EVB1"
+BLOCK_HEADER = struct.Struct("<4sId")
+
+
+def encode_content(content):
+    """Ubah isi tile (angka atau huruf) menjadi kode integer"""
+    if isinstance(content, str):
+        return ord(content[0]) if content else 0
+    return int(content)
+
+
+def decode_content(code):
+    """Kebalikan dari encode_content"""
+    code = int(code)
+    if code >= 65:
+        return chr(code)
+    return str(code)
+
+
+class EventRecorder:
+    """Ring buffer event + thread flush di latar belakang"""
+
+    def __init__(self, capacity=4096, flush_interval=1.0):
+        # Kapasitas dibulatkan ke pangkat dua supaya indeks cukup di-mask
+        size = 1
+        while size < capacity:
+            size <<= 1
+        self.capacity = size
+        self._mask = size - 1
+        self._half = size // 2
+        self.flush_interval = flush_interval
+
+        # Kolom-kolom ring buffer (dialokasikan sekali)
+        self._columns = {name: np.zeros(size, dtype=dtype) for name, dtype in COLUMNS}
+        self._kind = self._columns["kind"]
+        self._source = self._columns["source"]
+        self._content = self._columns["content"]
+        self._t = self._columns["t"]
+        self._value = self._columns["value"]
+        self._x = self._columns["x"]
+        self._y = self._columns["y"]
+
+        # Penghitung monoton: hanya main thread yang menulis _write,
+        # hanya thread flush yang menulis _read
+        self._write = 0
+        self._read = 0
+        self.dropped = 0
+        self.flushed = 0
+
+        self._epoch = time.time()
+        self._t0 = time.perf_counter()
+
+        self.path = None
+        self._file = None
+        self._thread = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._io_lock = threading.Lock()
+
+    def start(self, path):
+        """Mulai thread flush yang menulis ke file log"""
+        if self._thread:
+            return
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._file = open(path, "ab")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._flush_loop, name="analytics-flush", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Hentikan thread flush dan tulis sisa event"""
+        if not self._thread:
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
+        self.flush()
+        self._file.close()
+        self._file = None
+
+    def record(self, kind, source=0, content=0, value=0.0, x=0.0, y=0.0):
+        """Catat satu event (dipanggil dari hot path, tanpa alokasi objek)"""
+        i = self._write
+        pending = i - self._read
+        if pending >= self.capacity:
+            # Buffer penuh: buang event daripada menahan frame
+            self.dropped += 1
+            return
+        j = i & self._mask
+        self._kind[j] = kind
+        self._source[j] = source
+        self._content[j] = content
+        self._t[j] = time.perf_counter() - self._t0
+        self._value[j] = value
+        self._x[j] = x
+        self._y[j] = y
+        self._write = i + 1
+        if pending == self._half:
+            self._wake.set()
+
+    def pending(self):
+        """Jumlah event yang belum ditulis ke file"""
+        return self._write - self._read
+
+    def flush(self):
+        """Tulis semua event yang tertunda ke file sebagai satu blok"""
+        with self._io_lock:
+            start = self._read
+            end = self._write
+            count = end - start
+            if count == 0 or self._file is None:
+                return 0
+
+            lo = start & self._mask
+            hi = lo + count
+            parts = [BLOCK_HEADER.pack(BLOCK_MAGIC, count, self._epoch)]
+            for name, _ in COLUMNS:
+                column = self._columns[name]
+                if hi <= self.capacity:
+                    parts.append(column[lo:hi].tobytes())
+                else:
+                    # Data melingkar ke awal buffer
+                    parts.append(column[lo:].tobytes())
+                    parts.append(column[:hi - self.capacity].tobytes())
+
+            # Slot boleh dipakai ulang setelah datanya tersalin
+            self._read = end
+            self._file.write(b"".join(parts))
+            self._file.flush()
+            self.flushed += count
+            return count
+
+    def _flush_loop(self):
+        """Loop thread latar belakang"""
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+
+def read_log(path):
+    """Baca seluruh file log menjadi dict kolom numpy"""
+    with open(path, "rb") as f:
+        data = f.read()
+
+    chunks = {name: [] for name, _ in COLUMNS}
+    epochs = []
+    offset = 0
+    while offset + BLOCK_HEADER.size <= len(data):
+        magic, count, epoch = BLOCK_HEADER.unpack_from(data, offset)
+        if magic != BLOCK_MAGIC:
+            raise ValueError(f"Log rusak pada offset {offset}")
+        offset += BLOCK_HEADER.size
+        for name, dtype in COLUMNS:
+            nbytes = count * np.dtype(dtype).itemsize
+            chunks[name].append(np.frombuffer(data, dtype=dtype, count=count, offset=offset))
+            offset += nbytes
+        epochs.append(np.full(count, epoch))
+
+    columns = {}
+    for name, dtype in COLUMNS:
+        if chunks[name]:
+            columns[name] = np.concatenate(chunks[name])
+        else:
+            columns[name] = np.zeros(0, dtype=dtype)
+    columns["epoch"] = np.concatenate(epochs) if epochs else np.zeros(0)
+    return columns
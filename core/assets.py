@@ -0,0 +1,405 @@
+"""
+Asset Library - Gambar vektor (apel, bintang, hewan, bentuk) untuk level
+
+Setiap asset direkam sekali ke cairo.RecordingSurface. Saat digambar,
+rekaman dirasterisasi pada level skala terkuantisasi (langkah sqrt(2),
+mirip mipmap) lalu di-cache; cache dibatasi jumlah byte dan membuang
+raster yang paling lama tidak dipakai. Menggambar asset per frame hanya
+berupa satu set_source_surface + paint.
+"""
+
+import math
+from collections import OrderedDict
+import cairo
+from core import hittest
+
+# Ukuran desain semua asset (koordinat saat merekam)
+ASSET_SIZE = 100
+
+# Level raster: 2^(k/2) -> ..., 0.5, 0.71, 1, 1.41, 2, ...
+LEVELS_PER_OCTAVE = 2
+
+# Batas memori raster cache (byte)
+CACHE_BUDGET = 32 * 1024 * 1024
+
+
+def raster_level(scale):
+    """Level skala terkecil >= scale"""
+    k = math.ceil(math.log2(max(scale, 1e-3)) * LEVELS_PER_OCTAVE - 1e-9)
+    return 2.0 ** (k / LEVELS_PER_OCTAVE)
+
+
+def _path_apel(ctx):
+    # Badan apel: dua lengkung yang bertemu di lekukan atas
+    ctx.move_to(50, 28)
+    ctx.curve_to(30, 12, 6, 24, 10, 52)
+    ctx.curve_to(14, 80, 34, 96, 50, 88)
+    ctx.curve_to(66, 96, 86, 80, 90, 52)
+    ctx.curve_to(94, 24, 70, 12, 50, 28)
+    ctx.close_path()
+
+
+def _path_daun(ctx):
+    ctx.move_to(54, 16)
+    ctx.curve_to(62, 4, 78, 6, 82, 12)
+    ctx.curve_to(74, 20, 62, 22, 54, 16)
+
+
+def _draw_apel(ctx):
+    _path_apel(ctx)
+    gradient = cairo.RadialGradient(38, 40, 4, 50, 55, 50)
+    gradient.add_color_stop_rgb(0, 1, 0.45, 0.4)
+    gradient.add_color_stop_rgb(1, 0.8, 0.1, 0.1)
+    ctx.set_source(gradient)
+    ctx.fill_preserve()
+    ctx.set_source_rgb(0.5, 0.05, 0.05)
+    ctx.set_line_width(2)
+    ctx.stroke()
+
+    # Tangkai & daun
+    ctx.move_to(50, 30)
+    ctx.curve_to(50, 20, 52, 12, 56, 6)
+    ctx.set_source_rgb(0.4, 0.25, 0.1)
+    ctx.set_line_width(4)
+    ctx.stroke()
+    _path_daun(ctx)
+    ctx.set_source_rgb(0.3, 0.7, 0.2)
+    ctx.fill()
+
+
+def _path_bintang(ctx):
+    ctx.move_to(50, 4)
+    for i in range(1, 10):
+        angle = -math.pi / 2 + i * math.pi / 5
+        radius = 46 if i % 2 == 0 else 19
+        ctx.line_to(50 + radius * math.cos(angle), 54 + radius * math.sin(angle))
+    ctx.close_path()
+
+
+def _draw_bintang(ctx):
+    _path_bintang(ctx)
+    gradient = cairo.LinearGradient(0, 4, 0, 96)
+    gradient.add_color_stop_rgb(0, 1, 0.9, 0.3)
+    gradient.add_color_stop_rgb(1, 1, 0.65, 0)
+    ctx.set_source(gradient)
+    ctx.fill_preserve()
+    ctx.set_source_rgb(0.8, 0.45, 0)
+    ctx.set_line_width(3)
+    ctx.set_line_join(cairo.LINE_JOIN_ROUND)
+    ctx.stroke()
+
+
+def _path_ekor(ctx):
+    ctx.move_to(70, 50)
+    ctx.line_to(96, 28)
+    ctx.line_to(96, 72)
+    ctx.close_path()
+
+
+def _path_badan_ikan(ctx):
+    ctx.save()
+    ctx.translate(42, 50)
+    ctx.scale(38, 24)
+    ctx.new_sub_path()
+    ctx.arc(0, 0, 1, 0, 2 * math.pi)
+    ctx.restore()
+
+
+def _draw_ikan(ctx):
+    # Ekor
+    _path_ekor(ctx)
+    ctx.set_source_rgb(1, 0.55, 0.1)
+    ctx.fill()
+    # Badan
+    _path_badan_ikan(ctx)
+    ctx.set_source_rgb(1, 0.65, 0.2)
+    ctx.fill_preserve()
+    ctx.set_source_rgb(0.75, 0.35, 0)
+    ctx.set_line_width(2.5)
+    ctx.stroke()
+    # Mata
+    ctx.arc(22, 45, 5, 0, 2 * math.pi)
+    ctx.set_source_rgb(1, 1, 1)
+    ctx.fill()
+    ctx.arc(21, 45, 2.5, 0, 2 * math.pi)
+    ctx.set_source_rgb(0, 0, 0)
+    ctx.fill()
+
+
+def _path_telinga(ctx):
+    for side in (-1, 1):
+        ctx.move_to(50 + side * 34, 40)
+        ctx.line_to(50 + side * 38, 6)
+        ctx.line_to(50 + side * 12, 26)
+        ctx.close_path()
+
+
+def _draw_kucing(ctx):
+    # Telinga
+    _path_telinga(ctx)
+    ctx.set_source_rgb(0.95, 0.6, 0.3)
+    ctx.fill()
+    # Kepala
+    ctx.arc(50, 56, 38, 0, 2 * math.pi)
+    ctx.set_source_rgb(0.98, 0.7, 0.4)
+    ctx.fill_preserve()
+    ctx.set_source_rgb(0.7, 0.4, 0.15)
+    ctx.set_line_width(2.5)
+    ctx.stroke()
+    # Mata & hidung
+    for side in (-1, 1):
+        ctx.arc(50 + side * 14, 50, 5, 0, 2 * math.pi)
+        ctx.set_source_rgb(0.1, 0.1, 0.1)
+        ctx.fill()
+    ctx.move_to(45, 64)
+    ctx.line_to(55, 64)
+    ctx.line_to(50, 70)
+    ctx.close_path()
+    ctx.set_source_rgb(0.9, 0.4, 0.5)
+    ctx.fill()
+    # Kumis
+    ctx.set_source_rgb(0.3, 0.2, 0.1)
+    ctx.set_line_width(1.5)
+    for side in (-1, 1):
+        for dy in (-4, 4):
+            ctx.move_to(50 + side * 10, 70)
+            ctx.line_to(50 + side * 36, 68 + dy)
+    ctx.stroke()
+
+
+def _draw_bola(ctx):
+    ctx.arc(50, 50, 44, 0, 2 * math.pi)
+    gradient = cairo.RadialGradient(36, 34, 4, 50, 50, 44)
+    gradient.add_color_stop_rgb(0, 0.6, 0.8, 1)
+    gradient.add_color_stop_rgb(1, 0.1, 0.35, 0.85)
+    ctx.set_source(gradient)
+    ctx.fill_preserve()
+    ctx.set_source_rgb(0.05, 0.2, 0.55)
+    ctx.set_line_width(2.5)
+    ctx.stroke()
+    # Garis melengkung di bola
+    ctx.arc(50, 50, 44, 0, 2 * math.pi)
+    ctx.clip()
+    ctx.set_source_rgb(1, 1, 1)
+    ctx.set_line_width(5)
+    ctx.move_to(6, 50)
+    ctx.curve_to(30, 30, 70, 70, 94, 50)
+    ctx.stroke()
+    ctx.reset_clip()
+
+
+def _draw_lingkaran(ctx):
+    ctx.arc(50, 50, 44, 0, 2 * math.pi)
+    ctx.set_source_rgb(0.95, 0.4, 0.6)
+    ctx.fill_preserve()
+    ctx.set_source_rgb(1, 1, 1)
+    ctx.set_line_width(4)
+    ctx.stroke()
+
+
+def _draw_segitiga(ctx):
+    ctx.move_to(50, 8)
+    ctx.line_to(94, 90)
+    ctx.line_to(6, 90)
+    ctx.close_path()
+    ctx.set_source_rgb(0.3, 0.75, 0.45)
+    ctx.fill_preserve()
+    ctx.set_source_rgb(1, 1, 1)
+    ctx.set_line_width(4)
+    ctx.set_line_join(cairo.LINE_JOIN_ROUND)
+    ctx.stroke()
+
+
+def _draw_persegi(ctx):
+    ctx.rectangle(10, 10, 80, 80)
+    ctx.set_source_rgb(0.4, 0.55, 0.95)
+    ctx.fill_preserve()
+    ctx.set_source_rgb(1, 1, 1)
+    ctx.set_line_width(4)
+    ctx.stroke()
+
+
+# Garis luar tiap asset untuk hit-test (tanpa detail yang tidak diisi, mis. kumis)
+def _outline_apel(ctx):
+    _path_apel(ctx)
+    _path_daun(ctx)
+
+
+def _outline_ikan(ctx):
+    _path_ekor(ctx)
+    _path_badan_ikan(ctx)
+
+
+def _outline_kucing(ctx):
+    _path_telinga(ctx)
+    ctx.new_sub_path()
+    ctx.arc(50, 56, 38, 0, 2 * math.pi)
+
+
+def _outline_lingkaran(ctx):
+    ctx.arc(50, 50, 44, 0, 2 * math.pi)
+
+
+def _outline_segitiga(ctx):
+    ctx.move_to(50, 8)
+    ctx.line_to(94, 90)
+    ctx.line_to(6, 90)
+    ctx.close_path()
+
+
+# name: (fungsi gambar, lebar, tinggi) dalam koordinat desain
+ASSET_DEFS = {
+    "apel": (_draw_apel, ASSET_SIZE, ASSET_SIZE),
+    "bintang": (_draw_bintang, ASSET_SIZE, ASSET_SIZE),
+    "ikan": (_draw_ikan, ASSET_SIZE, ASSET_SIZE),
+    "kucing": (_draw_kucing, ASSET_SIZE, ASSET_SIZE),
+    "bola": (_draw_bola, ASSET_SIZE, ASSET_SIZE),
+    "lingkaran": (_draw_lingkaran, ASSET_SIZE, ASSET_SIZE),
+    "segitiga": (_draw_segitiga, ASSET_SIZE, ASSET_SIZE),
+    "persegi": (_draw_persegi, ASSET_SIZE, ASSET_SIZE),
+}
+
+# name: fungsi path garis luar (asset tanpa entri = persegi seukuran asset)
+ASSET_OUTLINES = {
+    "apel": _outline_apel,
+    "bintang": _path_bintang,
+    "ikan": _outline_ikan,
+    "kucing": _outline_kucing,
+    "bola": _outline_lingkaran,
+    "lingkaran": _outline_lingkaran,
+    "segitiga": _outline_segitiga,
+    "persegi": lambda ctx: ctx.rectangle(10, 10, 80, 80),
+}
+
+
+class AssetLibrary:
+    def __init__(self, budget=CACHE_BUDGET):
+        self.budget = budget
+        self.defs = dict(ASSET_DEFS)
+        self.outlines = dict(ASSET_OUTLINES)
+        self._shapes = {}
+        self._recordings = {}
+        self._rasters = OrderedDict()  # (name, level) -> ImageSurface, urutan LRU
+        self.cache_bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def register(self, name, draw, width=ASSET_SIZE, height=ASSET_SIZE, outline=None):
+        """Tambah/ganti asset; rekaman, raster & bentuk hit-test lama dibuang"""
+        self.defs[name] = (draw, width, height)
+        if outline is not None:
+            self.outlines[name] = outline
+        else:
+            self.outlines.pop(name, None)
+        self._recordings.pop(name, None)
+        self._shapes.pop(name, None)
+        for key in [key for key in self._rasters if key[0] == name]:
+            self._drop(key)
+
+    def size(self, name):
+        _, width, height = self.defs[name]
+        return width, height
+
+    def recording(self, name):
+        """Rekaman vektor asset (dibuat sekali saat pertama dipakai)"""
+        surface = self._recordings.get(name)
+        if surface is None:
+            draw, width, height = self.defs[name]
+            surface = cairo.RecordingSurface(
+                cairo.CONTENT_COLOR_ALPHA, cairo.Rectangle(0, 0, width, height)
+            )
+            ctx = cairo.Context(surface)
+            draw(ctx)
+            self._recordings[name] = surface
+        return surface
+
+    def hit_shape(self, name):
+        """Bentuk hit-test asset (HitShape, dibangun sekali per asset)"""
+        hit_shape = self._shapes.get(name)
+        if hit_shape is None:
+            _, width, height = self.defs[name]
+            outline = self.outlines.get(name) or (lambda ctx: ctx.rectangle(0, 0, width, height))
+            hit_shape = self._shapes[name] = hittest.HitShape(outline, width, height)
+        return hit_shape
+
+    def raster(self, name, scale):
+        """Raster asset pada level >= scale; return (surface, level)"""
+        level = raster_level(scale)
+        key = (name, level)
+        surface = self._rasters.get(key)
+        if surface is not None:
+            self._rasters.move_to_end(key)
+            self.stats["hits"] += 1
+            return surface, level
+
+        self.stats["misses"] += 1
+        _, width, height = self.defs[name]
+        surface = cairo.ImageSurface(
+            cairo.FORMAT_ARGB32,
+            max(1, int(math.ceil(width * level))), max(1, int(math.ceil(height * level)))
+        )
+        ctx = cairo.Context(surface)
+        ctx.scale(level, level)
+        ctx.set_source_surface(self.recording(name), 0, 0)
+        ctx.paint()
+
+        self._rasters[key] = surface
+        self.cache_bytes += surface.get_stride() * surface.get_height()
+        self._evict(keep=key)
+        return surface, level
+
+    def prewarm(self, names, scales):
+        """Generator: buat raster tiap (name, scale) satu per langkah (untuk engine.jobs)"""
+        for name in names:
+            for scale in scales:
+                self.raster(name, scale)
+                yield
+
+    def _drop(self, key):
+        surface = self._rasters.pop(key)
+        self.cache_bytes -= surface.get_stride() * surface.get_height()
+
+    def _evict(self, keep):
+        """Buang raster yang paling lama tidak dipakai sampai di bawah budget"""
+        while self.cache_bytes > self.budget and len(self._rasters) > 1:
+            key = next(iter(self._rasters))
+            if key == keep:
+                break
+            self._drop(key)
+            self.stats["evictions"] += 1
+
+    def paint(self, ctx, name, width=None, height=None, alpha=1.0):
+        """Gambar asset mengisi (0, 0, width, height) pada transform ctx sekarang
+
+        Level raster dipilih dari skala efektif matrix ctx, jadi asset tetap
+        tajam di dalam node scene graph yang di-scale.
+        """
+        asset_width, asset_height = self.size(name)
+        sx = (width or asset_width) / asset_width
+        sy = (height or asset_height) / asset_height
+        m = ctx.get_matrix()
+        device_scale = math.sqrt(abs(m.xx * m.yy - m.xy * m.yx)) * max(sx, sy)
+
+        surface, level = self.raster(name, device_scale)
+        ctx.save()
+        ctx.scale(sx / level, sy / level)
+        ctx.set_source_surface(surface, 0, 0)
+        ctx.rectangle(0, 0, surface.get_width(), surface.get_height())
+        ctx.clip()
+        if alpha < 1.0:
+            ctx.paint_with_alpha(alpha)
+        else:
+            ctx.paint()
+        ctx.restore()
+
+    def draw(self, ctx, name, x, y, scale=1.0, rotation=0.0, alpha=1.0):
+        """Gambar asset di (x, y) = pojok kiri atas; scale & rotasi di sekitar pusat"""
+        width, height = self.size(name)
+        ctx.save()
+        ctx.translate(x + width / 2, y + height / 2)
+        if rotation:
+            ctx.rotate(rotation)
+        if scale != 1.0:
+            ctx.scale(scale, scale)
+        ctx.translate(-width / 2, -height / 2)
+        self.paint(ctx, name, alpha=alpha)
+        ctx.restore()
@@ -0,0 +1,236 @@
+"""
+Sprite Atlas - Raster tile & tombol yang sudah jadi, disimpan di disk
+
+Semua varian tile dan tombol (isi, warna, ukuran, state, skala) dari
+scene yang terdaftar dirasterisasi sekali ke satu file atlas:
+
+    b"ATL1" | u32 panjang header | header JSON (hash + index) | piksel
+
+Piksel tiap sprite disimpan berurutan (ARGB32 premultiplied, stride =
+lebar * 4, rata 64 byte). Saat startup file di-mmap dan setiap sprite
+dibungkus langsung sebagai cairo.ImageSurface / pygame.Surface tanpa
+salinan. Header menyimpan hash isi (kode gambar + daftar varian + versi
+Cairo); jika tidak cocok, atlas dianggap basi dan dibangun ulang.
+"""
+
+import hashlib
+import inspect
+import json
+import mmap
+import os
+import struct
+import sys
+import cairo
+import pygame
+from components.button import Button
+from components.draggable import DraggableObject
+from core.scene_graph import Node, ButtonNode, TileNode
+
+MAGIC = b"ATL1"
+FORMAT_VERSION = 1
+ALIGN = 64
+_HEADER_LEN = struct.Struct("<I")
+
+# Skala raster yang dipakai: normal dan saat membesar (drag/hover, lihat quantize_scale)
+ATLAS_SCALES = (1.0, 1.25)
+
+# Kode yang menentukan isi piksel; berubah = atlas basi
+_DRAW_CODE = (
+    DraggableObject.draw_shape, DraggableObject._draw_rounded_rect,
+    Button.draw_shape, Button._draw_rounded_rect,
+    Node._rasterize, TileNode.draw_content, ButtonNode.draw_content,
+)
+
+
+def _aligned(n):
+    return -(-n // ALIGN) * ALIGN
+
+
+def collect_variants(engine):
+    """Semua varian sprite dari scene terdaftar: [(key, node, state, scale)]
+
+    Daftarnya statis dari Scene.atlas_buttons() dan Scene.atlas_tiles();
+    scene tidak dimasuki (tanpa puzzle, tween, job, atau RNG yang terpakai).
+    """
+    variants = []
+    seen = set()
+    for scene in engine.scenes.values():
+        nodes = [ButtonNode(button) for button in scene.atlas_buttons()]
+        nodes += [TileNode(tile) for tile in scene.atlas_tiles()]
+        for node in nodes:
+            for state in (False, True):
+                node.set_state(state)
+                for scale in ATLAS_SCALES:
+                    key = node.atlas_key(scale)
+                    if key not in seen:
+                        seen.add(key)
+                        variants.append((key, node, state, scale))
+    return variants
+
+
+def _code_bytes(code):
+    """Bytecode + konstanta + nama (rekursif untuk fungsi di dalamnya)"""
+    parts = [code.co_code, " ".join(code.co_names).encode("utf-8")]
+    for const in code.co_consts:
+        parts.append(_code_bytes(const) if inspect.iscode(const) else repr(const).encode("utf-8"))
+    return b"".join(parts)
+
+
+def _code_fingerprint(func):
+    """Sumber fungsi; tanpa sumber (build beku / hanya .pyc) pakai code object-nya"""
+    try:
+        return inspect.getsource(func).encode("utf-8")
+    except (OSError, TypeError):
+        return _code_bytes(func.__code__)
+
+
+def content_hash(keys):
+    """Hash kode gambar + daftar varian + versi atlas/Cairo"""
+    digest = hashlib.sha256()
+    digest.update(f"{FORMAT_VERSION}:{cairo.cairo_version_string()}".encode())
+    for func in _DRAW_CODE:
+        digest.update(_code_fingerprint(func))
+    for key in sorted(keys):
+        digest.update(key.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def write_atlas(path, content_hash, sprites):
+    """Tulis atlas dari {key: cairo.ImageSurface}; atomik lewat file sementara"""
+    index = {}
+    offset = 0
+    for key, surface in sprites.items():
+        width, height = surface.get_width(), surface.get_height()
+        index[key] = (offset, width, height)
+        offset += _aligned(width * 4 * height)
+
+    header = json.dumps({
+        "version": FORMAT_VERSION,
+        "hash": content_hash,
+        "index": index,
+    }).encode("utf-8")
+    start = _aligned(len(MAGIC) + _HEADER_LEN.size + len(header))
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(_HEADER_LEN.pack(len(header)))
+        f.write(header)
+        f.write(b"\0" * (start - f.tell()))
+        for surface in sprites.values():
+            surface.flush()
+            width, height = surface.get_width(), surface.get_height()
+            stride = surface.get_stride()
+            data = surface.get_data()
+            row = width * 4
+            if stride == row:
+                f.write(data[:row * height])
+            else:
+                for y in range(height):
+                    f.write(data[y * stride:y * stride + row])
+            f.write(b"\0" * (_aligned(row * height) - row * height))
+    os.replace(tmp, path)
+
+
+def build_atlas(path, variants):
+    """Rasterisasi semua varian lewat Node._rasterize (hasil identik dengan raster live)"""
+    sprites = {}
+    for key, node, state, scale in variants:
+        node.set_state(state)
+        sprites[key] = node._rasterize(scale)
+    write_atlas(path, content_hash(sprites), sprites)
+    return len(sprites)
+
+
+def ensure_atlas(engine, path, rebuild=False, background=False):
+    """Muat atlas untuk scene engine; bangun ulang jika belum ada atau basi
+
+    background=True: pembangunan dikirim ke engine.jobs (thread pool);
+    sampai selesai atlas masih kosong dan node memakai raster live.
+    """
+    variants = collect_variants(engine)
+    atlas = SpriteAtlas(path, content_hash(key for key, _, _, _ in variants))
+    if not rebuild and atlas.load():
+        return atlas
+    if background:
+        engine.jobs.submit_io(build_atlas, path, variants, name="atlas.build",
+                              on_done=lambda count: atlas.load())
+    else:
+        build_atlas(path, variants)
+        atlas.load()
+    return atlas
+
+
+class SpriteAtlas:
+    def __init__(self, path, content_hash):
+        self.path = path
+        self.hash = content_hash
+        self.index = {}
+        self._view = None
+        self._data_start = 0
+        self._surfaces = {}
+        self._images = {}
+        self.hits = 0
+        self.misses = 0
+
+    def load(self):
+        """mmap file atlas; return False jika tidak ada atau hash-nya basi"""
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                return False
+            (length,) = _HEADER_LEN.unpack(f.read(_HEADER_LEN.size))
+            header = json.loads(f.read(length).decode("utf-8"))
+            if header.get("version") != FORMAT_VERSION or header.get("hash") != self.hash:
+                return False
+            # ACCESS_COPY: buffer bisa ditulis (syarat create_for_data) tanpa mengubah file
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        self._data_start = _aligned(len(MAGIC) + _HEADER_LEN.size + length)
+        self._view = memoryview(mapped)
+        self.index = header["index"]
+        self._surfaces = {}
+        self._images = {}
+        return True
+
+    @property
+    def loaded(self):
+        return self._view is not None
+
+    def __len__(self):
+        return len(self.index)
+
+    def _pixels(self, key):
+        offset, width, height = self.index[key]
+        start = self._data_start + offset
+        return self._view[start:start + width * 4 * height], width, height
+
+    def surface(self, key):
+        """cairo.ImageSurface langsung di atas mmap (None jika tidak ada)"""
+        surface = self._surfaces.get(key)
+        if surface is None:
+            if key not in self.index:
+                self.misses += 1
+                return None
+            pixels, width, height = self._pixels(key)
+            surface = cairo.ImageSurface.create_for_data(
+                pixels, cairo.FORMAT_ARGB32, width, height, width * 4
+            )
+            self._surfaces[key] = surface
+        self.hits += 1
+        return surface
+
+    def image(self, key):
+        """pygame.Surface (premultiplied) langsung di atas mmap (None jika tidak ada)"""
+        image = self._images.get(key)
+        if image is None:
+            if key not in self.index:
+                self.misses += 1
+                return None
+            pixels, width, height = self._pixels(key)
+            fmt = "BGRA" if sys.byteorder == "little" else "ARGB"
+            image = pygame.image.frombuffer(pixels, (width, height), fmt)
+            self._images[key] = image
+        self.hits += 1
+        return image
@@ -0,0 +1,205 @@
+"""
+Frame Capture - Rekam sesi bermain tanpa mengganggu game loop
+
+Setiap frame yang ditampilkan disalin ke salah satu slot di ring shared
+memory. Proses encoder terpisah mengambil slot yang terisi, menulisnya
+sebagai deretan PNG atau stream video mentah (BGRA), lalu mengembalikan
+slot ke antrean kosong. Jika encoder tertinggal dan tidak ada slot
+kosong, frame dibuang (dan dihitung) alih-alih menahan game loop.
+
+Stream tetap berisi satu frame per iterasi game loop: frame yang tidak
+dirender (scene diam) atau dibuang dikirim sebagai penanda ulang, dan
+encoder menulis ulang frame terakhir, sehingga -framerate sama dengan FPS
+game memberi waktu yang benar.
+"""
+
+import os
+import queue
+import shutil
+import time
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
+
+FORMAT_PNG = "png"
+FORMAT_RAW = "raw"
+FORMATS = (FORMAT_PNG, FORMAT_RAW)
+
+RAW_FILENAME = "capture.bgra"
+TIMESTAMP_FILENAME = "frames.txt"
+
+
+def _encoder_main(shm_name, slots, width, height, directory, fmt, filled, free):
+    """Proses encoder: kuras ring sampai menerima sentinel None"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    frame_size = width * height * 4
+    frames = np.ndarray((slots, frame_size), dtype=np.uint8, buffer=shm.buf)
+
+    raw = open(os.path.join(directory, RAW_FILENAME), "wb") if fmt == FORMAT_RAW else None
+    if fmt == FORMAT_PNG:
+        import pygame
+
+    # Slot frame terakhir ditahan (tidak dikembalikan) untuk penanda ulang
+    last_slot = None
+    last_png = None
+    try:
+        with open(os.path.join(directory, TIMESTAMP_FILENAME), "w") as stamps:
+            while True:
+                item = filled.get()
+                if item is None:
+                    break
+                slot, index, timestamp = item
+                repeat = slot is None
+                if repeat:
+                    if last_slot is None:
+                        continue  # Belum ada frame untuk diulang
+                    slot = last_slot
+                if raw is not None:
+                    raw.write(frames[slot].data)
+                else:
+                    path = os.path.join(directory, f"frame_{index:06d}.png")
+                    if repeat:
+                        _copy_png(last_png, path)
+                    else:
+                        image = pygame.image.frombuffer(frames[slot].tobytes(), (width, height), "BGRA")
+                        pygame.image.save(image, path)
+                    last_png = path
+                stamps.write(f"{index} {timestamp:.6f}{' ulang' if repeat else ''}\n")
+                if not repeat:
+                    if last_slot is not None:
+                        free.put(last_slot)
+                    last_slot = slot
+    finally:
+        if raw is not None:
+            raw.close()
+        del frames
+        shm.close()
+
+
+def _copy_png(source, path):
+    """Frame ulang: hard link ke PNG sebelumnya (salin jika filesystem tidak mendukung)"""
+    try:
+        os.link(source, path)
+    except OSError:
+        shutil.copyfile(source, path)
+
+
+class FrameCapture:
+    def __init__(self, width, height, slots=8):
+        self.width = width
+        self.height = height
+        self.slots = slots
+        self.frame_size = width * height * 4
+
+        self._shm = None
+        self._frames = None
+        self._process = None
+        self._filled = None
+        self._free = None
+        self._epoch = 0.0
+        self.directory = None
+
+        # Statistik back-pressure
+        self.submitted = 0
+        self.captured = 0
+        self.dropped = 0
+        self.repeated = 0
+        self.max_in_flight = 0
+        self._copy_time = 0.0
+
+    @property
+    def active(self):
+        return self._process is not None
+
+    def start(self, directory, fmt=FORMAT_PNG):
+        """Siapkan ring shared memory dan jalankan proses encoder"""
+        if fmt not in FORMATS:
+            raise ValueError(f"Format capture tidak dikenal: {fmt} (pilihan: {', '.join(FORMATS)})")
+        if self.active:
+            return
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+
+        self._shm = shared_memory.SharedMemory(create=True, size=self.slots * self.frame_size)
+        self._frames = np.ndarray((self.slots, self.frame_size), dtype=np.uint8, buffer=self._shm.buf)
+
+        # spawn: proses encoder tidak mewarisi state display/audio pygame
+        context = multiprocessing.get_context("spawn")
+        self._filled = context.Queue()
+        self._free = context.Queue()
+        for slot in range(self.slots):
+            self._free.put(slot)
+
+        self._process = context.Process(
+            target=_encoder_main,
+            args=(self._shm.name, self.slots, self.width, self.height,
+                  directory, fmt, self._filled, self._free),
+            name="capture-encoder", daemon=True
+        )
+        self._process.start()
+        self._epoch = time.perf_counter()
+
+    def submit(self, data):
+        """Salin satu frame (buffer BGRA) ke slot kosong; buang jika ring penuh"""
+        if not self.active:
+            return False
+        index = self.submitted
+        self.submitted += 1
+        try:
+            slot = self._free.get_nowait()
+        except queue.Empty:
+            # Frame dibuang; encoder mengulang frame terakhir agar waktu stream tetap benar
+            self.dropped += 1
+            self._filled.put((None, index, time.perf_counter() - self._epoch))
+            return False
+
+        start = time.perf_counter()
+        self._frames[slot] = np.frombuffer(data, dtype=np.uint8, count=self.frame_size)
+        self._filled.put((slot, index, start - self._epoch))
+        self._copy_time += time.perf_counter() - start
+        self.captured += 1
+
+        # Slot yang belum dikembalikan encoder = kedalaman antrean encode
+        try:
+            in_flight = self.slots - self._free.qsize()
+        except NotImplementedError:  # macOS tidak punya qsize()
+            in_flight = 0
+        if in_flight > self.max_in_flight:
+            self.max_in_flight = in_flight
+        return True
+
+    def repeat(self):
+        """Frame tidak dirender (scene diam): encoder mengulang frame terakhir"""
+        if not self.active:
+            return
+        index = self.submitted
+        self.submitted += 1
+        self.repeated += 1
+        self._filled.put((None, index, time.perf_counter() - self._epoch))
+
+    def stop(self):
+        """Tunggu encoder menulis semua frame yang tersisa lalu bersihkan ring"""
+        if not self.active:
+            return
+        self._filled.put(None)
+        self._process.join()
+        self._process = None
+
+        self._frames = None
+        self._shm.close()
+        self._shm.unlink()
+        self._shm = None
+        self._filled = None
+        self._free = None
+
+    def stats(self):
+        """Statistik capture: frame masuk, terekam, dibuang, dan biaya salin"""
+        return {
+            "submitted": self.submitted,
+            "captured": self.captured,
+            "dropped": self.dropped,
+            "repeated": self.repeated,
+            "drop_rate": self.dropped / (self.submitted - self.repeated) if self.captured + self.dropped else 0.0,
+            "max_in_flight": self.max_in_flight,
+            "copy_ms": self._copy_time / self.captured * 1000 if self.captured else 0.0,
+        }
@@ -0,0 +1,91 @@
+"""
+Hit Test - Uji sentuh tepat untuk bentuk yang diputar/di-scale
+
+Setiap bentuk (tile bersudut bulat, apel, bintang, ...) dibangun sekali
+sebagai path Cairo (copy_path) dalam koordinat desainnya sendiri, lalu
+dibagi oleh semua benda dengan bentuk yang sama. Benda menyimpan matrix
+transform-nya (dan inversnya) selama posisi/rotasi/skala tidak berubah.
+
+Uji titik: bounding box di layar dulu (murah, menolak hampir semua
+benda), baru titik dibawa ke koordinat bentuk lewat matrix invers dan
+diuji dengan in_fill. Overlap dengan sebuah persegi (untuk snap) dihitung
+dari titik-titik sampel di dalam bentuk yang juga dibuat sekali.
+"""
+
+import cairo
+
+# Titik sampel overlap per sisi (grid SAMPLE_GRID x SAMPLE_GRID di bounding box bentuk)
+SAMPLE_GRID = 10
+
+
+class HitShape:
+    """Path bentuk + extents + titik sampel, dalam koordinat desain"""
+
+    def __init__(self, outline, width, height):
+        self.width = width
+        self.height = height
+        # Context kecil milik bentuk ini: path-nya tetap terpasang untuk in_fill
+        self._ctx = cairo.Context(cairo.ImageSurface(cairo.FORMAT_A8, 1, 1))
+        outline(self._ctx)
+        self.path = self._ctx.copy_path()
+        self.extents = self._ctx.fill_extents()
+
+        x1, y1, x2, y2 = self.extents
+        step_x = (x2 - x1) / SAMPLE_GRID
+        step_y = (y2 - y1) / SAMPLE_GRID
+        points = [(x1 + (i + 0.5) * step_x, y1 + (j + 0.5) * step_y)
+                  for j in range(SAMPLE_GRID) for i in range(SAMPLE_GRID)]
+        self.samples = [p for p in points if self._ctx.in_fill(*p)]
+
+    def contains(self, x, y):
+        """Titik (koordinat desain) di dalam bentuk?"""
+        x1, y1, x2, y2 = self.extents
+        if not (x1 <= x <= x2 and y1 <= y <= y2):
+            return False
+        return self._ctx.in_fill(x, y)
+
+    def bounds(self, matrix):
+        """Bounding box (x1, y1, x2, y2) bentuk di layar untuk matrix ini"""
+        x1, y1, x2, y2 = self.extents
+        corners = [matrix.transform_point(x, y) for x, y in ((x1, y1), (x2, y1), (x2, y2), (x1, y2))]
+        xs = [p[0] for p in corners]
+        ys = [p[1] for p in corners]
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def overlap(self, matrix, x, y, width, height):
+        """Bagian luas bentuk (0..1) yang jatuh di persegi (x, y, width, height) di layar"""
+        if not self.samples:
+            return 0.0
+        inside = 0
+        for sx, sy in self.samples:
+            px, py = matrix.transform_point(sx, sy)
+            if x <= px <= x + width and y <= py <= y + height:
+                inside += 1
+        return inside / len(self.samples)
+
+
+_shapes = {}
+
+
+def shape(key, outline, width, height):
+    """HitShape bersama untuk key (dibangun sekali)"""
+    hit_shape = _shapes.get(key)
+    if hit_shape is None:
+        hit_shape = _shapes[key] = HitShape(outline, width, height)
+    return hit_shape
+
+
+def piece_matrix(hit_shape, x, y, width, height, rotation, scale):
+    """Matrix koordinat bentuk -> layar, sama dengan transform saat render
+
+    Bentuk mengisi (x, y, width, height); rotasi & skala di sekitar pusat.
+    """
+    matrix = cairo.Matrix()
+    matrix.translate(x + width / 2, y + height / 2)
+    if rotation:
+        matrix.rotate(rotation)
+    if scale != 1.0:
+        matrix.scale(scale, scale)
+    matrix.translate(-width / 2, -height / 2)
+    matrix.scale(width / hit_shape.width, height / hit_shape.height)
+    return matrix
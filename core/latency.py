@@ -0,0 +1,48 @@
+"""
+Latency Monitor - Ukur latensi input-ke-layar untuk drag
+
+Untuk setiap frame yang ditampilkan, dicatat umur event pointer terbaru
+yang sudah diterapkan ke frame itu: waktu present dikurangi waktu event
+diambil dari antrean SDL. Waktu antre di SDL dan scanout monitor tidak
+terlihat dari sini, jadi angka ini adalah batas bawah latensi sebenarnya,
+tetapi cukup untuk membandingkan mode latensi aktif/nonaktif.
+
+Mode latensi (late_latch) membaca ulang gerakan pointer tepat sebelum
+render; predict_ms > 0 menambahkan prediksi posisi dari kecepatan terakhir.
+"""
+
+import time
+from collections import deque
+import numpy as np
+
+
+class LatencyMonitor:
+    def __init__(self, late_latch=False, predict_ms=0.0, samples=1000):
+        self.late_latch = late_latch
+        self.predict_ms = predict_ms
+        self._latest = None
+        self._latencies = deque(maxlen=samples)
+
+    def note_input(self, pointer):
+        """Event pointer ini sudah diterapkan ke state yang akan dirender"""
+        if self._latest is None or pointer.time > self._latest:
+            self._latest = pointer.time
+
+    def presented(self):
+        """Frame baru saja ditampilkan; catat umur input terbarunya"""
+        if self._latest is None:
+            return
+        self._latencies.append(time.perf_counter() - self._latest)
+        self._latest = None
+
+    def stats(self):
+        """Statistik latensi event-ke-present dalam milidetik"""
+        if not self._latencies:
+            return None
+        latencies = np.array(self._latencies) * 1000
+        return {
+            "count": len(latencies),
+            "mean": float(latencies.mean()),
+            "p95": float(np.percentile(latencies, 95)),
+            "max": float(latencies.max()),
+        }
@@ -0,0 +1,115 @@
+"""
+Memory Profiler - Deteksi kebocoran memori per scene
+
+Setiap kali sebuah scene dimasuki (atau ronde baru dimulai di dalam scene),
+diambil snapshot tracemalloc dan hitungan objek hidup per tipe. Snapshot
+dibandingkan dengan kunjungan sebelumnya ke checkpoint yang sama: alokasi yang terus bertambah antar kunjungan adalah
+kandidat kebocoran (objek lama yang masih direferensikan callback, cache
+yang tidak pernah dibuang, dst).
+"""
+
+import gc
+import tracemalloc
+from collections import Counter, deque
+
+# Alokasi milik mesin profiler sendiri tidak ikut dihitung
+_IGNORE = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def object_counts():
+    """Jumlah objek hidup (yang dilacak gc) per nama tipe"""
+    gc.collect()
+    return Counter(type(obj).__name__ for obj in gc.get_objects())
+
+
+def count_diff(before, after, top=10):
+    """Tipe dengan pertambahan objek terbanyak: [(nama, selisih, total)]"""
+    growth = [
+        (name, count - before.get(name, 0), count)
+        for name, count in after.items()
+        if count > before.get(name, 0)
+    ]
+    growth.sort(key=lambda item: item[1], reverse=True)
+    return growth[:top]
+
+
+# Jumlah report terakhir yang disimpan (sesi panjang tidak menumpuk report)
+MAX_REPORTS = 100
+
+
+class MemoryProfiler:
+    def __init__(self, top=10, nframes=1, max_reports=MAX_REPORTS):
+        self.top = top
+        self.nframes = nframes
+        self._active = False
+        self._started_tracing = False
+        self._previous = {}   # scene -> (snapshot, object_counts)
+        self.visits = Counter()
+        self.reports = deque(maxlen=max_reports)
+        self._latest = {}     # scene -> report terakhir (untuk summary)
+
+    @property
+    def active(self):
+        return self._active
+
+    def start(self):
+        """Mulai tracemalloc (nframes > 1 = traceback lebih dalam, lebih lambat)"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.nframes)
+            self._started_tracing = True
+        self._active = True
+
+    def stop(self):
+        self._active = False
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self._previous.clear()
+
+    def checkpoint(self, scene):
+        """Snapshot saat scene dimasuki; bandingkan dengan kunjungan sebelumnya"""
+        counts = object_counts()
+        snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORE)
+        self.visits[scene] += 1
+
+        previous = self._previous.get(scene)
+        self._previous[scene] = (snapshot, counts)
+        if previous is None:
+            return None
+
+        old_snapshot, old_counts = previous
+        stats = snapshot.compare_to(old_snapshot, "lineno")
+        report = {
+            "scene": scene,
+            "visit": self.visits[scene],
+            "traced": tracemalloc.get_traced_memory()[0],
+            "size_diff": sum(stat.size_diff for stat in stats),
+            "top_lines": [stat for stat in stats if stat.size_diff > 0][:self.top],
+            "top_types": count_diff(old_counts, counts, self.top),
+        }
+        self.reports.append(report)
+        self._latest[scene] = report
+        return report
+
+    def format_report(self, report):
+        """Teks ringkas satu report untuk dicetak ke konsol"""
+        lines = [
+            f"[memori] {report['scene']} kunjungan #{report['visit']}: "
+            f"{report['size_diff'] / 1024:+.1f} KiB sejak kunjungan sebelumnya "
+            f"(total {report['traced'] / 1024:.0f} KiB)"
+        ]
+        for stat in report["top_lines"]:
+            frame = stat.traceback[0]
+            lines.append(f"    {stat.size_diff / 1024:+8.1f} KiB  {frame.filename}:{frame.lineno}")
+        for name, diff, total in report["top_types"]:
+            lines.append(f"    {diff:+8d} obj   {name} (total {total})")
+        return "\n".join(lines)
+
+    def summary(self):
+        """Report terakhir per scene"""
+        return "\n".join(self.format_report(report) for report in self._latest.values())
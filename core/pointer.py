@@ -0,0 +1,143 @@
+"""
+Pointer Input - Mouse dan sentuhan sebagai satu jenis event
+
+Event MOUSE* dan FINGER* dari pygame diterjemahkan menjadi PointerEvent
+dengan ID per jari (mouse selalu ID 0), dalam koordinat layar. Objek yang
+menerima POINTER_DOWN bisa "menangkap" pointer tersebut; MOVE/UP berikutnya
+dari pointer itu langsung dikirim ke pemiliknya lewat satu lookup dict,
+sehingga beberapa anak bisa men-drag tile berbeda secara bersamaan.
+"""
+
+import time
+from collections import deque
+import pygame
+
+POINTER_DOWN = 1
+POINTER_MOVE = 2
+POINTER_UP = 3
+
+MOUSE_ID = 0
+
+# Sampel gerakan untuk estimasi kecepatan (prediksi posisi)
+VELOCITY_SAMPLES = 4
+MAX_PREDICTION = 60  # piksel; prediksi lebih jauh cenderung meleset
+STALE_MOTION = 0.05  # detik tanpa gerakan = pointer dianggap diam
+
+
+class PointerEvent:
+    __slots__ = ("kind", "id", "x", "y", "time")
+
+    def __init__(self, kind, pointer_id, x, y, timestamp):
+        self.kind = kind
+        self.id = pointer_id
+        self.x = x
+        self.y = y
+        self.time = timestamp  # perf_counter saat event diambil dari antrean
+
+    def __repr__(self):
+        return f"PointerEvent(kind={self.kind}, id={self.id}, x={self.x:.0f}, y={self.y:.0f})"
+
+
+class PointerTracker:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.positions = {}   # pointer id -> (x, y) untuk pointer yang sedang ditekan
+        self._owners = {}     # pointer id -> objek yang menangkap pointer
+        self._fingers = {}    # (touch_id, finger_id) -> pointer id
+        self._history = {}    # pointer id -> deque[(time, x, y)] selama ditekan
+        self._next_id = MOUSE_ID + 1
+
+    def translate(self, event):
+        """Ubah event pygame menjadi PointerEvent (None jika bukan input pointer)"""
+        etype = event.type
+        if etype in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION):
+            # Event mouse tiruan dari layar sentuh sudah datang sebagai FINGER*
+            if getattr(event, "touch", False):
+                return None
+            if etype == pygame.MOUSEMOTION:
+                kind = POINTER_MOVE
+            elif event.button != 1:
+                return None
+            else:
+                kind = POINTER_DOWN if etype == pygame.MOUSEBUTTONDOWN else POINTER_UP
+            pointer_id = MOUSE_ID
+            x, y = event.pos
+
+        elif etype in (pygame.FINGERDOWN, pygame.FINGERMOTION, pygame.FINGERUP):
+            key = (event.touch_id, event.finger_id)
+            if etype == pygame.FINGERDOWN:
+                kind = POINTER_DOWN
+                pointer_id = self._fingers[key] = self._next_id
+                self._next_id += 1
+            else:
+                kind = POINTER_MOVE if etype == pygame.FINGERMOTION else POINTER_UP
+                pointer_id = self._fingers.get(key)
+                if pointer_id is None:
+                    return None
+                if kind == POINTER_UP:
+                    del self._fingers[key]
+            # Koordinat jari ternormalisasi 0..1
+            x = event.x * self.width
+            y = event.y * self.height
+
+        else:
+            return None
+
+        now = time.perf_counter()
+        if kind == POINTER_UP:
+            self.positions.pop(pointer_id, None)
+            self._history.pop(pointer_id, None)
+        elif kind == POINTER_DOWN or pointer_id in self.positions:
+            self.positions[pointer_id] = (x, y)
+            history = self._history.get(pointer_id)
+            if history is None or kind == POINTER_DOWN:
+                history = self._history[pointer_id] = deque(maxlen=VELOCITY_SAMPLES)
+            history.append((now, x, y))
+        return PointerEvent(kind, pointer_id, x, y, now)
+
+    def predict(self, pointer_id, horizon):
+        """Perkiraan posisi pointer horizon detik ke depan dari kecepatan terakhir"""
+        history = self._history.get(pointer_id)
+        if not history:
+            return None
+        t1, x1, y1 = history[-1]
+        t0, x0, y0 = history[0]
+        since = time.perf_counter() - t1
+        if t1 - t0 < 1e-3 or since > STALE_MOTION:
+            return x1, y1
+        # Kecepatan sampai sampel terakhir, diekstrapolasi ke "sekarang + horizon"
+        ahead = since + horizon
+        dx = (x1 - x0) / (t1 - t0) * ahead
+        dy = (y1 - y0) / (t1 - t0) * ahead
+        distance = (dx * dx + dy * dy) ** 0.5
+        if distance > MAX_PREDICTION:
+            dx *= MAX_PREDICTION / distance
+            dy *= MAX_PREDICTION / distance
+        return x1 + dx, y1 + dy
+
+    def predicted_moves(self, horizon):
+        """POINTER_MOVE prediksi untuk setiap pointer yang sedang ditangkap objek"""
+        moves = []
+        for pointer_id in self._owners:
+            position = self.predict(pointer_id, horizon)
+            if position is not None:
+                moves.append(PointerEvent(
+                    POINTER_MOVE, pointer_id, position[0], position[1],
+                    self._history[pointer_id][-1][0]
+                ))
+        return moves
+
+    def capture(self, pointer_id, owner):
+        """Kirim semua event pointer ini berikutnya ke owner"""
+        self._owners[pointer_id] = owner
+
+    def owner(self, pointer_id):
+        return self._owners.get(pointer_id)
+
+    def release(self, pointer_id):
+        self._owners.pop(pointer_id, None)
+
+    def release_all(self):
+        """Lepas semua tangkapan (misalnya saat pindah scene)"""
+        self._owners.clear()
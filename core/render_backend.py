@@ -0,0 +1,604 @@
+"""
+Render Backend - Abstraksi tujuan render untuk Scene dan komponen
+
+Dua implementasi:
+- CairoBackend: semua digambar dengan satu cairo.Context lalu dikonversi
+  ke pygame setiap frame (perilaku asli).
+- PygameBackend: menggambar langsung ke layar pygame memakai sprite yang
+  di-cache, pygame.transform dan gfxdraw; tanpa konversi buffer per frame.
+
+Scene hanya memakai method di RenderBackend, sehingga backend bisa dipilih
+saat startup (lihat --backend di main.py).
+"""
+
+import math
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+import cairo
+import numpy as np
+import pygame
+import pygame.gfxdraw
+
+from core.scene_graph import ParticleNode, TextNode, ButtonNode, TileNode, quantize_scale
+
+# Ukuran tile (piksel) untuk rasterisasi paralel
+TILE_SIZE = 256
+
+
+class RenderBackend:
+    """Interface yang dipakai Scene.render()"""
+
+    name = None
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+    # --- Frame ---
+
+    def begin_frame(self):
+        """Bersihkan frame"""
+        raise NotImplementedError
+
+    def present(self, screen):
+        """Tampilkan frame ke layar pygame"""
+        raise NotImplementedError
+
+    def frame_bytes(self):
+        """Buffer piksel frame terakhir (untuk capture/pengujian)"""
+        raise NotImplementedError
+
+    # --- Primitive ---
+
+    def fill_gradient(self, top, bottom):
+        """Isi layar dengan gradient vertikal (warna rgb 0..1)"""
+        raise NotImplementedError
+
+    def draw_text(self, text, x, baseline, size, color=(1, 1, 1), alpha=1.0,
+                  shadow=0, scale=1.0, gradient=None):
+        """Teks bold; scale berporos di tengah garis dasar, gradient = 3 warna atas-bawah"""
+        raise NotImplementedError
+
+    def text_width(self, text, size):
+        raise NotImplementedError
+
+    def draw_graph(self, graph):
+        """Gambar scene graph"""
+        raise NotImplementedError
+
+    # --- Gambar offscreen ---
+
+    def snapshot(self):
+        """Salinan frame sekarang sebagai image milik backend ini"""
+        raise NotImplementedError
+
+    def draw_image(self, image, x=0, y=0, alpha=1.0, clip=None, opaque=False):
+        """Tempel image (hasil snapshot/render_offscreen); clip = (x, y, w, h)"""
+        raise NotImplementedError
+
+    def render_offscreen(self, draw, dim=0.0):
+        """Panggil draw(self) ke image offscreen, lalu gelapkan sebesar dim"""
+        raise NotImplementedError
+
+    def push_offset(self, dx, dy):
+        """Geser semua gambar berikutnya (dipakai transisi slide)"""
+        raise NotImplementedError
+
+    def pop_offset(self):
+        raise NotImplementedError
+
+
+class CairoBackend(RenderBackend):
+    name = "cairo"
+
+    def __init__(self, width, height):
+        super().__init__(width, height)
+        self.surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
+        self.ctx = cairo.Context(self.surface)
+        self._gradients = {}
+
+    def begin_frame(self):
+        self.ctx.set_source_rgb(1, 1, 1)
+        self.ctx.paint()
+
+    def present(self, screen):
+        # Convert Cairo surface to Pygame surface
+        self.surface.flush()
+        buf = self.surface.get_data()
+        image = pygame.image.frombuffer(buf, (self.width, self.height), 'ARGB')
+        screen.blit(image, (0, 0))
+        pygame.display.flip()
+
+    def frame_bytes(self):
+        self.surface.flush()
+        return self.surface.get_data()
+
+    def fill_gradient(self, top, bottom):
+        key = (top, bottom)
+        gradient = self._gradients.get(key)
+        if gradient is None:
+            gradient = cairo.LinearGradient(0, 0, 0, self.height)
+            gradient.add_color_stop_rgb(0, *top)
+            gradient.add_color_stop_rgb(1, *bottom)
+            self._gradients[key] = gradient
+        ctx = self.ctx
+        ctx.rectangle(0, 0, self.width, self.height)
+        ctx.set_source(gradient)
+        ctx.fill()
+
+    def draw_text(self, text, x, baseline, size, color=(1, 1, 1), alpha=1.0,
+                  shadow=0, scale=1.0, gradient=None):
+        ctx = self.ctx
+        ctx.save()
+        ctx.select_font_face("Arial", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
+        ctx.set_font_size(size)
+        if scale != 1.0:
+            pivot_x = x + ctx.text_extents(text).width / 2
+            ctx.translate(pivot_x, baseline)
+            ctx.scale(scale, scale)
+            ctx.translate(-pivot_x, -baseline)
+
+        if shadow:
+            ctx.set_source_rgba(0, 0, 0, 0.5)
+            ctx.move_to(x + shadow, baseline + shadow)
+            ctx.show_text(text)
+
+        if gradient:
+            pattern = cairo.LinearGradient(x, baseline - size * 0.7, x, baseline + size * 0.7)
+            for i, stop in enumerate(gradient):
+                pattern.add_color_stop_rgb(i / (len(gradient) - 1), *stop)
+            ctx.set_source(pattern)
+        else:
+            ctx.set_source_rgba(color[0], color[1], color[2], alpha)
+        ctx.move_to(x, baseline)
+        ctx.show_text(text)
+        ctx.restore()
+
+    def text_width(self, text, size):
+        ctx = self.ctx
+        ctx.save()
+        ctx.select_font_face("Arial", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
+        ctx.set_font_size(size)
+        width = ctx.text_extents(text).width
+        ctx.restore()
+        return width
+
+    def draw_graph(self, graph):
+        graph.render(self.ctx)
+
+    def snapshot(self):
+        image = cairo.ImageSurface(cairo.FORMAT_ARGB32, self.width, self.height)
+        ctx = cairo.Context(image)
+        ctx.set_source_surface(self.surface, 0, 0)
+        ctx.set_operator(cairo.OPERATOR_SOURCE)
+        ctx.paint()
+        return image
+
+    def draw_image(self, image, x=0, y=0, alpha=1.0, clip=None, opaque=False):
+        ctx = self.ctx
+        ctx.save()
+        if clip:
+            ctx.rectangle(*clip)
+            ctx.clip()
+        if opaque:
+            ctx.set_operator(cairo.OPERATOR_SOURCE)
+        ctx.set_source_surface(image, x, y)
+        if alpha < 1.0:
+            ctx.paint_with_alpha(alpha)
+        else:
+            ctx.paint()
+        ctx.restore()
+
+    def render_offscreen(self, draw, dim=0.0):
+        image = cairo.ImageSurface(cairo.FORMAT_ARGB32, self.width, self.height)
+        saved = self.ctx
+        self.ctx = cairo.Context(image)
+        try:
+            draw(self)
+        finally:
+            self.ctx = saved
+        image.flush()
+
+        if dim:
+            # Gelapkan langsung di buffer piksel: setara melukis hitam alpha=dim
+            # di atas frame opaque (BGRA little-endian, alpha tidak diubah)
+            pixels = np.ndarray(
+                (self.height, self.width, 4), dtype=np.uint8,
+                buffer=image.get_data(), strides=(image.get_stride(), 4, 1)
+            )
+            keep = int(round((1.0 - dim) * 256))
+            pixels[..., :3] = (pixels[..., :3].astype(np.uint16) * keep) >> 8
+            image.mark_dirty()
+        return image
+
+    def push_offset(self, dx, dy):
+        self.ctx.save()
+        self.ctx.translate(dx, dy)
+
+    def pop_offset(self):
+        self.ctx.restore()
+
+
+class TiledCairoBackend(CairoBackend):
+    """Cairo dengan rasterisasi paralel per tile layar (untuk layar 4K)
+
+    Scene.render() dijalankan sekali per frame ke cairo.RecordingSurface
+    (semua logika Python tetap single-thread). Rekaman itu lalu ditutup dan
+    disalin sekali per pass (satu pass per thread); setiap pass memutar
+    ulang salinannya sendiri ke tile-tile miliknya, jadi tidak ada surface
+    Cairo yang dipakai dua thread sekaligus. Setiap tile punya sub-surface
+    dari buffer layar (offset + clip), sehingga hasilnya langsung tersusun
+    tanpa salinan. Cairo melepas GIL selama menggambar, jadi pass berjalan
+    paralel.
+    """
+
+    name = "cairo-tiled"
+
+    def __init__(self, width, height, threads=None, tile_size=TILE_SIZE):
+        super().__init__(width, height)
+        self.threads = threads or os.cpu_count() or 1
+        self.pool = ThreadPoolExecutor(self.threads, thread_name_prefix="raster")
+        self.tiles = []
+        for y in range(0, height, tile_size):
+            for x in range(0, width, tile_size):
+                w = min(tile_size, width - x)
+                h = min(tile_size, height - y)
+                ctx = cairo.Context(self.surface.create_for_rectangle(x, y, w, h))
+                ctx.rectangle(0, 0, w, h)
+                ctx.clip()
+                self.tiles.append((x, y, ctx))
+        self.recording = None
+
+    def begin_frame(self):
+        self.recording = cairo.RecordingSurface(
+            cairo.CONTENT_COLOR_ALPHA, cairo.Rectangle(0, 0, self.width, self.height)
+        )
+        self.ctx = cairo.Context(self.recording)
+        super().begin_frame()
+
+    def _copy_recording(self, recording):
+        """Salinan rekaman untuk satu pass (Cairo menyimpan snapshot isinya)"""
+        copy = cairo.RecordingSurface(
+            cairo.CONTENT_COLOR_ALPHA, cairo.Rectangle(0, 0, self.width, self.height)
+        )
+        ctx = cairo.Context(copy)
+        ctx.set_source_surface(recording, 0, 0)
+        ctx.paint()
+        return copy
+
+    @staticmethod
+    def _raster_pass(recording, tiles):
+        for x, y, ctx in tiles:
+            ctx.set_source_surface(recording, -x, -y)
+            ctx.paint()
+            ctx.set_source_rgb(0, 0, 0)  # Lepas referensi ke rekaman
+        recording.finish()
+
+    def rasterize(self):
+        """Putar ulang rekaman frame ke semua tile secara paralel"""
+        if self.recording is None:
+            return
+        # Tutup rekaman: context scene dilepas sebelum ada thread yang membacanya
+        recording, self.recording = self.recording, None
+        self.ctx = cairo.Context(self.surface)
+        passes = [self.tiles[i::self.threads] for i in range(self.threads)]
+        passes = [tiles for tiles in passes if tiles]
+        copies = [self._copy_recording(recording) for _ in passes]
+        recording.finish()
+        for _ in self.pool.map(self._raster_pass, copies, passes):
+            pass
+
+    def present(self, screen):
+        self.rasterize()
+        super().present(screen)
+
+    def frame_bytes(self):
+        self.rasterize()
+        return super().frame_bytes()
+
+    def snapshot(self):
+        self.rasterize()
+        return super().snapshot()
+
+
+def _rgb255(color, factor=1.0):
+    """Warna 0..1 -> 0..255 (dengan clamp seperti Cairo)"""
+    return tuple(min(255, int(c * factor * 255)) for c in color)
+
+
+class PygameBackend(RenderBackend):
+    name = "pygame"
+
+    def __init__(self, width, height, screen=None):
+        super().__init__(width, height)
+        # Gambar langsung ke layar jika ada (tanpa blit tambahan)
+        self.screen = screen if screen is not None else pygame.Surface((width, height))
+        self.target = self.screen
+        self._targets = []
+        self._offsets = []
+        self.ox = 0
+        self.oy = 0
+
+        self._fonts = {}
+        self._gradients = {}
+        self._texts = {}
+        self._premul = getattr(pygame, "BLEND_PREMULTIPLIED", 0)
+
+    # --- Cache sprite ---
+
+    def _font(self, size):
+        size = max(1, int(round(size)))
+        font = self._fonts.get(size)
+        if font is None:
+            font = pygame.font.SysFont("arial", size, bold=True)
+            self._fonts[size] = font
+        return font
+
+    def _text_sprite(self, text, size, color, alpha=1.0, shadow=0, gradient=None):
+        """Render teks (+bayangan) sekali ke surface SRCALPHA"""
+        font = self._font(size)
+        if gradient:
+            main = font.render(text, True, (255, 255, 255))
+            band = pygame.Surface(main.get_size(), pygame.SRCALPHA)
+            self._fill_vertical(band, [_rgb255(c) for c in gradient])
+            main.blit(band, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
+        else:
+            main = font.render(text, True, _rgb255(color))
+        if alpha < 1.0:
+            main.set_alpha(int(alpha * 255))
+
+        width, height = main.get_size()
+        sprite = pygame.Surface((width + shadow, height + shadow), pygame.SRCALPHA)
+        if shadow:
+            back = font.render(text, True, (0, 0, 0))
+            back.set_alpha(128)
+            sprite.blit(back, (shadow, shadow))
+        sprite.blit(main, (0, 0))
+        return sprite, font.get_ascent()
+
+    def _fill_vertical(self, surface, stops):
+        """Gradient vertikal beberapa warna (baris per baris, sekali saja)"""
+        width, height = surface.get_size()
+        segments = len(stops) - 1
+        for y in range(height):
+            t = y / max(1, height - 1) * segments
+            i = min(int(t), segments - 1)
+            f = t - i
+            a, b = stops[i], stops[i + 1]
+            color = tuple(int(a[k] + (b[k] - a[k]) * f) for k in range(3))
+            pygame.draw.line(surface, color, (0, y), (width - 1, y))
+
+    def _rounded_box(self, width, height, radius, color, scale):
+        """Kotak rounded dengan gradient (1.2x terang di atas) + border putih"""
+        w = int(round(width * scale))
+        h = int(round(height * scale))
+        r = int(round(radius * scale))
+        box = pygame.Surface((w, h), pygame.SRCALPHA)
+        self._fill_vertical(box, [_rgb255(color, 1.2 / 255), _rgb255(color, 1 / 255)])
+        mask = pygame.Surface((w, h), pygame.SRCALPHA)
+        pygame.draw.rect(mask, (255, 255, 255, 255), (0, 0, w, h), border_radius=r)
+        box.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+        pygame.draw.rect(box, (255, 255, 255), (0, 0, w, h), max(1, int(round(3 * scale))), border_radius=r)
+        return box
+
+    def _button_sprite(self, button, scale, pad):
+        w = int(round((button.width + pad * 2) * scale))
+        h = int(round((button.height + pad * 2) * scale))
+        sprite = pygame.Surface((w, h), pygame.SRCALPHA)
+        p = int(round(pad * scale))
+        sprite.blit(self._rounded_box(button.width, button.height, 20, button.color, scale), (p, p))
+        if button.hover:
+            outline = pygame.Surface((w, h), pygame.SRCALPHA)
+            rect = (p, p, int(round(button.width * scale)), int(round(button.height * scale)))
+            pygame.draw.rect(outline, (0, 0, 0, 77), rect, max(1, int(round(8 * scale))),
+                             border_radius=int(round(20 * scale)))
+            sprite.blit(outline, (0, 0))
+
+        text, _ = self._text_sprite(button.text, 28 * scale, [c / 255 for c in button.text_color], shadow=2)
+        sprite.blit(text, ((w - text.get_width()) // 2, (h - text.get_height()) // 2))
+        return sprite
+
+    def _tile_sprite(self, tile, scale, pad):
+        w = int(round((tile.width + pad * 2) * scale))
+        h = int(round((tile.height + pad * 2) * scale))
+        sprite = pygame.Surface((w, h), pygame.SRCALPHA)
+        p = int(round(pad * scale))
+        if tile.dragging:
+            shadow = pygame.Surface((int(round(tile.width * scale)), int(round(tile.height * scale))), pygame.SRCALPHA)
+            pygame.draw.rect(shadow, (0, 0, 0, 77), shadow.get_rect(), border_radius=int(round(15 * scale)))
+            sprite.blit(shadow, (p + int(5 * scale), p + int(5 * scale)))
+        sprite.blit(self._rounded_box(tile.width, tile.height, 15, tile.color, scale), (p, p))
+
+        text, _ = self._text_sprite(str(tile.content), 48 * scale, (1, 1, 1), shadow=2)
+        sprite.blit(text, ((w - text.get_width()) // 2, (h - text.get_height()) // 2))
+        return sprite
+
+    def _raster_sprite(self, node, scale):
+        """Fallback: rasterisasi Cairo sekali lalu jadikan sprite pygame"""
+        raster = node._rasterize(scale)
+        raster.flush()
+        fmt = "BGRA" if sys.byteorder == "little" else "ARGB"
+        image = pygame.image.frombuffer(
+            bytes(raster.get_data()), (raster.get_width(), raster.get_height()), fmt
+        )
+        return image.convert_alpha() if pygame.display.get_surface() else image.copy()
+
+    def _node_sprite(self, node, scale):
+        """Sprite node pada skala terkuantisasi; dibuat ulang saat isi berubah"""
+        node.take_content_change()
+        key = (self.name, scale)
+        entry = node.cache.get(key)
+        if entry is None:
+            image = None
+            if node.atlas is not None:
+                atlas_key = node.atlas_key(scale)
+                image = node.atlas.image(atlas_key) if atlas_key is not None else None
+            if image is not None:
+                # Raster Cairo prebuilt dari atlas (premultiplied, langsung di atas mmap)
+                entry = (image, self._premul)
+            elif isinstance(node, TextNode):
+                entry = (self._text_sprite(node.text, node.size * scale, node.color,
+                                           node.alpha, int(node.shadow * scale))[0], 0)
+            elif isinstance(node, ButtonNode):
+                entry = (self._button_sprite(node.button, scale, node.padding), 0)
+            elif isinstance(node, TileNode):
+                entry = (self._tile_sprite(node.tile, scale, node.padding), 0)
+            else:
+                entry = (self._raster_sprite(node, scale), self._premul)
+            node.cache[key] = entry
+        return entry
+
+    # --- Frame ---
+
+    def begin_frame(self):
+        self.target.fill((255, 255, 255))
+
+    def present(self, screen):
+        if self.screen is not screen:
+            screen.blit(self.screen, (0, 0))
+        pygame.display.flip()
+
+    def frame_bytes(self):
+        return pygame.image.tobytes(self.screen, "BGRA")
+
+    # --- Primitive ---
+
+    def fill_gradient(self, top, bottom):
+        key = (top, bottom)
+        surface = self._gradients.get(key)
+        if surface is None:
+            surface = pygame.Surface((self.width, self.height))
+            self._fill_vertical(surface, [_rgb255(top), _rgb255(bottom)])
+            self._gradients[key] = surface
+        self.target.blit(surface, (self.ox, self.oy))
+
+    def draw_text(self, text, x, baseline, size, color=(1, 1, 1), alpha=1.0,
+                  shadow=0, scale=1.0, gradient=None):
+        key = (text, size, color, alpha, shadow, tuple(gradient) if gradient else None)
+        entry = self._texts.get(key)
+        if entry is None:
+            if len(self._texts) > 256:
+                self._texts.clear()
+            entry = self._text_sprite(text, size, color, alpha, shadow, gradient)
+            self._texts[key] = entry
+        sprite, ascent = entry
+
+        left = x + self.ox
+        top = baseline - ascent + self.oy
+        if scale != 1.0:
+            # Skala berporos di tengah garis dasar
+            pivot_x = left + sprite.get_width() / 2
+            pivot_y = baseline + self.oy
+            sprite = pygame.transform.rotozoom(sprite, 0, scale)
+            left = pivot_x - sprite.get_width() / 2
+            top = pivot_y - ascent * scale
+        self.target.blit(sprite, (int(left), int(top)))
+
+    def text_width(self, text, size):
+        return self._font(size).size(text)[0]
+
+    def _blit_transformed(self, sprite, flags, center_x, center_y, angle, scale):
+        """Blit sprite berpusat di (center_x, center_y) dengan rotasi/scale"""
+        if abs(angle) > 0.05 or abs(scale - 1.0) > 1e-3:
+            sprite = pygame.transform.rotozoom(sprite, -angle, scale)
+        self.target.blit(
+            sprite,
+            (int(center_x - sprite.get_width() / 2 + self.ox),
+             int(center_y - sprite.get_height() / 2 + self.oy)),
+            special_flags=flags
+        )
+
+    def draw_graph(self, graph):
+        graph.update()
+        stats = graph.stats
+        for key in stats:
+            stats[key] = 0
+        self._draw_node(graph.root, graph.viewport, stats)
+
+    def _draw_node(self, node, viewport, stats):
+        if not node.visible:
+            return
+        b = node.bounds
+        if b[2] < viewport[0] or b[0] > viewport[2] or b[3] < viewport[1] or b[1] > viewport[3]:
+            stats["culled"] += 1
+            return
+
+        if node.width and node.height:
+            m = node.world
+            center_x, center_y = m.transform_point(node.width / 2, node.height / 2)
+            scale = math.sqrt(abs(m.xx * m.yy - m.xy * m.yx))
+
+            if isinstance(node, ParticleNode):
+                # Lingkaran sederhana: gfxdraw langsung lebih murah dari sprite
+                color = _rgb255(node.color) + (int(node.alpha * 255),)
+                pygame.gfxdraw.filled_circle(
+                    self.target, int(center_x + self.ox), int(center_y + self.oy),
+                    max(1, int(node.radius * scale)), color
+                )
+            else:
+                q = quantize_scale(scale)
+                hits = len(node.cache)
+                sprite, flags = self._node_sprite(node, q)
+                stats["cache_hits" if len(node.cache) == hits else "cache_misses"] += 1
+                angle = math.degrees(math.atan2(m.yx, m.xx))
+                self._blit_transformed(sprite, flags, center_x, center_y, angle, scale / q)
+            stats["drawn"] += 1
+
+        for child in node.children:
+            self._draw_node(child, viewport, stats)
+
+    # --- Gambar offscreen ---
+
+    def snapshot(self):
+        return self.target.copy()
+
+    def draw_image(self, image, x=0, y=0, alpha=1.0, clip=None, opaque=False):
+        if alpha < 1.0:
+            image.set_alpha(int(alpha * 255))
+        if clip:
+            cx, cy, cw, ch = (int(v) for v in clip)
+            self.target.blit(image, (cx + self.ox, cy + self.oy), area=pygame.Rect(cx - x, cy - y, cw, ch))
+        else:
+            self.target.blit(image, (int(x + self.ox), int(y + self.oy)))
+        if alpha < 1.0:
+            image.set_alpha(None)
+
+    def render_offscreen(self, draw, dim=0.0):
+        image = pygame.Surface((self.width, self.height))
+        self._targets.append(self.target)
+        self.target = image
+        try:
+            draw(self)
+        finally:
+            self.target = self._targets.pop()
+        if dim:
+            keep = int(round((1.0 - dim) * 255))
+            image.fill((keep, keep, keep), special_flags=pygame.BLEND_MULT)
+        return image
+
+    def push_offset(self, dx, dy):
+        self._offsets.append((self.ox, self.oy))
+        self.ox += int(dx)
+        self.oy += int(dy)
+
+    def pop_offset(self):
+        self.ox, self.oy = self._offsets.pop()
+
+
+BACKENDS = {
+    "cairo": CairoBackend,
+    "cairo-tiled": TiledCairoBackend,
+    "pygame": PygameBackend,
+}
+
+
+def create_backend(name, width, height, screen=None, threads=None):
+    """Buat backend berdasarkan nama ("cairo", "cairo-tiled" atau "pygame")"""
+    if name not in BACKENDS:
+        raise ValueError(f"Backend tidak dikenal: {name} (pilihan: {', '.join(BACKENDS)})")
+    if name == "pygame":
+        return PygameBackend(width, height, screen)
+    if name == "cairo-tiled":
+        return TiledCairoBackend(width, height, threads)
+    return CairoBackend(width, height)
@@ -0,0 +1,448 @@
+"""
+Scene Graph - Lapisan retained-mode di bawah Scene
+
+Setiap node menyimpan transform lokal, world transform & bounding box yang
+di-cache, serta raster cache isi node. Perubahan ditandai dengan flag yang
+merambat ke atas pohon, sehingga update hanya menyentuh cabang yang berubah.
+Node di luar layar dilewati (culling).
+"""
+
+import math
+import cairo
+
+# Flag perubahan
+DIRTY_TRANSFORM = 1
+DIRTY_CONTENT = 2
+DIRTY_CHILD = 4
+
+# Raster cache dibuat per langkah skala 0.25 supaya animasi scale
+# tidak memicu rasterisasi ulang setiap frame
+RASTER_SCALE_STEP = 0.25
+
+# Context kecil untuk mengukur teks tanpa menggambar
+_measure_ctx = cairo.Context(cairo.ImageSurface(cairo.FORMAT_ARGB32, 1, 1))
+
+
+def quantize_scale(scale):
+    """Bulatkan skala ke atas ke kelipatan RASTER_SCALE_STEP"""
+    return max(RASTER_SCALE_STEP, math.ceil(scale / RASTER_SCALE_STEP) * RASTER_SCALE_STEP)
+
+
+class Node:
+    """Node dasar: transform + anak. Subclass mengisi draw_content()"""
+
+    padding = 8      # Ruang ekstra raster untuk stroke/bayangan di luar kotak
+    cacheable = True  # Isi digambar sekali ke raster lalu ditempel
+    live = False     # Node pembungkus komponen yang perlu sync() tiap frame
+    atlas = None     # SpriteAtlas prebuilt (dipasang SceneGraph.add)
+
+    def __init__(self, x=0.0, y=0.0, width=0.0, height=0.0):
+        self.parent = None
+        self.children = []
+
+        # Transform lokal (x, y = pojok kiri atas; pivot di tengah)
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.rotation = 0.0
+        self.scale = 1.0
+        self.visible = True
+
+        self.flags = DIRTY_TRANSFORM | DIRTY_CONTENT
+        self.world = cairo.Matrix()
+        self.bounds = (0.0, 0.0, 0.0, 0.0)
+        # Cache gambar isi node per (backend, skala)
+        self.cache = {}
+
+    # --- Struktur pohon ---
+
+    def add(self, child):
+        """Tambah anak (digambar setelah anak yang sudah ada)"""
+        child.parent = self
+        self.children.append(child)
+        child.mark(DIRTY_TRANSFORM)
+        return child
+
+    def remove(self, child):
+        """Lepas anak dari node ini"""
+        self.children.remove(child)
+        child.parent = None
+        self.mark(DIRTY_TRANSFORM)
+
+    # --- Perubahan ---
+
+    def set_transform(self, x=None, y=None, rotation=None, scale=None):
+        """Ubah transform lokal; flag hanya dipasang jika nilainya berubah"""
+        changed = False
+        if x is not None and x != self.x:
+            self.x = x
+            changed = True
+        if y is not None and y != self.y:
+            self.y = y
+            changed = True
+        if rotation is not None and rotation != self.rotation:
+            self.rotation = rotation
+            changed = True
+        if scale is not None and scale != self.scale:
+            self.scale = scale
+            changed = True
+        if changed:
+            self.mark(DIRTY_TRANSFORM)
+
+    def invalidate(self):
+        """Isi node berubah: raster cache harus dibuat ulang"""
+        self.mark(DIRTY_CONTENT)
+
+    def mark(self, flag):
+        """Pasang flag dan rambatkan DIRTY_CHILD ke leluhur"""
+        self.flags |= flag
+        node = self.parent
+        while node is not None and not node.flags & DIRTY_CHILD:
+            node.flags |= DIRTY_CHILD
+            node = node.parent
+
+    def take_content_change(self):
+        """Kosongkan cache jika isi berubah sejak digambar terakhir"""
+        if self.flags & DIRTY_CONTENT:
+            self.cache.clear()
+            self.flags &= ~DIRTY_CONTENT
+
+    def sync(self):
+        """Salin state komponen ke node (untuk node live)"""
+        pass
+
+    def atlas_key(self, scale):
+        """Kunci raster node di SpriteAtlas (None = selalu dirasterisasi)"""
+        return None
+
+    # --- Transform & bounds ---
+
+    def local_matrix(self):
+        """Matrix lokal: scale & rotate di sekitar pusat, lalu translate"""
+        cx = self.width / 2
+        cy = self.height / 2
+        matrix = cairo.Matrix(x0=-cx, y0=-cy)
+        if self.scale != 1.0:
+            matrix = matrix.multiply(cairo.Matrix(xx=self.scale, yy=self.scale))
+        if self.rotation:
+            matrix = matrix.multiply(cairo.Matrix.init_rotate(self.rotation))
+        return matrix.multiply(cairo.Matrix(x0=self.x + cx, y0=self.y + cy))
+
+    def _content_bounds(self):
+        """AABB isi node (termasuk padding) dalam koordinat dunia"""
+        pad = self.padding
+        corners = (
+            (-pad, -pad), (self.width + pad, -pad),
+            (-pad, self.height + pad), (self.width + pad, self.height + pad),
+        )
+        xs = []
+        ys = []
+        for cx, cy in corners:
+            wx, wy = self.world.transform_point(cx, cy)
+            xs.append(wx)
+            ys.append(wy)
+        return (min(xs), min(ys), max(xs), max(ys))
+
+    def _update(self, parent_world, parent_changed):
+        """Hitung ulang world transform & bounds hanya pada cabang yang kotor"""
+        changed = parent_changed or bool(self.flags & DIRTY_TRANSFORM)
+        if changed:
+            self.world = self.local_matrix().multiply(parent_world)
+
+        if changed or self.flags & DIRTY_CHILD:
+            for child in self.children:
+                child._update(self.world, changed)
+
+            # Bounds = isi sendiri digabung dengan semua anak
+            bounds = self._content_bounds() if self.width and self.height else None
+            for child in self.children:
+                if not child.visible:
+                    continue
+                if bounds is None:
+                    bounds = child.bounds
+                else:
+                    b = child.bounds
+                    bounds = (min(bounds[0], b[0]), min(bounds[1], b[1]),
+                              max(bounds[2], b[2]), max(bounds[3], b[3]))
+            self.bounds = bounds or (0.0, 0.0, 0.0, 0.0)
+
+        self.flags &= ~(DIRTY_TRANSFORM | DIRTY_CHILD)
+
+    # --- Render ---
+
+    def draw_content(self, ctx):
+        """Gambar isi node dalam koordinat lokal (0, 0, width, height)"""
+        pass
+
+    def _render(self, ctx, base, viewport, stats):
+        if not self.visible:
+            return
+        b = self.bounds
+        if b[2] < viewport[0] or b[0] > viewport[2] or b[3] < viewport[1] or b[1] > viewport[3]:
+            stats["culled"] += 1
+            return
+
+        if self.width and self.height:
+            ctx.save()
+            ctx.set_matrix(self.world.multiply(base))
+            if self.cacheable:
+                self._paint_raster(ctx, stats)
+            else:
+                self.draw_content(ctx)
+            ctx.restore()
+            stats["drawn"] += 1
+
+        for child in self.children:
+            child._render(ctx, base, viewport, stats)
+
+    def _paint_raster(self, ctx, stats):
+        """Tempel raster cache (buat dulu jika belum ada / isi berubah)"""
+        self.take_content_change()
+
+        m = self.world
+        scale = quantize_scale(math.sqrt(abs(m.xx * m.yy - m.xy * m.yx)))
+        key = ("cairo", scale)
+        raster = self.cache.get(key)
+        if raster is None:
+            raster = self._atlas_raster(scale)
+            if raster is None:
+                raster = self._rasterize(scale)
+                stats["cache_misses"] += 1
+            else:
+                stats["atlas_hits"] += 1
+            self.cache[key] = raster
+        else:
+            stats["cache_hits"] += 1
+
+        pad = self.padding * scale
+        ctx.scale(1 / scale, 1 / scale)
+        ctx.set_source_surface(raster, -pad, -pad)
+        ctx.rectangle(-pad, -pad, raster.get_width(), raster.get_height())
+        ctx.fill()
+
+    def _atlas_raster(self, scale):
+        """Raster prebuilt dari atlas di disk (None jika tidak ada)"""
+        if self.atlas is None:
+            return None
+        key = self.atlas_key(scale)
+        return None if key is None else self.atlas.surface(key)
+
+    def _rasterize(self, scale):
+        """Gambar isi node ke ImageSurface pada skala tertentu"""
+        pad = self.padding
+        width = max(1, int(math.ceil((self.width + pad * 2) * scale)))
+        height = max(1, int(math.ceil((self.height + pad * 2) * scale)))
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
+        ctx = cairo.Context(surface)
+        ctx.scale(scale, scale)
+        ctx.translate(pad, pad)
+        self.draw_content(ctx)
+        return surface
+
+
+class SceneGraph:
+    """Akar pohon node + viewport untuk culling"""
+
+    def __init__(self, width, height, atlas=None):
+        self.root = Node()
+        self.viewport = (0.0, 0.0, float(width), float(height))
+        self.live_nodes = []
+        self.atlas = atlas
+        self.stats = {"drawn": 0, "culled": 0, "cache_hits": 0, "cache_misses": 0, "atlas_hits": 0}
+
+    def add(self, node, parent=None):
+        """Tambah node ke root (atau parent tertentu)"""
+        (parent or self.root).add(node)
+        if self.atlas is not None:
+            node.atlas = self.atlas
+        if node.live:
+            self.live_nodes.append(node)
+        return node
+
+    def remove(self, node):
+        """Lepas node dari pohon"""
+        node.parent.remove(node)
+        if node in self.live_nodes:
+            self.live_nodes.remove(node)
+
+    def update(self):
+        """Sync node live lalu perbarui transform yang kotor"""
+        for node in self.live_nodes:
+            node.sync()
+        self.root._update(cairo.Matrix(), False)
+
+    def render(self, ctx):
+        """Perbarui node yang kotor lalu gambar yang terlihat di viewport"""
+        self.update()
+        for key in self.stats:
+            self.stats[key] = 0
+        base = ctx.get_matrix()
+        self.root._render(ctx, base, self.viewport, self.stats)
+
+
+class TextNode(Node):
+    """Teks statis (judul, label, skor)"""
+
+    def __init__(self, text, size, color=(1, 1, 1), alpha=1.0, shadow=0):
+        super().__init__()
+        self.size = size
+        self.color = color
+        self.alpha = alpha
+        self.shadow = shadow
+        self.text = None
+        self._extents = None
+        self.set_text(text)
+
+    def set_text(self, text):
+        """Ganti teks; ukuran diukur ulang hanya jika teks berubah"""
+        if text == self.text:
+            return
+        self.text = text
+        _measure_ctx.select_font_face("Arial", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
+        _measure_ctx.set_font_size(self.size)
+        self._extents = _measure_ctx.text_extents(text)
+        self.width = self._extents.width + self.shadow
+        self.height = self._extents.height + self.shadow
+        self.mark(DIRTY_TRANSFORM)
+        self.invalidate()
+
+    def text_width(self):
+        return self._extents.width
+
+    def place(self, x, baseline):
+        """Posisikan seperti ctx.move_to(x, baseline) + show_text"""
+        self.set_transform(x=x + self._extents.x_bearing, y=baseline + self._extents.y_bearing)
+
+    def draw_content(self, ctx):
+        ctx.select_font_face("Arial", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
+        ctx.set_font_size(self.size)
+        origin_x = -self._extents.x_bearing
+        origin_y = -self._extents.y_bearing
+        if self.shadow:
+            ctx.set_source_rgba(0, 0, 0, 0.5)
+            ctx.move_to(origin_x + self.shadow, origin_y + self.shadow)
+            ctx.show_text(self.text)
+        ctx.set_source_rgba(self.color[0], self.color[1], self.color[2], self.alpha)
+        ctx.move_to(origin_x, origin_y)
+        ctx.show_text(self.text)
+
+
+class ParticleNode(Node):
+    """Lingkaran transparan untuk latar belakang"""
+
+    padding = 2
+
+    def __init__(self, radius, color, alpha=0.3):
+        super().__init__(width=radius * 2, height=radius * 2)
+        self.radius = radius
+        self.color = color
+        self.alpha = alpha
+
+    def draw_content(self, ctx):
+        ctx.arc(self.radius, self.radius, self.radius, 0, 2 * math.pi)
+        ctx.set_source_rgba(self.color[0], self.color[1], self.color[2], self.alpha)
+        ctx.fill()
+
+
+class TargetNode(Node):
+    """Kotak target puzzle; digambar oleh fungsi _draw_target milik scene"""
+
+    live = True
+
+    def __init__(self, target, size, draw, label_height=40, height=None):
+        # Label angka/huruf ada di bawah kotak
+        super().__init__(target['x'], target['y'], size, (height or size) + label_height)
+        self.target = target
+        self._draw = draw
+        self._filled = target['filled']
+
+    def sync(self):
+        if self.target['filled'] != self._filled:
+            self._filled = self.target['filled']
+            self.invalidate()
+
+    def draw_content(self, ctx):
+        ctx.translate(-self.target['x'], -self.target['y'])
+        self._draw(ctx, self.target)
+
+
+class ButtonNode(Node):
+    """Pembungkus Button: scale jadi transform, hover jadi perubahan isi"""
+
+    live = True
+
+    def __init__(self, button):
+        super().__init__(button.x, button.y, button.width, button.height)
+        self.button = button
+        self._hover = button.hover
+
+    def sync(self):
+        button = self.button
+        self.set_transform(x=button.x, y=button.y, scale=button.scale)
+        if button.hover != self._hover:
+            self._hover = button.hover
+            self.invalidate()
+
+    def set_state(self, hover):
+        """Paksa state hover (untuk membangun atlas)"""
+        self.button.hover = hover
+        self.sync()
+
+    def atlas_key(self, scale):
+        b = self.button
+        return repr(("button", b.text, b.width, b.height, tuple(b.color), tuple(b.text_color),
+                     self._hover, scale))
+
+    def draw_content(self, ctx):
+        ctx.translate(-self.button.x, -self.button.y)
+        self.button.draw_shape(ctx)
+
+
+class TileNode(Node):
+    """Pembungkus DraggableObject: posisi/rotasi/scale jadi transform"""
+
+    live = True
+
+    def __init__(self, tile):
+        super().__init__(tile.x, tile.y, tile.width, tile.height)
+        self.tile = tile
+        self._dragging = tile.dragging
+
+    def sync(self):
+        tile = self.tile
+        self.set_transform(x=tile.x, y=tile.y, rotation=tile.rotation, scale=tile.scale)
+        if tile.dragging != self._dragging:
+            self._dragging = tile.dragging
+            self.invalidate()
+
+    def set_state(self, dragging):
+        """Paksa state drag (untuk membangun atlas)"""
+        self.tile.dragging = dragging
+        self.sync()
+
+    def atlas_key(self, scale):
+        t = self.tile
+        return repr(("tile", str(t.content), t.width, t.height, tuple(t.color),
+                     self._dragging, scale))
+
+    def draw_content(self, ctx):
+        ctx.translate(-self.tile.x, -self.tile.y)
+        self.tile.draw_shape(ctx)
+
+
+class AssetNode(Node):
+    """Gambar vektor dari AssetLibrary (raster dibagi antar node lewat cache library)"""
+
+    cacheable = False
+    padding = 0
+
+    def __init__(self, library, name, x=0.0, y=0.0, width=None, height=None, alpha=1.0):
+        asset_width, asset_height = library.size(name)
+        super().__init__(x, y, width or asset_width, height or asset_height)
+        self.library = library
+        self.name = name
+        self.alpha = alpha
+
+    def draw_content(self, ctx):
+        self.library.paint(ctx, self.name, self.width, self.height, self.alpha)
@@ -0,0 +1,252 @@
+"""
+Job Scheduler - Pekerjaan latar yang dicicil di sisa waktu frame
+
+Job kooperatif berupa generator: setiap yield = satu langkah kecil.
+Setelah update dan render, GameEngine memberi scheduler sisa anggaran
+frame (1/fps dikurangi waktu yang sudah terpakai); langkah job dijalankan
+menurut prioritas lalu deadline sampai waktu habis. Jika anggaran sudah
+habis, job yang lewat deadline tetap mendapat satu langkah per frame.
+
+Pekerjaan yang memblokir (I/O file, kompresi, rasterisasi besar) dikirim
+ke thread pool lewat submit_io(); callback-nya dijalankan kembali di
+main thread pada frame berikutnya, sehingga state game tetap
+hanya disentuh dari main thread.
+"""
+
+import heapq
+import itertools
+import math
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Prioritas (kecil = lebih dulu)
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+# Sisakan sedikit waktu agar clock.tick tidak terlambat membangunkan frame berikut
+SAFETY_MARGIN = 0.001
+
+
+class Job:
+    """Satu job kooperatif (generator) beserta statistiknya"""
+
+    __slots__ = ("name", "priority", "deadline", "on_done", "steps",
+                 "done", "cancelled", "result", "slices", "time")
+
+    def __init__(self, steps, name, priority, deadline, on_done):
+        self.steps = steps
+        self.name = name
+        self.priority = priority
+        self.deadline = deadline
+        self.on_done = on_done
+        self.done = False
+        self.cancelled = False
+        self.result = None
+        self.slices = 0
+        self.time = 0.0
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class JobScheduler:
+    def __init__(self, workers=2, margin=SAFETY_MARGIN):
+        self.workers = workers
+        self.margin = margin
+        self._heap = []
+        self._order = itertools.count()
+        self._pool = None
+        self._io_results = queue.SimpleQueue()
+        self._io_pending = 0
+
+        # Statistik: per nama job, dan kedalaman antrean per frame
+        self._job_stats = {}
+        self._frames = 0
+        self._depth_total = 0
+        self.max_depth = 0
+        self.errors = 0
+
+    @property
+    def pending(self):
+        """Jumlah job kooperatif + I/O yang belum selesai"""
+        return len(self._heap) + self._io_pending
+
+    def submit(self, steps, name=None, priority=PRIORITY_NORMAL, deadline=None, on_done=None):
+        """Antrekan generator; deadline = detik dari sekarang (opsional)
+
+        on_done(result) dipanggil dengan nilai return generator.
+        """
+        name = name or getattr(steps, "__qualname__", "job")
+        due = time.perf_counter() + deadline if deadline is not None else None
+        job = Job(steps, name, priority, due, on_done)
+        self._push(job)
+        return job
+
+    def submit_io(self, func, *args, name=None, on_done=None):
+        """Jalankan func(*args) di thread pool; on_done(result) di main thread"""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job-io")
+        name = name or getattr(func, "__qualname__", "io")
+        submitted = time.perf_counter()
+        self._io_pending += 1
+
+        def finished(future):
+            self._io_results.put((name, future, on_done, time.perf_counter() - submitted))
+
+        future = self._pool.submit(func, *args)
+        future.add_done_callback(finished)
+        return future
+
+    def run_until_done(self, job):
+        """Selesaikan satu job sekarang juga (hasilnya dibutuhkan segera)"""
+        while not job.done and not job.cancelled:
+            self._step(job)
+        return job.result
+
+    def run(self, budget):
+        """Jalankan langkah job selama budget detik; return jumlah langkah"""
+        self._deliver_io()
+        self._frames += 1
+        depth = len(self._heap)
+        self._depth_total += depth
+        self.max_depth = max(self.max_depth, depth)
+
+        deadline = time.perf_counter() + budget - self.margin
+        steps = 0
+        while self._heap:
+            now = time.perf_counter()
+            job = self._heap[0][-1]
+            if job.cancelled or job.done:
+                heapq.heappop(self._heap)
+                continue
+            if now >= deadline:
+                if steps == 0:
+                    steps += self._step_overdue(now)
+                break
+            heapq.heappop(self._heap)
+            if self._step(job):
+                self._push(job)
+            steps += 1
+        return steps
+
+    def stats(self):
+        """Statistik antrean dan waktu per job (milidetik)"""
+        jobs = {}
+        for name, s in self._job_stats.items():
+            jobs[name] = {
+                "count": s["count"],
+                "slices": s["slices"],
+                "total_ms": s["time"] * 1000,
+                "mean_ms": s["time"] / s["count"] * 1000 if s["count"] else 0.0,
+                "max_slice_ms": s["max_slice"] * 1000,
+                "late": s["late"],
+            }
+        return {
+            "queued": len(self._heap),
+            "io_pending": self._io_pending,
+            "max_depth": self.max_depth,
+            "mean_depth": self._depth_total / self._frames if self._frames else 0.0,
+            "errors": self.errors,
+            "jobs": jobs,
+        }
+
+    def format_stats(self):
+        stats = self.stats()
+        lines = [f"Job latar: antrean maks {stats['max_depth']}, rata-rata {stats['mean_depth']:.2f}, "
+                 f"{stats['errors']} gagal"]
+        for name, s in sorted(stats["jobs"].items(), key=lambda item: -item[1]["total_ms"]):
+            lines.append(f"  {name:<32} {s['count']:>4}x  total {s['total_ms']:8.1f} ms  "
+                         f"langkah maks {s['max_slice_ms']:6.2f} ms  terlambat {s['late']}")
+        return "\n".join(lines)
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        self._deliver_io()
+
+    # --- Internal ---
+
+    def _push(self, job):
+        due = job.deadline if job.deadline is not None else math.inf
+        heapq.heappush(self._heap, (job.priority, due, next(self._order), job))
+
+    def _step(self, job):
+        """Satu langkah job; return True jika job masih berlanjut"""
+        start = time.perf_counter()
+        try:
+            next(job.steps)
+            running = True
+        except StopIteration as e:
+            job.result = e.value
+            running = False
+        except Exception as e:
+            self.errors += 1
+            print(f"Job {job.name} gagal: {e!r}")
+            job.cancelled = True
+            return False
+        elapsed = time.perf_counter() - start
+        job.slices += 1
+        job.time += elapsed
+        s = self._stat(job.name)
+        s["slices"] += 1
+        s["max_slice"] = max(s["max_slice"], elapsed)
+        if running:
+            return True
+
+        job.done = True
+        s["count"] += 1
+        s["time"] += job.time
+        if job.deadline is not None and time.perf_counter() > job.deadline:
+            s["late"] += 1
+        if job.on_done is not None:
+            self._callback(job.name, job.on_done, job.result)
+        return False
+
+    def _step_overdue(self, now):
+        """Anggaran habis: tetap majukan satu langkah job yang paling terlambat"""
+        overdue = [entry[-1] for entry in self._heap
+                   if entry[-1].deadline is not None and entry[-1].deadline <= now
+                   and not entry[-1].done and not entry[-1].cancelled]
+        if not overdue:
+            return 0
+        # Job tetap di heap; jika selesai, entrinya dibuang saat dipop nanti
+        self._step(min(overdue, key=lambda job: job.deadline))
+        return 1
+
+    def _deliver_io(self):
+        """Jalankan callback I/O yang sudah selesai (di main thread)"""
+        while True:
+            try:
+                name, future, on_done, elapsed = self._io_results.get_nowait()
+            except queue.Empty:
+                return
+            self._io_pending -= 1
+            s = self._stat(name)
+            s["count"] += 1
+            s["slices"] += 1
+            s["time"] += elapsed
+            s["max_slice"] = max(s["max_slice"], elapsed)
+            error = future.exception()
+            if error is not None:
+                self.errors += 1
+                print(f"Job {name} gagal: {error!r}")
+            elif on_done is not None:
+                self._callback(name, on_done, future.result())
+
+    def _callback(self, name, on_done, result):
+        """Panggil on_done; error dicatat seperti error job, game loop tetap jalan"""
+        try:
+            on_done(result)
+        except Exception as e:
+            self.errors += 1
+            print(f"Callback job {name} gagal: {e!r}")
+
+    def _stat(self, name):
+        s = self._job_stats.get(name)
+        if s is None:
+            s = self._job_stats[name] = {"count": 0, "slices": 0, "time": 0.0,
+                                         "max_slice": 0.0, "late": 0}
+        return s
@@ -0,0 +1,176 @@
+"""
+Sound Manager - Efek suara berlatensi rendah
+
+Semua suara di-decode/disintesis sekali saat warm-up di thread latar,
+lalu diputar lewat pool channel tetap dengan prioritas. Klik tidak pernah
+membaca file dari disk.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+import numpy as np
+import pygame
+
+# Buffer mixer kecil = latensi rendah (256 sampel @ 44.1 kHz ~ 5.8 ms)
+MIXER_FREQUENCY = 44100
+MIXER_SIZE = -16
+MIXER_CHANNELS = 2
+MIXER_BUFFER = 256
+
+SOUND_DIR = os.path.join("assets", "sounds")
+
+# name: (priority, [(frequency_hz, duration_s), ...], volume)
+# Prioritas tinggi boleh mencuri channel dari suara berprioritas rendah
+SOUND_DEFS = {
+    "click": (3, [(880, 0.05)], 0.5),
+    "pickup": (1, [(520, 0.04), (780, 0.05)], 0.35),
+    "snap": (2, [(660, 0.06), (990, 0.09)], 0.5),
+    "celebrate": (4, [(523, 0.12), (659, 0.12), (784, 0.12), (1047, 0.3)], 0.6),
+}
+
+
+def pre_init():
+    """Atur parameter mixer; harus dipanggil sebelum pygame.init()"""
+    pygame.mixer.pre_init(MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS, MIXER_BUFFER)
+
+
+def synthesize(notes, volume, frequency, channels):
+    """Buat buffer int16 dari deretan nada sinus dengan envelope lembut"""
+    parts = []
+    for note_freq, duration in notes:
+        n = int(frequency * duration)
+        t = np.arange(n) / frequency
+        wave = np.sin(2 * np.pi * note_freq * t)
+        # Attack singkat supaya tidak "klik", lalu decay eksponensial
+        attack = np.minimum(1.0, t / 0.005)
+        decay = np.exp(-t * 6.0 / duration)
+        parts.append(wave * attack * decay)
+    samples = np.concatenate(parts) * volume * 32767
+    samples = samples.astype(np.int16)
+    if channels > 1:
+        samples = np.repeat(samples[:, None], channels, axis=1)
+    return np.ascontiguousarray(samples)
+
+
+class SoundManager:
+    def __init__(self, num_channels=8):
+        self.num_channels = num_channels
+        self.sounds = {}
+        self.enabled = False
+        self.ready = threading.Event()
+
+        self.channels = []
+        self._priority = []
+        self._started = []
+
+        # Statistik latensi input -> play (detik)
+        self.input_time = None
+        self._latencies = deque(maxlen=1000)
+        self.buffer_latency = 0.0
+
+    def warm_up(self):
+        """Siapkan channel pool lalu decode semua suara di thread latar"""
+        init = pygame.mixer.get_init()
+        if not init:
+            # Tidak ada perangkat audio: semua play() menjadi no-op
+            self.ready.set()
+            return
+
+        frequency, _, channels = init
+        pygame.mixer.set_num_channels(self.num_channels)
+        pygame.mixer.set_reserved(self.num_channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(self.num_channels)]
+        self._priority = [0] * self.num_channels
+        self._started = [0.0] * self.num_channels
+        self.buffer_latency = MIXER_BUFFER / frequency
+        self.enabled = True
+
+        thread = threading.Thread(
+            target=self._load_all, args=(frequency, channels),
+            name="sound-warmup", daemon=True
+        )
+        thread.start()
+
+    def _load_all(self, frequency, channels):
+        """Decode file di assets/sounds jika ada, selain itu sintesis"""
+        for name, (_, notes, volume) in SOUND_DEFS.items():
+            path = os.path.join(SOUND_DIR, name + ".wav")
+            if os.path.exists(path):
+                sound = pygame.mixer.Sound(path)
+                sound.set_volume(volume)
+            else:
+                samples = synthesize(notes, volume, frequency, channels)
+                sound = pygame.sndarray.make_sound(samples)
+            self.sounds[name] = sound
+        self.ready.set()
+
+    def mark_input(self):
+        """Tandai waktu event klik diterima (dipanggil engine sebelum dispatch)"""
+        self.input_time = time.perf_counter()
+
+    def end_input(self):
+        """Event selesai di-dispatch; suara berikutnya bukan respons klik"""
+        self.input_time = None
+
+    def play(self, name):
+        """Putar suara yang sudah di-cache; return channel atau None"""
+        if not self.enabled:
+            return None
+        sound = self.sounds.get(name)
+        if sound is None:
+            # Belum selesai warm-up: lebih baik diam daripada decode di sini
+            return None
+
+        priority = SOUND_DEFS[name][0]
+        index = self._pick_channel(priority)
+        if index is None:
+            return None
+
+        channel = self.channels[index]
+        channel.play(sound)
+        now = time.perf_counter()
+        self._priority[index] = priority
+        self._started[index] = now
+
+        if self.input_time is not None:
+            self._latencies.append(now - self.input_time)
+            self.input_time = None
+        return channel
+
+    def _pick_channel(self, priority):
+        """Cari channel kosong, atau curi yang prioritasnya paling rendah & tertua"""
+        victim = None
+        for i, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return i
+            if victim is None or self._rank(i) < self._rank(victim):
+                victim = i
+
+        if victim is not None and self._priority[victim] <= priority:
+            self.channels[victim].stop()
+            return victim
+        return None
+
+    def _rank(self, index):
+        return (self._priority[index], self._started[index])
+
+    def latency_stats(self):
+        """Statistik latensi klik-ke-audio dalam milidetik
+
+        Total = waktu dari event diterima sampai play() + satu periode
+        buffer mixer (waktu sampai sampel pertama dikirim ke perangkat).
+        """
+        if not self._latencies:
+            return None
+        handling = np.array(self._latencies) * 1000
+        total = handling + self.buffer_latency * 1000
+        return {
+            "count": len(handling),
+            "handling_mean": float(handling.mean()),
+            "handling_max": float(handling.max()),
+            "buffer": self.buffer_latency * 1000,
+            "total_mean": float(total.mean()),
+            "total_p95": float(np.percentile(total, 95)),
+        }
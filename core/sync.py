@@ -0,0 +1,290 @@
+"""
+Sync Client - Kirim progres kelas ke dashboard guru
+
+Progres dicatat sebagai penghitung delta ("stars_angka", "huruf/A/ok",
+"angka/3/fail", ...). add() dari game loop hanya menjumlah ke dict di
+bawah lock singkat; pengiriman berjalan di task asyncio pada thread
+terpisah sehingga frame tidak pernah menunggu jaringan.
+
+Setiap interval, delta yang terkumpul menjadi satu batch (JSON, gzip)
+yang dikirim lewat satu koneksi HTTP/1.1 keep-alive. Batch diberi nomor
+(session, seq) supaya server bisa membuang kiriman ulang; selama batch
+belum diterima, delta baru menunggu dan digabung ke batch berikutnya.
+Gagal kirim = coba lagi dengan backoff eksponensial. Batch yang belum
+terkirim disimpan ke file spool saat keluar dan dikirim di sesi berikut,
+sehingga game tetap bisa dipakai tanpa jaringan.
+
+Saat berhenti, batch dikirim terus sampai outbox dan delta tertunda habis
+atau satu kiriman gagal. Game menunggu paling lama stop_timeout detik;
+sisanya (termasuk batch yang masih di jalan) masuk spool.
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from urllib.parse import urlsplit
+
+SYNC_PATH = "/sync"
+STOP_TIMEOUT = 10.0  # Detik maksimal game menunggu kiriman terakhir saat keluar
+
+
+class SyncError(Exception):
+    """Server menolak batch atau balasan HTTP tidak valid"""
+
+
+def result_key(source, content, ok):
+    """Kunci delta hasil jawaban, mis. "huruf/A/ok" """
+    return f"{source}/{content}/{'ok' if ok else 'fail'}"
+
+
+class SyncClient:
+    def __init__(self, interval=5.0, timeout=5.0, max_backoff=60.0):
+        self.interval = interval
+        self.timeout = timeout
+        self.max_backoff = max_backoff
+
+        self.machine = None
+        self.session = uuid.uuid4().hex
+        self.host = None
+        self.port = None
+        self.path = SYNC_PATH
+        self.spool_path = None
+
+        # Delta baru (ditulis game loop) dan batch yang sedang dikirim
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._outbox = None
+        self._seq = 0
+
+        self._thread = None
+        self._loop = None
+        self._stop = None
+        self._reader = None
+        self._writer = None
+
+        self.batches = 0
+        self.raw_bytes = 0
+        self.sent_bytes = 0
+        self.retries = 0
+        self.connects = 0
+        self.online = False
+        self.last_error = None
+        self._upload_time = 0.0
+
+    @property
+    def active(self):
+        return self._thread is not None
+
+    def start(self, url, machine, spool_path=None):
+        """Mulai thread sync; url = http://host:port[/path]"""
+        if self._thread:
+            return
+        parts = urlsplit(url)
+        if parts.scheme != "http" or not parts.hostname:
+            raise ValueError(f"URL sync tidak didukung: {url}")
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.path = parts.path or SYNC_PATH
+        self.machine = machine
+        self.spool_path = spool_path
+        self._load_spool()
+
+        self._loop = asyncio.new_event_loop()
+        self._stop = asyncio.Event()
+        self._thread = threading.Thread(target=self._thread_main, name="progress-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=STOP_TIMEOUT):
+        """Kirim sisa delta sampai habis (paling lama timeout detik), sisanya ke spool"""
+        if not self._thread:
+            return
+        self._loop.call_soon_threadsafe(self._stop.set)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            # Jaringan macet: thread daemon dibiarkan, batch yang di jalan tetap di-spool
+            # (server membuang kiriman ganda lewat session/seq)
+            self.last_error = f"kiriman terakhir melewati {timeout:.0f} detik"
+        else:
+            self._loop.close()
+        self._thread = None
+        self._save_spool()
+
+    def add(self, key, amount=1):
+        """Tambah delta penghitung (murah, aman dipanggil dari game loop)"""
+        if self._thread is None:
+            return
+        with self._lock:
+            self._pending[key] = self._pending.get(key, 0) + amount
+
+    def pending(self):
+        """Jumlah kunci delta yang belum diterima server"""
+        with self._lock:
+            count = len(self._pending)
+            if self._outbox:
+                count += len(self._outbox["deltas"])
+        return count
+
+    def stats(self):
+        """Statistik sync: batch terkirim, rasio kompresi, retry, koneksi"""
+        return {
+            "batches": self.batches,
+            "pending": self.pending(),
+            "retries": self.retries,
+            "connects": self.connects,
+            "online": self.online,
+            "compression": self.sent_bytes / self.raw_bytes if self.raw_bytes else 0.0,
+            "upload_ms": self._upload_time / self.batches * 1000 if self.batches else 0.0,
+            "last_error": self.last_error,
+        }
+
+    # --- Thread asyncio ---
+
+    def _thread_main(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._run())
+
+    async def _run(self):
+        failures = 0
+        while not self._stop.is_set():
+            if failures:
+                # Backoff eksponensial dengan jitter supaya satu kelas tidak menyerbu bersamaan
+                delay = min(self.max_backoff, self.interval * 2 ** failures) * random.uniform(0.5, 1.0)
+            else:
+                delay = self.interval
+            try:
+                await asyncio.wait_for(self._stop.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+            if await self._flush():
+                failures = 0
+            else:
+                failures = min(failures + 1, 16)
+        # Berhenti: kirim juga delta yang menumpuk selama offline, bukan hanya outbox
+        while self.pending():
+            if not await self._flush():
+                break
+        await self._close()
+
+    async def _flush(self):
+        """Kirim batch yang tertunda; return False jika gagal"""
+        if self._outbox is None:
+            # Pindah pending -> outbox di bawah lock supaya spool tidak melihat delta di antara keduanya
+            with self._lock:
+                if not self._pending:
+                    return True
+                deltas, self._pending = self._pending, {}
+                self._seq += 1
+                self._outbox = {"machine": self.machine, "session": self.session,
+                                "seq": self._seq, "deltas": deltas}
+        start = time.perf_counter()
+        for attempt in range(2):
+            reused = self._writer is not None
+            try:
+                await self._post(self._outbox)
+                break
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, SyncError) as e:
+                await self._close()
+                # Koneksi keep-alive yang sudah ditutup server: sambung ulang sekali lagi
+                if attempt == 0 and reused and isinstance(e, (asyncio.IncompleteReadError, ConnectionError)):
+                    continue
+                self.online = False
+                self.last_error = str(e) or type(e).__name__
+                self.retries += 1
+                return False
+        self._upload_time += time.perf_counter() - start
+        with self._lock:
+            self._outbox = None
+        self.online = True
+        self.batches += 1
+        return True
+
+    async def _post(self, batch):
+        """POST satu batch lewat koneksi keep-alive (dibuka ulang jika putus)"""
+        raw = json.dumps(batch, separators=(",", ":")).encode("utf-8")
+        body = gzip.compress(raw)
+        if self._writer is None or self._writer.is_closing():
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port), self.timeout
+            )
+            self.connects += 1
+
+        header = (
+            f"POST {self.path} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            "Content-Type: application/json\r\n"
+            "Content-Encoding: gzip\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: keep-alive\r\n\r\n"
+        ).encode("ascii")
+        self._writer.write(header + body)
+        await asyncio.wait_for(self._writer.drain(), self.timeout)
+        status_line, headers, _ = await asyncio.wait_for(read_message(self._reader), self.timeout)
+        if headers.get("connection", "").lower() == "close":
+            await self._close()
+        parts = status_line.split(" ", 2)
+        if len(parts) < 2 or parts[1] != "200":
+            raise SyncError(status_line)
+        self.raw_bytes += len(raw)
+        self.sent_bytes += len(body)
+
+    async def _close(self):
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    # --- Spool offline ---
+
+    def _load_spool(self):
+        if not self.spool_path or not os.path.exists(self.spool_path):
+            return
+        try:
+            with open(self.spool_path) as f:
+                spool = json.load(f)
+        except (OSError, ValueError):
+            return
+        # Batch lama tetap memakai (session, seq) aslinya supaya tidak terhitung dua kali
+        self._outbox = spool.get("outbox")
+        for key, amount in spool.get("pending", {}).items():
+            self._pending[key] = self._pending.get(key, 0) + amount
+
+    def _save_spool(self):
+        if not self.spool_path:
+            return
+        with self._lock:
+            outbox, pending = self._outbox, dict(self._pending)
+        if outbox is None and not pending:
+            if os.path.exists(self.spool_path):
+                os.remove(self.spool_path)
+            return
+        os.makedirs(os.path.dirname(self.spool_path) or ".", exist_ok=True)
+        tmp = self.spool_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"outbox": outbox, "pending": pending}, f)
+        os.replace(tmp, self.spool_path)
+
+
+async def read_message(reader):
+    """Baca satu pesan HTTP/1.1 (request atau response): (baris awal, headers, body)"""
+    line = await reader.readline()
+    if not line:
+        raise asyncio.IncompleteReadError(line, None)
+    first = line.decode("latin-1").rstrip("\r\n")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", 0))
+    body = await reader.readexactly(length) if length else b""
+    return first, headers, body
@@ -0,0 +1,103 @@
+"""
+Transition - Perpindahan scene berbasis snapshot
+
+Scene lama ditangkap sekali ke surface offscreen. Selama transisi hanya
+scene baru yang dirender; snapshot cukup ditempel di atasnya (fade, slide,
+atau wipe). Persiapan scene baru dicicil beberapa langkah simulasi dengan
+batas waktu, lalu animasi maju dalam waktu simulasi (GameEngine.simulate).
+"""
+
+import time
+
+
+class Transition:
+    """Base class transisi; subclass mengisi composite()"""
+
+    def __init__(self, duration=0.4, budget_ms=4.0):
+        self.duration = duration
+        self.budget = budget_ms / 1000.0
+
+        self.snapshot = None
+        self.scene = None
+        self.elapsed = 0.0
+        self.ready = False
+        self.done = False
+        self._steps = None
+
+    def begin(self, backend, scene):
+        """Tangkap frame terakhir scene lama dan mulai persiapan scene baru"""
+        self.snapshot = backend.snapshot()
+        self.scene = scene
+        self._steps = scene.prepare()
+
+    def prepare_step(self):
+        """Jalankan langkah persiapan scene baru sampai budget frame habis"""
+        deadline = time.perf_counter() + self.budget
+        while not self.ready:
+            try:
+                next(self._steps)
+            except StopIteration:
+                self.ready = True
+                self._steps = None
+                break
+            if time.perf_counter() >= deadline:
+                break
+
+    def advance(self, dt):
+        """Satu langkah simulasi: persiapan scene baru dulu, lalu animasi"""
+        if not self.ready:
+            self.prepare_step()
+            return
+        self.elapsed += dt
+        if self.elapsed >= self.duration:
+            self.done = True
+            self.snapshot = None
+
+    @property
+    def progress(self):
+        """Posisi transisi 0..1 dengan ease-out"""
+        t = min(1.0, self.elapsed / self.duration) if self.ready else 0.0
+        return 1 - (1 - t) * (1 - t)
+
+    def scene_offset(self, width, height):
+        """Geseran render scene baru (default: tidak digeser)"""
+        return 0, 0
+
+    def render(self, renderer, width, height):
+        """Gambar snapshot di atas frame scene baru"""
+        if self.snapshot is None:
+            return
+        self.composite(renderer, self.progress, width, height)
+
+    def composite(self, renderer, t, width, height):
+        raise NotImplementedError
+
+
+class FadeTransition(Transition):
+    """Scene lama memudar"""
+
+    def composite(self, renderer, t, width, height):
+        renderer.draw_image(self.snapshot, alpha=1.0 - t)
+
+
+class SlideTransition(Transition):
+    """Scene lama bergeser keluar layar (direction 1 = ke kiri, -1 = ke kanan)"""
+
+    def __init__(self, duration=0.4, budget_ms=4.0, direction=1):
+        super().__init__(duration, budget_ms)
+        self.direction = direction
+
+    def scene_offset(self, width, height):
+        # Scene baru masuk dari sisi berlawanan
+        return self.direction * (1.0 - self.progress) * width, 0
+
+    def composite(self, renderer, t, width, height):
+        renderer.draw_image(self.snapshot, -self.direction * t * width, 0)
+
+
+class WipeTransition(Transition):
+    """Scene baru tersingkap dari kiri ke kanan"""
+
+    def composite(self, renderer, t, width, height):
+        edge = t * width
+        renderer.draw_image(self.snapshot, clip=(edge, 0, width - edge, height))
@@ -0,0 +1,278 @@
+"""
+Tween Engine - Animasi terpusat berbasis array
+
+Komponen mendaftarkan tween (nilai atribut menuju target dengan kurva
+easing). Semua tween aktif dihitung bersama dalam satu langkah numpy,
+lalu tween yang sudah diam otomatis dibuang.
+
+Nilai sebelum langkah terakhir juga disimpan, sehingga render di antara
+dua langkah simulasi tetap (lihat GameEngine.simulate) bisa memakai nilai
+interpolasi lewat interpolate() lalu restore(). Atribut yang diubah
+langsung di update() (bukan lewat tween, mis. posisi partikel) bisa ikut
+diinterpolasi dengan track().
+"""
+
+import math
+import weakref
+import numpy as np
+
+# Kurva easing
+LINEAR = 0
+EASE_OUT_QUAD = 1
+EASE_IN_OUT_SINE = 2
+EASE_OUT_BACK = 3
+EASE_OUT_ELASTIC = 4
+
+# Mode tween
+MODE_TIMED = 0      # start -> end dalam durasi tertentu
+MODE_APPROACH = 1   # mendekati target secara eksponensial (tanpa durasi)
+
+# Laju approach yang setara dengan "x *= 0.9" per frame pada 60 FPS
+DAMPING_RATE = -math.log(0.9) * 60
+
+SETTLE_EPSILON = 1e-3
+
+
+def ease(t, easing):
+    """Terapkan kurva easing secara vektor (t dan easing berupa array)"""
+    result = t.copy()
+    mask = easing == EASE_OUT_QUAD
+    if mask.any():
+        x = t[mask]
+        result[mask] = 1 - (1 - x) * (1 - x)
+    mask = easing == EASE_IN_OUT_SINE
+    if mask.any():
+        result[mask] = -(np.cos(np.pi * t[mask]) - 1) / 2
+    mask = easing == EASE_OUT_BACK
+    if mask.any():
+        x = t[mask] - 1
+        c1 = 1.70158
+        result[mask] = 1 + (c1 + 1) * x * x * x + c1 * x * x
+    mask = easing == EASE_OUT_ELASTIC
+    if mask.any():
+        x = t[mask]
+        c4 = 2 * np.pi / 3
+        result[mask] = np.where(
+            (x <= 0) | (x >= 1), x,
+            np.power(2, -10 * x) * np.sin((x * 10 - 0.75) * c4) + 1
+        )
+    return result
+
+
+class TweenEngine:
+    def __init__(self, capacity=64):
+        self.count = 0
+        self._allocate(capacity)
+        # Slot -> (obj, attr) dan (id(obj), attr) -> slot
+        self._targets = []
+        self._slots = {}
+        # Atribut yang di-track: obj -> {attr: nilai sebelum langkah terakhir}
+        self._tracked = weakref.WeakKeyDictionary()
+        self._saved = []  # (obj, attr, nilai simulasi) selama render interpolasi
+
+    def _allocate(self, capacity):
+        """Alokasi (atau perbesar) array state tween"""
+        old = getattr(self, "_value", None)
+        fields = {
+            "_value": np.float64, "_previous": np.float64, "_start": np.float64, "_end": np.float64,
+            "_duration": np.float64, "_elapsed": np.float64, "_rate": np.float64,
+            "_easing": np.int8, "_mode": np.int8, "_loop": np.bool_, "_yoyo": np.bool_,
+        }
+        for name, dtype in fields.items():
+            array = np.zeros(capacity, dtype=dtype)
+            if old is not None:
+                array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    @property
+    def animating(self):
+        """True jika masih ada tween yang berjalan"""
+        return self.count > 0
+
+    def _slot_for(self, obj, attr):
+        """Ambil slot yang sudah ada untuk atribut ini, atau buat baru"""
+        key = (id(obj), attr)
+        index = self._slots.get(key)
+        if index is not None and self._targets[index][0] is obj:
+            return index
+
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        index = self.count
+        self.count += 1
+        self._targets.append((obj, attr))
+        self._slots[key] = index
+        return index
+
+    def to(self, obj, attr, end, duration, easing=EASE_OUT_QUAD, loop=False, yoyo=False):
+        """Animasikan obj.attr dari nilai sekarang ke end dalam duration detik"""
+        index = self._slot_for(obj, attr)
+        value = getattr(obj, attr)
+        self._value[index] = value
+        self._previous[index] = value
+        self._start[index] = value
+        self._end[index] = end
+        self._duration[index] = max(duration, 1e-6)
+        self._elapsed[index] = 0.0
+        self._easing[index] = easing
+        self._mode[index] = MODE_TIMED
+        self._loop[index] = loop
+        self._yoyo[index] = yoyo
+
+    def approach(self, obj, attr, target, rate):
+        """Dekati target secara eksponensial: sisa jarak * exp(-rate * dt)"""
+        key = (id(obj), attr)
+        index = self._slots.get(key)
+        if (index is not None and self._mode[index] == MODE_APPROACH
+                and self._end[index] == target and self._targets[index][0] is obj):
+            # Target sama: cukup ubah laju
+            self._rate[index] = rate
+            return
+
+        value = getattr(obj, attr)
+        if abs(value - target) < SETTLE_EPSILON and index is None:
+            setattr(obj, attr, target)
+            return
+
+        index = self._slot_for(obj, attr)
+        self._value[index] = value
+        self._previous[index] = value
+        self._end[index] = target
+        self._rate[index] = rate
+        self._mode[index] = MODE_APPROACH
+        self._duration[index] = 1.0
+        self._elapsed[index] = 0.0
+        self._loop[index] = False
+
+    def cancel(self, obj, attr=None):
+        """Hentikan tween pada obj (satu atribut atau semuanya)"""
+        remove = np.zeros(self.count, dtype=np.bool_)
+        for i, (target, name) in enumerate(self._targets):
+            if target is obj and (attr is None or name == attr):
+                remove[i] = True
+        if remove.any():
+            self._compact(remove)
+
+    def track(self, obj, *attrs):
+        """Interpolasikan atribut yang diubah langsung di update() saat render
+        
+        Dilepas otomatis saat obj tidak dipakai lagi (weak reference).
+        """
+        previous = self._tracked.setdefault(obj, {})
+        for attr in attrs:
+            previous[attr] = getattr(obj, attr)
+
+    def snap(self, obj, attr):
+        """Lompatan (mis. partikel kembali ke atas layar): jangan diinterpolasi"""
+        previous = self._tracked.get(obj)
+        if previous is not None and attr in previous:
+            previous[attr] = getattr(obj, attr)
+
+    def override(self, obj, attr, value):
+        """Nilai khusus render (mis. posisi prediksi pointer); dikembalikan restore()"""
+        self._saved.append((obj, attr, getattr(obj, attr)))
+        setattr(obj, attr, value)
+
+    def clear(self):
+        """Buang semua tween"""
+        self.count = 0
+        self._targets = []
+        self._slots = {}
+
+    def step(self, dt):
+        """Majukan semua tween aktif sekaligus"""
+        for obj, previous in self._tracked.items():
+            for attr in previous:
+                previous[attr] = getattr(obj, attr)
+
+        n = self.count
+        if n == 0:
+            return
+
+        value = self._value[:n]
+        end = self._end[:n]
+        elapsed = self._elapsed[:n]
+        duration = self._duration[:n]
+        loop = self._loop[:n]
+        approach = self._mode[:n] == MODE_APPROACH
+        timed = ~approach
+
+        self._previous[:n] = value
+        elapsed += dt
+
+        # Tween berdurasi: hitung posisi t (dengan loop/yoyo)
+        t = elapsed / duration
+        cycles = np.floor(t)
+        t = np.where(loop, t - cycles, np.minimum(t, 1.0))
+        reverse = loop & self._yoyo[:n] & (cycles % 2 == 1)
+        t = np.where(reverse, 1.0 - t, t)
+        eased = ease(t, self._easing[:n])
+        start = self._start[:n]
+        timed_value = start + (end - start) * eased
+
+        # Tween approach: peluruhan eksponensial, independen dari frame rate
+        decay = np.exp(-self._rate[:n] * dt)
+        approach_value = end + (value - end) * decay
+
+        value[:] = np.where(approach, approach_value, timed_value)
+
+        settled = ~loop & (
+            (timed & (elapsed >= duration)) |
+            (approach & (np.abs(value - end) < SETTLE_EPSILON))
+        )
+        value[settled] = end[settled]
+
+        # Tulis balik ke atribut komponen
+        targets = self._targets
+        for i in range(n):
+            obj, attr = targets[i]
+            setattr(obj, attr, float(value[i]))
+
+        if settled.any():
+            self._compact(settled)
+    
+    def interpolate(self, alpha):
+        """Tulis nilai antara langkah sebelumnya dan sekarang (0..1) untuk render"""
+        saved = self._saved
+        for obj, previous in self._tracked.items():
+            for attr, before in previous.items():
+                value = getattr(obj, attr)
+                if value != before:
+                    saved.append((obj, attr, value))
+                    setattr(obj, attr, before + (value - before) * alpha)
+
+        n = self.count
+        if n == 0:
+            return
+        previous = self._previous[:n]
+        blended = previous + (self._value[:n] - previous) * alpha
+        targets = self._targets
+        for i in range(n):
+            obj, attr = targets[i]
+            setattr(obj, attr, float(blended[i]))
+    
+    def restore(self):
+        """Kembalikan nilai simulasi sekarang setelah render interpolasi"""
+        for obj, attr, value in reversed(self._saved):
+            setattr(obj, attr, value)
+        self._saved.clear()
+        targets = self._targets
+        value = self._value
+        for i in range(self.count):
+            obj, attr = targets[i]
+            setattr(obj, attr, float(value[i]))
+
+    def _compact(self, remove):
+        """Buang slot yang ditandai, geser sisanya ke depan"""
+        keep = np.nonzero(~remove)[0]
+        for name in ("_value", "_previous", "_start", "_end", "_duration", "_elapsed",
+                     "_rate", "_easing", "_mode", "_loop", "_yoyo"):
+            array = getattr(self, name)
+            array[:len(keep)] = array[keep]
+
+        self._targets = [self._targets[i] for i in keep]
+        self.count = len(keep)
+        self._slots = {
+            (id(obj), attr): i for i, (obj, attr) in enumerate(self._targets)
+        }
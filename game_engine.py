@@ -2,83 +2,271 @@
 Game Engine - Mengelola scenes, events, dan rendering
 """
 
+import time
 import pygame
-import cairo
-import numpy as np
+from core.render_backend import create_backend
+from core.analytics import EventRecorder
+from core.assets import AssetLibrary
+from core.capture import FrameCapture
+from core.latency import LatencyMonitor
+from core.memory import MemoryProfiler
+from core.scheduler import JobScheduler, PRIORITY_HIGH
+from core.pointer import PointerTracker, POINTER_DOWN, POINTER_UP
+from core.sound import SoundManager
+from core.sync import SyncClient
+from core.tween import TweenEngine
+
+# Event yang membatalkan late latch: urutannya terhadap gerak harus dijaga
+LATCH_BARRIERS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.FINGERDOWN, pygame.FINGERUP)
+
+# Laju simulasi tetap (langkah update per detik), terlepas dari laju render
+SIM_RATE = 60
 
 class GameEngine:
-    def __init__(self, width, height, fps):
+    def __init__(self, width, height, fps, backend="cairo", render_threads=None, sim_rate=SIM_RATE):
         self.width = width
         self.height = height
-        self.fps = fps
+        self.fps = fps  # Batas laju render
+        
+        # Simulasi fixed-timestep: waktu nyata dikumpulkan lalu dihabiskan per sim_dt
+        self.sim_dt = 1.0 / sim_rate
+        self.sim_steps = 0
+        self.accumulator = 0.0
+        self.alpha = 0.0  # Posisi render di antara dua state simulasi (0..1)
+        self.frame_time = 0.0  # Waktu update + render frame terakhir (tanpa job latar)
         
         # Pygame setup
         self.screen = pygame.display.set_mode((width, height))
         pygame.display.set_caption("Petualangan Angka & Huruf")
         self.clock = pygame.time.Clock()
         
-        # Cairo surface setup untuk rendering smooth
-        self.cairo_surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
-        self.cairo_context = cairo.Context(self.cairo_surface)
+        # Render backend (Cairo atau pygame native)
+        self.backend = create_backend(backend, width, height, self.screen, render_threads)
         
         # Scene management
         self.scenes = {}
         self.current_scene = None
         self.running = True
+        self.needs_redraw = True
+        self.transition = None
+        
+        # Mouse & sentuhan multi-jari sebagai pointer ber-ID
+        self.pointers = PointerTracker(width, height)
+        
+        # Latensi input-ke-layar selalu diukur; late latch/prediksi opsional
+        self.latency = LatencyMonitor()
+        
+        # Gambar vektor (apel, bintang, hewan, bentuk) dengan raster cache bersama
+        self.assets = AssetLibrary()
+        
+        # Sprite tile/tombol prebuilt di disk (dimuat dari main.py, lihat core/atlas.py)
+        self.atlas = None
+        
+        # Semua animasi komponen dimajukan bersama di sini
+        self.tweens = TweenEngine()
+        
+        # Job latar (generator) dicicil di sisa anggaran tiap frame
+        self.jobs = JobScheduler()
         
         # Game state untuk menyimpan progress
         self.game_state = {
             "stars_angka": 0,
             "stars_huruf": 0,
+            "stars_hitung": 0,
+            "tier_hitung": 0,
             "level_unlocked": 1
         }
+        
+        # Pencatat event pembelajaran (thread flush dimulai dari main.py)
+        self.analytics = EventRecorder()
+        
+        # Efek suara (warm-up dimulai dari main.py setelah mixer siap)
+        self.sound = SoundManager()
+        
+        # Sync progres ke dashboard guru (aktif hanya jika dimulai dengan --sync-url)
+        self.sync = SyncClient()
+        
+        # Perekam sesi (aktif hanya jika dimulai dengan --capture)
+        self.capture = FrameCapture(width, height)
+        
+        # Profil memori per scene (aktif hanya jika dimulai dengan --profile-memory)
+        self.memory = MemoryProfiler()
     
     def register_scene(self, name, scene):
         """Register scene baru"""
         self.scenes[name] = scene
     
-    def change_scene(self, name):
-        """Pindah ke scene lain"""
+    def change_scene(self, name, transition=None):
+        """Pindah ke scene lain (opsional dengan transisi)"""
         if name in self.scenes:
             if self.current_scene:
                 self.current_scene.exit()
+            self.pointers.release_all()
             self.current_scene = self.scenes[name]
-            self.current_scene.enter()
+            self.needs_redraw = True
+            self.checkpoint_memory(name)
+            
+            if transition is None:
+                self.transition = None
+                self.current_scene.enter()
+            else:
+                # Frame terakhir scene lama masih ada di buffer backend
+                transition.begin(self.backend, self.current_scene)
+                self.transition = transition
+                self.tweens.track(transition, "elapsed")
+    
+    def checkpoint_memory(self, name):
+        """Snapshot memori (jika --profile-memory) dan cetak selisih sejak checkpoint sebelumnya"""
+        if self.memory.active:
+            report = self.memory.checkpoint(name)
+            if report:
+                print(self.memory.format_report(report))
     
     def run(self):
         """Main game loop"""
         while self.running:
             dt = self.clock.tick(self.fps) / 1000.0  # Delta time in seconds
-            
-            # Handle events
-            events = pygame.event.get()
-            for event in events:
-                if event.type == pygame.QUIT:
-                    self.running = False
-                
-                # Pass events to current scene
-                if self.current_scene:
-                    self.current_scene.handle_event(event)
-            
-            # Update current scene
-            if self.current_scene:
-                self.current_scene.update(dt)
-            
-            # Clear Cairo surface
-            self.cairo_context.set_source_rgb(1, 1, 1)
-            self.cairo_context.paint()
-            
-            # Render current scene
-            if self.current_scene:
-                self.current_scene.render(self.cairo_context)
-            
-            # Convert Cairo surface to Pygame surface
-            buf = self.cairo_surface.get_data()
-            image = pygame.image.frombuffer(buf, (self.width, self.height), 'ARGB')
-            self.screen.blit(image, (0, 0))
-            
-            # Update display
-            pygame.display.flip()
+            self.step(dt, pygame.event.get())
+    
+    def step(self, dt, events):
+        """Satu iterasi game loop; return True jika frame dirender
+        
+        Dipisah dari run() supaya bisa dijalankan headless (soak test).
+        Sisa anggaran frame (1/fps) setelah update & render dipakai job latar;
+        waktu frame tanpa job latar tersimpan di frame_time.
+        """
+        frame_start = time.perf_counter()
+        rendered = self._step(dt, events)
+        self.frame_time = time.perf_counter() - frame_start
+        self.jobs.run(1.0 / self.fps - self.frame_time)
+        return rendered
+    
+    def _step(self, dt, events):
+        # Handle events
+        for event in events:
+            if event.type == pygame.QUIT:
+                self.running = False
+            self._dispatch(event)
+        
+        # Simulasi dengan langkah tetap (termasuk transisi); semua langkah yang
+        # tertunda selalu dijalankan, di mesin lambat yang dilewati hanya render-nya
+        animating = self.transition is not None
+        self.accumulator += dt
+        while self.accumulator >= self.sim_dt - 1e-9:
+            # (dicatat sebelum step: tween yang baru selesai tetap perlu digambar)
+            animating = animating or self.tweens.animating
+            self.simulate(self.sim_dt)
+            self.accumulator -= self.sim_dt
+        self.accumulator = max(self.accumulator, 0.0)
+        self.alpha = self.accumulator / self.sim_dt
+        animating = animating or self.tweens.animating
+        
+        # Semua diam dan tidak ada input: frame sebelumnya masih valid
+        if not (events or self.needs_redraw or animating or
+                (self.current_scene and self.current_scene.is_animating())):
+            if self.capture.active:
+                # Rekaman tetap satu frame per iterasi: ulangi frame sebelumnya
+                self.capture.repeat()
+            return False
+        self.needs_redraw = False
+        
+        if self.latency.late_latch:
+            self._late_latch()
+        # Nilai tween digambar di antara state sebelumnya dan sekarang
+        self.tweens.interpolate(self.alpha)
+        try:
+            if self.latency.late_latch and self.latency.predict_ms:
+                self._predict()
+            self.render_frame()
+        finally:
+            self.tweens.restore()
+        return True
+    
+    def simulate(self, dt):
+        """Satu langkah simulasi tetap: animasi, transisi, lalu logika scene
+        
+        Transisi (persiapan scene baru lalu animasinya) maju per langkah
+        simulasi, jadi jumlah langkah sebelum scene baru mulai di-update
+        tidak bergantung pada laju render.
+        """
+        self.sim_steps += 1
+        self.tweens.step(dt)
+        transition = self.transition
+        if transition:
+            transition.advance(dt)
+            if transition.done:
+                self.transition = None
+        if self.current_scene and (not self.transition or self.transition.ready):
+            self.current_scene.update(dt)
+    
+    def _dispatch(self, event):
+        """Kirim satu event pygame (dan versi pointer-nya) ke scene aktif"""
+        pointer = self.pointers.translate(event)
+        if pointer is not None and pointer.kind == POINTER_DOWN:
+            self.sound.mark_input()
+        
+        # Pass events to current scene (input diabaikan selama transisi)
+        if self.current_scene and not self.transition:
+            self.current_scene.handle_event(event)
+            if pointer is not None:
+                self.current_scene.handle_pointer(pointer)
+                self.latency.note_input(pointer)
+        if pointer is not None and pointer.kind == POINTER_UP:
+            self.pointers.release(pointer.id)
+        self.sound.end_input()
+    
+    def _late_latch(self):
+        """Terapkan gerakan pointer terbaru tepat sebelum render
+        
+        Hanya event gerak yang diambil lebih awal; jika ada tekanan atau
+        pelepasan yang menunggu, semuanya diproses berurutan di frame
+        berikutnya (gerak sebelum DOWN akan hilang karena pointer belum
+        di-capture).
+        """
+        if self.transition or not self.current_scene:
+            return
+        if not pygame.event.peek(LATCH_BARRIERS):
+            for event in pygame.event.get((pygame.MOUSEMOTION, pygame.FINGERMOTION)):
+                self._dispatch(event)
+    
+    def _predict(self):
+        """Gambar benda yang di-drag di posisi pointer prediksi
+        
+        Posisi tampilan saja (tweens.override, dikembalikan restore()):
+        state simulasi tetap memakai posisi pointer yang nyata.
+        """
+        if self.transition or not self.current_scene:
+            return
+        for pointer in self.pointers.predicted_moves(self.latency.predict_ms / 1000.0):
+            owner = self.pointers.owner(pointer.id)
+            if owner is None or not owner.dragging or owner.pointer != pointer.id:
+                continue
+            x, y = owner.drag_position(pointer)
+            self.tweens.override(owner, "x", x)
+            self.tweens.override(owner, "y", y)
+    
+    def render_frame(self):
+        """Render satu frame scene (atau transisi) lalu tampilkan"""
+        self.backend.begin_frame()
+        if self.transition:
+            self._render_transition()
+        elif self.current_scene:
+            self.current_scene.render(self.backend)
+        self.backend.present(self.screen)
+        self.latency.presented()
+        if self.capture.active:
+            self.capture.submit(self.backend.frame_bytes())
+    
+    def _render_transition(self):
+        """Render scene baru + snapshot scene lama"""
+        backend = self.backend
+        transition = self.transition
+        if transition.ready:
+            dx, dy = transition.scene_offset(self.width, self.height)
+            backend.push_offset(dx, dy)
+            self.current_scene.render(backend)
+            backend.pop_offset()
+        transition.render(backend, self.width, self.height)
     
     def quit(self):
         """Stop game loop"""
@@ -88,23 +276,96 @@ class Scene:
     """Base class untuk semua scene"""
     def __init__(self, engine):
         self.engine = engine
+        self.backdrop = None  # Backdrop beku selama overlay modal
+        self.round_job = None  # Persiapan ronde berikutnya di engine.jobs
     
     def enter(self):
         """Dipanggil saat scene dimulai"""
         pass
     
+    def prepare(self):
+        """Generator persiapan scene untuk transisi; tiap yield = satu langkah
+        
+        Default: enter() dijalankan sekaligus dalam satu langkah.
+        """
+        self.enter()
+        yield
+    
     def exit(self):
         """Dipanggil saat scene berakhir"""
         pass
     
+    def start_round(self, steps):
+        """Siapkan ronde berikutnya sebagai job (dicicil di sisa waktu frame)
+        
+        Dipakai antar-ronde di dalam update(), supaya pembuatan puzzle tidak
+        dijalankan sekaligus dalam satu frame.
+        """
+        self.cancel_round()
+        name = f"{type(self).__name__}.round"
+        # Ronde yang di-reset lewat sini tidak melewati change_scene: checkpoint sendiri
+        self.engine.checkpoint_memory(name)
+        self.round_job = self.engine.jobs.submit(steps, name=name, priority=PRIORITY_HIGH)
+    
+    def cancel_round(self):
+        """Batalkan persiapan ronde yang belum selesai (mis. saat keluar scene)"""
+        if self.round_job is not None:
+            self.round_job.cancel()
+            self.round_job = None
+    
+    @property
+    def round_pending(self):
+        """True selama persiapan ronde berikutnya masih berjalan"""
+        job = self.round_job
+        return job is not None and not job.done and not job.cancelled
+    
+    def atlas_buttons(self):
+        """Semua tombol (Button) yang bisa muncul, untuk sprite atlas"""
+        return []
+    
+    def atlas_tiles(self):
+        """Semua varian tile (DraggableObject) yang bisa muncul, untuk sprite atlas"""
+        return []
+    
     def handle_event(self, event):
         """Handle pygame events"""
         pass
     
+    def handle_pointer(self, pointer):
+        """Handle mouse/sentuhan (PointerEvent dari core/pointer.py)"""
+        pass
+    
     def update(self, dt):
         """Update logic"""
         pass
     
-    def render(self, ctx):
-        """Render dengan Cairo context"""
-        pass
\ No newline at end of file
+    def is_animating(self):
+        """Return False jika scene diam sehingga render boleh dilewati"""
+        return True
+    
+    def render(self, renderer):
+        """Render lewat RenderBackend (lihat core/render_backend.py)"""
+        pass
+    
+    def render_scene(self, renderer):
+        """Render isi scene tanpa overlay modal (dipakai untuk backdrop)"""
+        pass
+    
+    def begin_overlay(self, dim=0.7):
+        """Render scene sekali ke backdrop yang digelapkan
+        
+        Selama overlay aktif, frame cukup menempel backdrop ini lalu
+        menggambar isi overlay; scene di bawahnya tidak dirender ulang.
+        """
+        self.backdrop = self.engine.backend.render_offscreen(self.render_scene, dim)
+    
+    def end_overlay(self):
+        """Kembali ke render normal"""
+        self.backdrop = None
+    
+    def render_backdrop(self, renderer):
+        """Tempel backdrop; return False jika tidak ada overlay aktif"""
+        if self.backdrop is None:
+            return False
+        renderer.draw_image(self.backdrop, opaque=True)
+        return True
\ No newline at end of file
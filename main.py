@@ -3,30 +3,91 @@ Game Edukatif Anak TK - Petualangan Angka & Huruf
 Main Entry Point
 """
 
+import argparse
 import pygame
+import socket
 import sys
 from scenes.menu import MenuScene
 from scenes.level_angka import LevelAngkaScene
 from scenes.level_huruf import LevelHurufScene
+from scenes.level_hitung import LevelHitungScene
 from game_engine import GameEngine
+from core import sound
+from core.atlas import ensure_atlas
+from core.capture import FORMATS as CAPTURE_FORMATS
+from core.render_backend import BACKENDS
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Petualangan Angka & Huruf")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="cairo",
+                        help="renderer: cairo (default), cairo-tiled (paralel, untuk layar 4K) "
+                             "atau pygame (native, lebih ringan)")
+    parser.add_argument("--fps", type=int, default=60,
+                        help="batas frame render per detik (simulasi selalu 60 langkah per detik)")
+    parser.add_argument("--render-threads", type=int, default=None,
+                        help="jumlah thread untuk cairo-tiled (default: jumlah core)")
+    parser.add_argument("--capture", metavar="DIR",
+                        help="rekam sesi ke folder DIR (encoder berjalan di proses terpisah)")
+    parser.add_argument("--capture-format", choices=CAPTURE_FORMATS, default="png",
+                        help="png = deretan PNG, raw = stream video BGRA mentah")
+    parser.add_argument("--latency-mode", action="store_true",
+                        help="baca ulang posisi pointer tepat sebelum render (drag lebih responsif)")
+    parser.add_argument("--predict-ms", type=float, default=0.0,
+                        help="prediksi posisi drag sejauh N ms dari kecepatan terakhir (butuh --latency-mode)")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="bandingkan snapshot memori tiap kali scene dimasuki")
+    parser.add_argument("--sync-url", metavar="URL",
+                        help="kirim progres ke server kelas, mis. http://guru-pc:8765 "
+                             "(lihat tools/sync_server.py)")
+    parser.add_argument("--sync-id", default=socket.gethostname(),
+                        help="nama komputer ini di dashboard guru (default: hostname)")
+    return parser.parse_args(argv)
 
 def main():
-    # Initialize Pygame
+    args = parse_args()
+    
+    # Initialize Pygame (mixer dengan buffer kecil untuk latensi rendah)
+    sound.pre_init()
     pygame.init()
-    pygame.mixer.init()
+    try:
+        pygame.mixer.init()
+    except pygame.error:
+        print("Audio tidak tersedia, game berjalan tanpa suara")
     
     # Game configuration
     SCREEN_WIDTH = 1024
     SCREEN_HEIGHT = 768
-    FPS = 60
+    FPS = args.fps
+    ANALYTICS_LOG = "logs/analytics.evlog"
+    ATLAS_PATH = "cache/sprites.atlas"
+    SYNC_SPOOL = "logs/sync_spool.json"
     
     # Create game engine
-    engine = GameEngine(SCREEN_WIDTH, SCREEN_HEIGHT, FPS)
+    engine = GameEngine(SCREEN_WIDTH, SCREEN_HEIGHT, FPS, backend=args.backend,
+                        render_threads=args.render_threads)
     
     # Register scenes
     engine.register_scene("menu", MenuScene(engine))
     engine.register_scene("level_angka", LevelAngkaScene(engine))
     engine.register_scene("level_huruf", LevelHurufScene(engine))
+    engine.register_scene("level_hitung", LevelHitungScene(engine))
+    
+    # Sprite tile & tombol prebuilt (jika basi, dibangun ulang di thread latar)
+    engine.atlas = ensure_atlas(engine, ATLAS_PATH, background=True)
+    
+    # Start analytics log & decode sounds in background
+    engine.analytics.start(ANALYTICS_LOG)
+    engine.sound.warm_up()
+    if args.capture:
+        engine.capture.start(args.capture, args.capture_format)
+    
+    if args.sync_url:
+        engine.sync.start(args.sync_url, args.sync_id, SYNC_SPOOL)
+    
+    if args.profile_memory:
+        engine.memory.start()
+    engine.latency.late_latch = args.latency_mode
+    engine.latency.predict_ms = args.predict_ms if args.latency_mode else 0.0
     
     # Start with menu scene
     engine.change_scene("menu")
@@ -35,6 +96,34 @@ def main():
     engine.run()
     
     # Cleanup
+    engine.jobs.shutdown()
+    if engine.jobs.stats()["jobs"]:
+        print(engine.jobs.format_stats())
+    engine.analytics.stop()
+    if engine.capture.active:
+        engine.capture.stop()
+        stats = engine.capture.stats()
+        print(f"Capture: {stats['captured']}/{stats['submitted']} frame terekam, "
+              f"{stats['repeated']} diulang (scene diam), "
+              f"{stats['dropped']} dibuang ({stats['drop_rate'] * 100:.1f}%), "
+              f"salin rata-rata {stats['copy_ms']:.2f} ms")
+    if engine.sync.active:
+        engine.sync.stop()
+        stats = engine.sync.stats()
+        status = "semua terkirim" if not stats["pending"] else f"{stats['pending']} delta disimpan untuk sesi berikut"
+        print(f"Sync: {stats['batches']} batch terkirim, {stats['retries']} retry, {status}")
+    if engine.memory.active:
+        print(engine.memory.summary())
+        engine.memory.stop()
+    stats = engine.latency.stats()
+    if stats:
+        mode = "aktif" if engine.latency.late_latch else "nonaktif"
+        print(f"Latensi input-ke-layar (mode latensi {mode}): rata-rata {stats['mean']:.1f} ms, "
+              f"p95 {stats['p95']:.1f} ms ({stats['count']} frame)")
+    stats = engine.sound.latency_stats()
+    if stats:
+        print(f"Latensi klik-ke-audio: rata-rata {stats['total_mean']:.1f} ms, "
+              f"p95 {stats['total_p95']:.1f} ms ({stats['count']} klik)")
     pygame.quit()
     sys.exit()
 
@@ -0,0 +1,384 @@
+"""
+Level Hitung - Menghitung benda
+
+Setiap keranjang meminta sejumlah benda tertentu (mis. 4 apel); anak
+menyeret benda yang tepat dari lapangan ke keranjang. Tingkat kesulitan
+menentukan jumlah keranjang, angka terbesar dan total benda (20-50).
+
+Benda di layar jauh lebih banyak daripada tile di level lain, jadi tidak
+ada loop per benda di setiap frame: benda digambar sebagai AssetNode
+(raster dibagi lewat AssetLibrary), hanya benda yang sedang di-drag atau
+beranimasi yang di-update, dan hit-test hanya dilakukan saat ditekan.
+Hit-test & pilihan keranjang memakai bentuk asli benda (core/hittest.py),
+bukan kotak pembungkusnya.
+"""
+
+import cairo
+import random
+import time
+from game_engine import Scene
+from components.button import Button
+from components.draggable import DraggableObject
+from core.assets import ASSET_SIZE
+from core.scheduler import PRIORITY_LOW
+from core.tween import EASE_IN_OUT_SINE
+from core.transition import FadeTransition, SlideTransition
+from core.pointer import POINTER_DOWN
+from core.sync import result_key
+from core.scene_graph import SceneGraph, Node, TextNode, TargetNode, ButtonNode, AssetNode
+from core.analytics import (
+    encode_content, SOURCE_HITUNG,
+    EVENT_DRAG_START, EVENT_DROP, EVENT_SNAP_OK, EVENT_SNAP_FAIL,
+    EVENT_TIME_TO_SOLVE, EVENT_ROUND_COMPLETE,
+)
+
+# Tingkat kesulitan: jumlah keranjang, angka terbesar, total benda di lapangan
+TIERS = (
+    {"baskets": 2, "max_count": 5, "items": 20},
+    {"baskets": 3, "max_count": 7, "items": 35},
+    {"baskets": 4, "max_count": 10, "items": 50},
+)
+
+KINDS = ("apel", "bintang", "ikan", "kucing", "bola")
+
+ITEM_SIZE = 56
+PLACED_SCALE = 0.6      # Benda mengecil saat masuk keranjang
+SLOT_SPACING = 40
+SLOT_COLUMNS = 5
+BASKET_WIDTH = 220
+BASKET_HEIGHT = 150
+BASKET_Y = 120
+FIELD_TOP = 300
+FIELD_CELL = 62
+MOVE_TIME = 0.25
+BACK_BUTTON = (50, 30, 150, 60, "← Kembali", (120, 160, 220))  # x, y, lebar, tinggi, teks, warna
+ICON_SCALE = 0.4        # Ikon jenis benda di pojok kiri atas keranjang
+DROP_OVERLAP = 0.3      # Bagian benda minimal di dalam keranjang agar dihitung masuk
+
+
+class LevelHitungScene(Scene):
+    def __init__(self, engine, tier=None):
+        super().__init__(engine)
+        self.tier = tier  # None = ikuti progres di game_state
+        self.items = []
+        self.baskets = []
+        self.moving = set()  # Benda yang di-drag atau masih beranimasi
+        self.back_button = None
+        self.score = 0
+        self.max_score = 0
+        self.celebration_timer = 0
+        self.celebration_scale = 1.0
+        self.puzzle_start = 0
+        self.graph = None
+
+    def enter(self):
+        """Setup level saat scene dimulai"""
+        for _ in self.prepare():
+            pass
+
+    def prepare(self):
+        """Setup level bertahap (dicicil per frame saat transisi)"""
+        self.items = []
+        self.baskets = []
+        self.moving = set()
+        self.score = 0
+        self.celebration_timer = 0
+        self.end_overlay()
+
+        # Retained scene graph: judul, keranjang, benda, skor, tombol
+        self.graph = SceneGraph(self.engine.width, self.engine.height, self.engine.atlas)
+        title = self.graph.add(TextNode("Hitung dan masukkan ke keranjang!", 36, shadow=3))
+        title.place((self.engine.width - title.text_width()) / 2, 95)
+        self.basket_layer = self.graph.add(Node())
+        self.item_layer = self.graph.add(Node())
+        self.score_node = self.graph.add(TextNode("", 32))
+
+        # Create back button
+        self.back_button = Button(*BACK_BUTTON, tweens=self.engine.tweens)
+        self.back_button.on_click = lambda: self.engine.change_scene(
+            "menu", SlideTransition(direction=-1)
+        )
+        self.back_button.on_press = lambda: self.engine.sound.play("click")
+        self.graph.add(ButtonNode(self.back_button))
+        yield
+
+        # Generate puzzle
+        self._generate_puzzle()
+        yield
+
+    def _current_tier(self):
+        if self.tier is not None:
+            return self.tier
+        return self.engine.game_state.get("tier_hitung", 0)
+
+    def _generate_puzzle(self):
+        """Buat keranjang dan sebar benda (jawaban + pengecoh) di lapangan"""
+        tier = TIERS[self._current_tier()]
+        kinds = random.sample(KINDS, tier["baskets"])
+        self.puzzle_start = time.perf_counter()
+
+        # Keranjang berjajar di atas
+        spacing = self.engine.width / len(kinds)
+        for i, kind in enumerate(kinds):
+            basket = {
+                'x': spacing * i + (spacing - BASKET_WIDTH) / 2,
+                'y': BASKET_Y,
+                'expected': kind,
+                'required': random.randint(2, tier["max_count"]),
+                'filled': 0,  # Jumlah benda yang sudah masuk
+            }
+            self.baskets.append(basket)
+            self.graph.add(TargetNode(basket, BASKET_WIDTH, self._draw_basket, 0, BASKET_HEIGHT),
+                           parent=self.basket_layer)
+        self.max_score = len(self.baskets)
+
+        # Jawaban lengkap + pengecoh dari semua jenis sampai total benda terpenuhi
+        contents = []
+        for basket in self.baskets:
+            contents += [basket['expected']] * basket['required']
+        while len(contents) < tier["items"]:
+            contents.append(random.choice(KINDS))
+        random.shuffle(contents)
+
+        # Sebar di sel grid lapangan (sedikit acak supaya terlihat alami)
+        columns = int((self.engine.width - 40) // FIELD_CELL)
+        rows = int((self.engine.height - FIELD_TOP - 20) // FIELD_CELL)
+        cells = random.sample(range(columns * rows), len(contents))
+        for content, cell in zip(contents, cells):
+            x = 20 + (cell % columns) * FIELD_CELL + random.uniform(0, FIELD_CELL - ITEM_SIZE)
+            y = FIELD_TOP + (cell // columns) * FIELD_CELL + random.uniform(0, FIELD_CELL - ITEM_SIZE)
+            item = DraggableObject(x, y, ITEM_SIZE, ITEM_SIZE, content, tweens=self.engine.tweens)
+            item.on_drag_start = self._on_drag_start
+            item.on_drop = self._on_drop
+            item.shape = self.engine.assets.hit_shape(content)
+            item.placed = False
+            item.rest = (x, y)
+            item.node = self.graph.add(
+                AssetNode(self.engine.assets, content, x, y, ITEM_SIZE, ITEM_SIZE),
+                parent=self.item_layer,
+            )
+            self.items.append(item)
+
+        # Raster ukuran drag & di keranjang disiapkan di sisa waktu frame,
+        # bukan saat benda pertama kali diangkat
+        scales = [ITEM_SIZE / ASSET_SIZE * s for s in (1.0, 1.2, PLACED_SCALE)]
+        self.engine.jobs.submit(self.engine.assets.prewarm(sorted(set(contents)), scales),
+                                name="assets.prewarm", priority=PRIORITY_LOW)
+
+    def exit(self):
+        """Hentikan animasi yang masih berjalan"""
+        self.engine.tweens.cancel(self)
+        for item in self.moving:
+            self.engine.tweens.cancel(item)
+        self.moving = set()
+        self.end_overlay()
+
+    def atlas_buttons(self):
+        """Tombol kembali (tanpa masuk scene)"""
+        return [Button(*BACK_BUTTON)]
+
+    def is_animating(self):
+        """Render hanya perlu diulang saat ada benda bergerak atau perayaan"""
+        return self.celebration_timer > 0 or bool(self.moving)
+
+    def handle_pointer(self, pointer):
+        """Handle mouse/sentuhan; tiap jari bisa men-drag benda sendiri"""
+        self.back_button.handle_pointer(pointer)
+
+        pointers = self.engine.pointers
+        if pointer.kind == POINTER_DOWN:
+            # Benda teratas yang kena sentuhan jadi milik pointer ini
+            for i in range(len(self.items) - 1, -1, -1):
+                item = self.items[i]
+                if not item.placed and not item.dragging and item.is_point_inside(pointer.x, pointer.y):
+                    item.handle_pointer(pointer)
+                    pointers.capture(pointer.id, item)
+                    self._raise(i)
+                    break
+            return
+
+        # MOVE/UP langsung ke benda pemilik pointer (tanpa memindai semua benda)
+        item = pointers.owner(pointer.id)
+        if item is not None:
+            item.handle_pointer(pointer)
+
+    def _raise(self, index):
+        """Pindahkan benda ke urutan paling atas (gambar & hit-test)"""
+        item = self.items.pop(index)
+        self.items.append(item)
+        self.item_layer.remove(item.node)
+        self.item_layer.add(item.node)
+
+    def update(self, dt):
+        """Update logic (hanya benda yang bergerak)"""
+        self.back_button.update(dt)
+
+        if self.moving:
+            for item in list(self.moving):
+                item.update(dt)
+                if (not item.dragging and item.scale == item.target_scale
+                        and item.rotation == 0 and (item.x, item.y) == item.rest):
+                    self._sync_node(item)
+                    self.moving.discard(item)
+
+        # Update celebration timer
+        if self.celebration_timer > 0:
+            self.celebration_timer -= dt
+            if self.celebration_timer <= 0:
+                self.engine.tweens.cancel(self, "celebration_scale")
+                self.end_overlay()
+                # Naik tingkat setelah menang, lalu kembali ke menu
+                state = self.engine.game_state
+                state["stars_hitung"] = state.get("stars_hitung", 0) + 1
+                state["tier_hitung"] = min(state.get("tier_hitung", 0) + 1, len(TIERS) - 1)
+                self.engine.sync.add("stars_hitung")
+                self.engine.change_scene("menu", FadeTransition())
+
+    def render(self, renderer):
+        """Render level"""
+        # Overlay perayaan: scene di bawahnya sudah dibekukan di backdrop
+        if self.render_backdrop(renderer):
+            self._draw_celebration(renderer)
+            return
+
+        self.render_scene(renderer)
+
+    def render_scene(self, renderer):
+        """Render level tanpa overlay"""
+        renderer.fill_gradient((0.6, 0.85, 0.95), (0.95, 0.9, 0.6))
+
+        # Posisi benda yang bergerak dibaca saat render (nilai tween sudah diinterpolasi)
+        for item in self.moving:
+            self._sync_node(item)
+
+        # Keranjang, benda, skor & tombol (retained scene graph)
+        self._update_score()
+        renderer.draw_graph(self.graph)
+
+    def _sync_node(self, item):
+        item.node.set_transform(x=item.x, y=item.y, rotation=item.rotation, scale=item.scale)
+
+    def _draw_basket(self, ctx, basket):
+        """Draw keranjang: ikon jenis benda, hitungan, dan kotak isi"""
+        x, y = basket['x'], basket['y']
+        full = basket['filled'] >= basket['required']
+
+        ctx.save()
+        ctx.rectangle(x, y, BASKET_WIDTH, BASKET_HEIGHT)
+        ctx.set_source_rgba(1, 1, 1, 0.35)
+        ctx.fill_preserve()
+        ctx.set_line_width(3)
+        ctx.set_dash([10, 5])
+        if full:
+            ctx.set_source_rgba(0, 0.7, 0, 0.8)
+        else:
+            ctx.set_source_rgba(0.3, 0.3, 0.3, 0.6)
+        ctx.stroke()
+        ctx.set_dash([])
+
+        # Ikon jenis benda + angka yang diminta
+        # assets.draw men-scale di sekitar pusat asset: geser agar pojoknya di (x + 10, y + 6)
+        inset = ASSET_SIZE * (1 - ICON_SCALE) / 2
+        self.engine.assets.draw(ctx, basket['expected'], x + 10 - inset, y + 6 - inset, scale=ICON_SCALE)
+        ctx.select_font_face("Arial", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
+        ctx.set_font_size(36)
+        ctx.set_source_rgb(0.2, 0.2, 0.2)
+        ctx.move_to(x + 60, y + 44)
+        ctx.show_text(f"{basket['filled']} / {basket['required']}")
+
+        ctx.restore()
+
+    def _slot_position(self, basket, slot):
+        """Posisi (x, y) benda ke-slot di dalam keranjang"""
+        cx = basket['x'] + 30 + (slot % SLOT_COLUMNS) * SLOT_SPACING
+        cy = basket['y'] + 80 + (slot // SLOT_COLUMNS) * SLOT_SPACING
+        return cx - ITEM_SIZE / 2, cy - ITEM_SIZE / 2
+
+    def _basket_for(self, item):
+        """Keranjang yang paling banyak tertutup bentuk benda (None jika < DROP_OVERLAP)"""
+        best, best_overlap = None, DROP_OVERLAP
+        for basket in self.baskets:
+            overlap = item.overlap(basket['x'], basket['y'], BASKET_WIDTH, BASKET_HEIGHT)
+            if overlap >= best_overlap:
+                best, best_overlap = basket, overlap
+        return best
+
+    def _update_score(self):
+        """Perbarui teks skor (raster hanya dibuat ulang saat skor berubah)"""
+        self.score_node.set_text(f"Keranjang: {self.score}/{self.max_score}")
+        self.score_node.place(self.engine.width - 260, 70)
+
+    def _draw_celebration(self, renderer):
+        """Draw celebration overlay (di atas backdrop yang sudah digelapkan)"""
+        text = "Pintar! 🎉"
+        text_x = (self.engine.width - renderer.text_width(text, 72)) / 2
+        text_y = self.engine.height / 2
+        renderer.draw_text(text, text_x, text_y, 72, color=(1, 0.8, 0), scale=self.celebration_scale)
+
+    def _move_item(self, item, x, y, scale=None):
+        """Animasikan benda ke posisi istirahat barunya"""
+        item.rest = (x, y)
+        tweens = self.engine.tweens
+        tweens.to(item, "x", x, MOVE_TIME)
+        tweens.to(item, "y", y, MOVE_TIME)
+        if scale is not None:
+            item.target_scale = scale
+            tweens.to(item, "scale", scale, MOVE_TIME)
+        self.moving.add(item)
+
+    def _on_drag_start(self, item):
+        """Catat event mulai drag"""
+        self.engine.sound.play("pickup")
+        self.moving.add(item)
+        self.engine.analytics.record(EVENT_DRAG_START, SOURCE_HITUNG, 0, 0.0, item.x, item.y)
+
+    def _on_drop(self, item, snapped):
+        """Masukkan benda ke keranjang yang tepat, atau letakkan di lapangan"""
+        analytics = self.engine.analytics
+        mouse_x, mouse_y = item.pointer_x, item.pointer_y
+        basket = self._basket_for(item)
+        code = encode_content(basket['required']) if basket else 0
+        analytics.record(EVENT_DROP, SOURCE_HITUNG, code, 0.0, mouse_x, mouse_y)
+
+        if basket is None:
+            # Di lapangan: biarkan di tempat (tetap di dalam layar)
+            x = min(max(item.x, 0), self.engine.width - ITEM_SIZE)
+            y = min(max(item.y, FIELD_TOP - ITEM_SIZE / 2), self.engine.height - ITEM_SIZE)
+            self._move_item(item, x, y)
+            return
+
+        ok = basket['expected'] == item.content and basket['filled'] < basket['required']
+        analytics.record(EVENT_SNAP_OK if ok else EVENT_SNAP_FAIL, SOURCE_HITUNG, code, 0.0, mouse_x, mouse_y)
+        self.engine.sync.add(result_key("hitung", basket['required'], ok))
+        if not ok:
+            # Salah jenis atau keranjang sudah penuh: kembali ke tempat semula
+            self._move_item(item, *item.rest)
+            return
+
+        self.engine.sound.play("snap")
+        item.placed = True
+        self._move_item(item, *self._slot_position(basket, basket['filled']), scale=PLACED_SCALE)
+        basket['filled'] += 1
+        if basket['filled'] == basket['required']:
+            self._basket_complete(basket)
+
+    def _basket_complete(self, basket):
+        self.score += 1
+        elapsed = time.perf_counter() - self.puzzle_start
+        self.engine.analytics.record(
+            EVENT_TIME_TO_SOLVE, SOURCE_HITUNG, encode_content(basket['required']), elapsed
+        )
+        if self.score >= self.max_score:
+            self.engine.analytics.record(EVENT_ROUND_COMPLETE, SOURCE_HITUNG, 0, elapsed)
+            self._start_celebration(2.0)
+
+    def _start_celebration(self, duration):
+        """Mulai overlay perayaan dengan efek denyut"""
+        self.begin_overlay(0.7)
+        self.celebration_timer = duration
+        self.celebration_scale = 0.9
+        self.engine.tweens.to(
+            self, "celebration_scale", 1.1, 0.3,
+            EASE_IN_OUT_SINE, loop=True, yoyo=True
+        )
+        self.engine.sound.play("celebrate")
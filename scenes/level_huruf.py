@@ -2,12 +2,31 @@
 Level Huruf Scene - Puzzle menyusun kata sederhana
 """
 
-import pygame
 import cairo
 import random
+import time
 from game_engine import Scene
 from components.button import Button
 from components.draggable import DraggableObject
+from core.tween import EASE_IN_OUT_SINE
+from core.transition import FadeTransition, SlideTransition
+from core.pointer import POINTER_DOWN
+from core.sync import result_key
+from core.scene_graph import SceneGraph, Node, TextNode, TileNode, TargetNode, ButtonNode
+from core.analytics import (
+    encode_content, SOURCE_HURUF,
+    EVENT_DRAG_START, EVENT_DROP, EVENT_SNAP_OK, EVENT_SNAP_FAIL,
+    EVENT_TIME_TO_SOLVE, EVENT_ROUND_COMPLETE,
+)
+
+# Warna tile tetap (bukan acak bebas) supaya semua varian ada di sprite atlas
+TILE_COLORS = (
+    (255, 120, 170), (250, 180, 160), (170, 150, 255),
+    (200, 110, 230), (160, 190, 250), (230, 160, 200),
+)
+
+# Tombol kembali: x, y, lebar, tinggi, teks, warna
+BACK_BUTTON = (50, 50, 150, 60, "← Kembali", (100, 200, 100))
 
 class LevelHurufScene(Scene):
     def __init__(self, engine):
@@ -19,23 +38,54 @@ class LevelHurufScene(Scene):
         self.score = 0
         self.max_score = 3
         self.celebration_timer = 0
+        self.celebration_scale = 1.0
+        self.puzzle_start = 0
+        self.graph = None
         
         # Daftar kata sederhana untuk anak TK
         self.words = ["BOLA", "KUCING", "MAMA", "PAPA", "APEL"]
     
     def enter(self):
         """Setup level saat scene dimulai"""
+        for _ in self.prepare():
+            pass
+    
+    def prepare(self):
+        """Setup level bertahap (dicicil per frame saat transisi)"""
+        self.score = 0
+        yield from self._build_round()
+    
+    def _build_round(self):
+        """Bangun papan untuk satu kata (skor kata selesai tetap)"""
         self.draggables = []
         self.targets = []
-        self.score = 0
         self.celebration_timer = 0
         
+        # Retained scene graph: teks, target, tile, skor, tombol
+        self.graph = SceneGraph(self.engine.width, self.engine.height, self.engine.atlas)
+        self.title_node = self.graph.add(TextNode("", 48, shadow=3))
+        instruction = self.graph.add(TextNode("Tarik huruf ke kotak yang tepat!", 28, color=(0.2, 0.2, 0.2)))
+        instruction.place((self.engine.width - instruction.text_width()) / 2, 200)
+        self.target_layer = self.graph.add(Node())
+        self.tile_layer = self.graph.add(Node())
+        self.score_node = self.graph.add(TextNode("", 32))
+        
         # Create back button
-        self.back_button = Button(50, 50, 150, 60, "← Kembali", (100, 200, 100))
-        self.back_button.on_click = lambda: self.engine.change_scene("menu")
+        self.back_button = Button(*BACK_BUTTON, tweens=self.engine.tweens)
+        self.back_button.on_click = lambda: self.engine.change_scene(
+            "menu", SlideTransition(direction=-1)
+        )
+        self.back_button.on_press = lambda: self.engine.sound.play("click")
+        self.graph.add(ButtonNode(self.back_button))
+        yield
         
         # Generate puzzle
         self._generate_puzzle()
+        
+        # Overlay perayaan kata sebelumnya baru dilepas saat papan baru siap
+        self.end_overlay()
+        self.engine.needs_redraw = True
+        yield
     
     def _generate_puzzle(self):
         """Generate puzzle kata baru"""
@@ -43,6 +93,10 @@ class LevelHurufScene(Scene):
         self.current_word = random.choice(self.words)
         letters = list(self.current_word)
         random.shuffle(letters)
+        self.puzzle_start = time.perf_counter()
+        
+        self.title_node.set_text(f"Susun Kata: {self.current_word}")
+        self.title_node.place((self.engine.width - self.title_node.text_width()) / 2, 150)
         
         # Create draggable letters
         start_y = 500
@@ -52,9 +106,13 @@ class LevelHurufScene(Scene):
         for i, letter in enumerate(letters):
             draggable = DraggableObject(
                 offset_x + i * spacing, start_y, 90, 90, letter,
-                color=(random.randint(150, 255), random.randint(100, 200), random.randint(150, 255))
+                color=random.choice(TILE_COLORS),
+                tweens=self.engine.tweens
             )
+            draggable.on_drag_start = self._on_drag_start
+            draggable.on_drop = self._on_drop
             self.draggables.append(draggable)
+            self.graph.add(TileNode(draggable), parent=self.tile_layer)
         
         # Create target positions
         target_y = 280
@@ -69,20 +127,53 @@ class LevelHurufScene(Scene):
                 'index': i
             }
             self.targets.append(target)
+            self.graph.add(TargetNode(target, 90, self._draw_target), parent=self.target_layer)
             
-            # Set snap targets untuk draggables
+            # Set snap target: huruf kembar (MAMA, PAPA) masing-masing dapat kotaknya sendiri
             for draggable in self.draggables:
-                if draggable.content == expected_letter:
+                if draggable.content == expected_letter and draggable.snap_target is None:
                     draggable.set_snap_target(target['x'], target['y'], tolerance=60)
+                    break
     
-    def handle_event(self, event):
-        """Handle events"""
-        self.back_button.handle_event(event)
-        
-        # Handle draggables
-        for draggable in self.draggables:
-            if draggable.handle_event(event):
-                self._check_answer(draggable)
+    def exit(self):
+        """Hentikan animasi yang masih berjalan"""
+        self.cancel_round()
+        self.engine.tweens.cancel(self)
+        self.end_overlay()
+    
+    def atlas_buttons(self):
+        """Tombol kembali (tanpa masuk scene)"""
+        return [Button(*BACK_BUTTON)]
+    
+    def atlas_tiles(self):
+        """Tile semua huruf dari daftar kata dalam semua warna"""
+        return [DraggableObject(0, 0, 90, 90, letter, color=color)
+                for letter in sorted(set("".join(self.words))) for color in TILE_COLORS]
+    
+    def is_animating(self):
+        """Render hanya perlu diulang saat ada drag atau perayaan"""
+        return self.celebration_timer > 0 or any(d.dragging for d in self.draggables)
+    
+    def handle_pointer(self, pointer):
+        """Handle mouse/sentuhan; tiap jari bisa men-drag tile sendiri"""
+        self.back_button.handle_pointer(pointer)
+        if self.round_pending:
+            return  # Papan ronde berikutnya belum siap
+        
+        pointers = self.engine.pointers
+        if pointer.kind == POINTER_DOWN:
+            # Tile teratas (digambar terakhir) yang kena sentuhan jadi milik pointer ini
+            for draggable in reversed(self.draggables):
+                if not draggable.dragging and draggable.is_point_inside(pointer.x, pointer.y):
+                    draggable.handle_pointer(pointer)
+                    pointers.capture(pointer.id, draggable)
+                    break
+            return
+        
+        # MOVE/UP langsung ke tile pemilik pointer (tanpa memindai semua tile)
+        draggable = pointers.owner(pointer.id)
+        if draggable is not None and draggable.handle_pointer(pointer):
+            self._check_answer(draggable)
     
     def update(self, dt):
         """Update logic"""
@@ -95,65 +186,34 @@ class LevelHurufScene(Scene):
         if self.celebration_timer > 0:
             self.celebration_timer -= dt
             if self.celebration_timer <= 0:
+                self.engine.tweens.cancel(self, "celebration_scale")
                 # Update game state and return to menu or next round
                 if self.score >= self.max_score:
+                    self.end_overlay()
                     self.engine.game_state["stars_huruf"] += 1
-                    self.engine.change_scene("menu")
+                    self.engine.sync.add("stars_huruf")
+                    self.engine.change_scene("menu", FadeTransition())
                 else:
-                    self.enter()
+                    # Kata berikutnya (dicicil lewat engine.jobs); skor kata selesai tetap
+                    self.start_round(self._build_round())
     
-    def render(self, ctx):
+    def render(self, renderer):
         """Render level"""
-        # Background gradient
-        gradient = cairo.LinearGradient(0, 0, 0, self.engine.height)
-        gradient.add_color_stop_rgb(0, 0.6, 0.8, 0.9)
-        gradient.add_color_stop_rgb(1, 0.9, 0.6, 0.8)
-        ctx.rectangle(0, 0, self.engine.width, self.engine.height)
-        ctx.set_source(gradient)
-        ctx.fill()
-        
-        # Draw title
-        ctx.select_font_face("Arial", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
-        ctx.set_font_size(48)
-        title = f"Susun Kata: {self.current_word}"
-        text_extents = ctx.text_extents(title)
-        title_x = (self.engine.width - text_extents.width) / 2
-        
-        ctx.set_source_rgba(0, 0, 0, 0.5)
-        ctx.move_to(title_x + 3, 153)
-        ctx.show_text(title)
-        
-        ctx.set_source_rgb(1, 1, 1)
-        ctx.move_to(title_x, 150)
-        ctx.show_text(title)
-        
-        # Draw instruction
-        ctx.set_font_size(28)
-        instruction = "Tarik huruf ke kotak yang tepat!"
-        text_extents = ctx.text_extents(instruction)
-        instr_x = (self.engine.width - text_extents.width) / 2
-        
-        ctx.set_source_rgb(0.2, 0.2, 0.2)
-        ctx.move_to(instr_x, 200)
-        ctx.show_text(instruction)
-        
-        # Draw target boxes
-        for target in self.targets:
-            self._draw_target(ctx, target)
+        # Overlay perayaan: scene di bawahnya sudah dibekukan di backdrop
+        if self.render_backdrop(renderer):
+            self._draw_celebration(renderer)
+            return
         
-        # Draw draggables
-        for draggable in self.draggables:
-            draggable.render(ctx)
-        
-        # Draw score
-        self._draw_score(ctx)
-        
-        # Draw back button
-        self.back_button.render(ctx)
+        self.render_scene(renderer)
+    
+    def render_scene(self, renderer):
+        """Render level tanpa overlay"""
+        # Background gradient
+        renderer.fill_gradient((0.6, 0.8, 0.9), (0.9, 0.6, 0.8))
         
-        # Draw celebration if completed
-        if self.celebration_timer > 0:
-            self._draw_celebration(ctx)
+        # Title, targets, tiles, score & back button (retained scene graph)
+        self._update_score()
+        renderer.draw_graph(self.graph)
     
     def _draw_target(self, ctx, target):
         """Draw target box"""
@@ -162,6 +222,7 @@ class LevelHurufScene(Scene):
         
         # Draw dashed box
         ctx.save()
+        ctx.select_font_face("Arial", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
         ctx.set_line_width(4)
         ctx.set_dash([10, 5])
         
@@ -186,51 +247,56 @@ class LevelHurufScene(Scene):
         
         ctx.restore()
     
-    def _draw_score(self, ctx):
-        """Draw current score"""
-        ctx.set_font_size(32)
-        score_text = f"Kata Selesai: {self.score}/{self.max_score}"
-        
-        ctx.set_source_rgb(1, 1, 1)
-        ctx.move_to(self.engine.width - 300, 100)
-        ctx.show_text(score_text)
+    def _update_score(self):
+        """Perbarui teks skor (raster hanya dibuat ulang saat skor berubah)"""
+        self.score_node.set_text(f"Kata Selesai: {self.score}/{self.max_score}")
+        self.score_node.place(self.engine.width - 300, 100)
     
-    def _draw_celebration(self, ctx):
-        """Draw celebration overlay"""
-        # Semi-transparent overlay
-        ctx.set_source_rgba(0, 0, 0, 0.7)
-        ctx.rectangle(0, 0, self.engine.width, self.engine.height)
-        ctx.fill()
-        
+    def _draw_celebration(self, renderer):
+        """Draw celebration overlay (di atas backdrop yang sudah digelapkan)"""
         # Celebration text
-        ctx.select_font_face("Arial", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
-        ctx.set_font_size(72)
-        
         text = "Pintar Sekali! 🌟"
-        text_extents = ctx.text_extents(text)
-        text_x = (self.engine.width - text_extents.width) / 2
+        text_x = (self.engine.width - renderer.text_width(text, 72)) / 2
         text_y = self.engine.height / 2
         
-        # Pulsating effect
-        import math
-        scale = 1.0 + 0.1 * math.sin(self.celebration_timer * 10)
-        
-        ctx.save()
-        ctx.translate(self.engine.width/2, self.engine.height/2)
-        ctx.scale(scale, scale)
-        ctx.translate(-self.engine.width/2, -self.engine.height/2)
-        
-        # Rainbow gradient text
-        gradient = cairo.LinearGradient(text_x, text_y - 50, text_x, text_y + 50)
-        gradient.add_color_stop_rgb(0, 1, 0.5, 0.5)
-        gradient.add_color_stop_rgb(0.5, 0.5, 1, 0.5)
-        gradient.add_color_stop_rgb(1, 0.5, 0.5, 1)
-        
-        ctx.set_source(gradient)
-        ctx.move_to(text_x, text_y)
-        ctx.show_text(text)
-        
-        ctx.restore()
+        # Pulsating effect (tween loop yoyo) + rainbow gradient text
+        renderer.draw_text(
+            text, text_x, text_y, 72,
+            scale=self.celebration_scale,
+            gradient=((1, 0.5, 0.5), (0.5, 1, 0.5), (0.5, 0.5, 1))
+        )
+    
+    def _on_drag_start(self, draggable):
+        """Catat event mulai drag"""
+        self.engine.sound.play("pickup")
+        self.engine.analytics.record(
+            EVENT_DRAG_START, SOURCE_HURUF, encode_content(draggable.content),
+            0.0, draggable.x, draggable.y
+        )
+    
+    def _on_drop(self, draggable, snapped):
+        """Catat event drop dan hasil snap"""
+        if snapped:
+            self.engine.sound.play("snap")
+        code = encode_content(draggable.content)
+        mouse_x, mouse_y = draggable.pointer_x, draggable.pointer_y
+        analytics = self.engine.analytics
+        analytics.record(EVENT_DROP, SOURCE_HURUF, code, 0.0, mouse_x, mouse_y)
+        if draggable.snap_target:
+            kind = EVENT_SNAP_OK if snapped else EVENT_SNAP_FAIL
+            analytics.record(kind, SOURCE_HURUF, code, 0.0, mouse_x, mouse_y)
+            self.engine.sync.add(result_key("huruf", draggable.content, snapped))
+    
+    def _start_celebration(self, duration):
+        """Mulai overlay perayaan dengan efek denyut"""
+        self.begin_overlay(0.7)
+        self.celebration_timer = duration
+        self.celebration_scale = 0.9
+        self.engine.tweens.to(
+            self, "celebration_scale", 1.1, 0.3,
+            EASE_IN_OUT_SINE, loop=True, yoyo=True
+        )
+        self.engine.sound.play("celebrate")
     
     def _check_answer(self, draggable):
         """Check if draggable is in correct position"""
@@ -245,12 +311,21 @@ class LevelHurufScene(Scene):
                         # Correct!
                         target['filled'] = True
                         
+                        elapsed = time.perf_counter() - self.puzzle_start
+                        self.engine.analytics.record(
+                            EVENT_TIME_TO_SOLVE, SOURCE_HURUF,
+                            encode_content(draggable.content), elapsed
+                        )
+                        
                         # Check if whole word is completed
                         if all(t['filled'] for t in self.targets):
+                            self.engine.analytics.record(
+                                EVENT_ROUND_COMPLETE, SOURCE_HURUF, 0, elapsed
+                            )
                             self.score += 1
                             if self.score >= self.max_score:
-                                self.celebration_timer = 2.5
+                                self._start_celebration(2.5)
                             else:
                                 # Reset untuk kata baru
-                                self.celebration_timer = 1.5
+                                self._start_celebration(1.5)
                         break
\ No newline at end of file
@@ -3,10 +3,33 @@ Menu Scene - Tampilan menu utama
 """
 
 import pygame
-import cairo
 import math
 from game_engine import Scene
 from components.button import Button
+from core.transition import SlideTransition
+from core.scene_graph import SceneGraph, TextNode, ParticleNode, ButtonNode
+
+# Tombol menu: (teks, warna, scene tujuan; None = keluar)
+MENU_BUTTONS = (
+    ("🔢 Belajar Angka", (255, 107, 107), "level_angka"),
+    ("🔤 Belajar Huruf", (78, 205, 196), "level_huruf"),
+    ("🍎 Menghitung", (255, 193, 77), "level_hitung"),
+    ("🚪 Keluar", (255, 159, 64), None),
+)
+BUTTON_WIDTH = 300
+BUTTON_HEIGHT = 80
+BUTTON_START_Y = 300
+BUTTON_SPACING = 100
+
+class Particle:
+    """Lingkaran latar yang jatuh perlahan (posisi diinterpolasi saat render)"""
+    def __init__(self, x, y, size, speed, color):
+        self.x = x
+        self.y = y
+        self.size = size
+        self.speed = speed
+        self.color = color
+        self.node = None
 
 class MenuScene(Scene):
     def __init__(self, engine):
@@ -14,57 +37,79 @@ class MenuScene(Scene):
         self.buttons = []
         self.particles = []
         self.time = 0
+        self.graph = None
         
     def enter(self):
         """Setup menu saat scene dimulai"""
         self.buttons = []
+        self.graph = SceneGraph(self.engine.width, self.engine.height, self.engine.atlas)
         
         # Create menu buttons
-        button_width = 300
-        button_height = 80
-        start_x = (self.engine.width - button_width) / 2
-        start_y = 300
-        spacing = 100
-        
-        # Button Belajar Angka
-        btn_angka = Button(
-            start_x, start_y, button_width, button_height,
-            "🔢 Belajar Angka", (255, 107, 107)
-        )
-        btn_angka.on_click = lambda: self.engine.change_scene("level_angka")
-        self.buttons.append(btn_angka)
-        
-        # Button Belajar Huruf
-        btn_huruf = Button(
-            start_x, start_y + spacing, button_width, button_height,
-            "🔤 Belajar Huruf", (78, 205, 196)
-        )
-        btn_huruf.on_click = lambda: self.engine.change_scene("level_huruf")
-        self.buttons.append(btn_huruf)
-        
-        # Button Keluar
-        btn_exit = Button(
-            start_x, start_y + spacing * 2, button_width, button_height,
-            "🚪 Keluar", (255, 159, 64)
-        )
-        btn_exit.on_click = lambda: self.engine.quit()
-        self.buttons.append(btn_exit)
+        for button, scene_name in self._make_buttons(self.engine.tweens):
+            if scene_name is None:
+                button.on_click = lambda: self.engine.quit()
+            else:
+                button.on_click = lambda name=scene_name: self.engine.change_scene(name, SlideTransition())
+            button.on_press = lambda: self.engine.sound.play("click")
+            self.buttons.append(button)
         
         # Initialize particles untuk background
         self.particles = []
+        tweens = self.engine.tweens
+        tweens.track(self, "time")
         for i in range(30):
-            self.particles.append({
-                'x': (i * self.engine.width / 30),
-                'y': (i * 50) % self.engine.height,
-                'size': 20 + (i % 3) * 10,
-                'speed': 20 + (i % 4) * 10,
-                'color': self._get_random_color(i)
-            })
+            particle = Particle(
+                x=(i * self.engine.width / 30),
+                y=(i * 50) % self.engine.height,
+                size=20 + (i % 3) * 10,
+                speed=20 + (i % 4) * 10,
+                color=self._get_random_color(i)
+            )
+            particle.node = self.graph.add(ParticleNode(particle.size, particle.color))
+            tweens.track(particle, "y")
+            self.particles.append(particle)
+        
+        # Title with shadow & subtitle
+        title = self.graph.add(TextNode("Petualangan Belajar", 72, shadow=4))
+        title.place((self.engine.width - title.text_width()) / 2, 150)
+        
+        subtitle = self.graph.add(TextNode("untuk Anak TK", 32, alpha=0.9))
+        subtitle.place((self.engine.width - subtitle.text_width()) / 2, 200)
+        
+        # Buttons
+        for button in self.buttons:
+            self.graph.add(ButtonNode(button))
+        
+        # Stars info (progress)
+        stars_angka = self.engine.game_state.get("stars_angka", 0)
+        text = self.graph.add(TextNode(f"⭐ Angka: {stars_angka}", 24))
+        text.place(50, self.engine.height - 100)
+        
+        stars_huruf = self.engine.game_state.get("stars_huruf", 0)
+        text = self.graph.add(TextNode(f"⭐ Huruf: {stars_huruf}", 24))
+        text.place(50, self.engine.height - 60)
+        
+        stars_hitung = self.engine.game_state.get("stars_hitung", 0)
+        text = self.graph.add(TextNode(f"⭐ Hitung: {stars_hitung}", 24))
+        text.place(50, self.engine.height - 20)
+    
+    def _make_buttons(self, tweens=None):
+        """Tombol menu beserta scene tujuannya: [(Button, nama scene)]"""
+        start_x = (self.engine.width - BUTTON_WIDTH) / 2
+        return [
+            (Button(start_x, BUTTON_START_Y + BUTTON_SPACING * i, BUTTON_WIDTH, BUTTON_HEIGHT,
+                    text, color, tweens=tweens), scene_name)
+            for i, (text, color, scene_name) in enumerate(MENU_BUTTONS)
+        ]
+    
+    def atlas_buttons(self):
+        """Semua tombol menu (tanpa masuk scene)"""
+        return [button for button, _ in self._make_buttons()]
     
-    def handle_event(self, event):
-        """Handle events"""
+    def handle_pointer(self, pointer):
+        """Handle mouse/sentuhan"""
         for button in self.buttons:
-            button.handle_event(event)
+            button.handle_pointer(pointer)
     
     def update(self, dt):
         """Update animations"""
@@ -76,88 +121,25 @@ class MenuScene(Scene):
         
         # Update particles
         for particle in self.particles:
-            particle['y'] += particle['speed'] * dt
-            if particle['y'] > self.engine.height:
-                particle['y'] = -particle['size']
+            particle.y += particle.speed * dt
+            if particle.y > self.engine.height:
+                particle.y = -particle.size
+                self.engine.tweens.snap(particle, "y")
     
-    def render(self, ctx):
+    def render(self, renderer):
         """Render menu"""
-        # Draw gradient background
-        gradient = cairo.LinearGradient(0, 0, 0, self.engine.height)
-        gradient.add_color_stop_rgb(0, 0.4, 0.6, 0.9)  # Biru muda
-        gradient.add_color_stop_rgb(1, 0.8, 0.4, 0.9)  # Ungu muda
-        ctx.rectangle(0, 0, self.engine.width, self.engine.height)
-        ctx.set_source(gradient)
-        ctx.fill()
+        # Draw gradient background (biru muda -> ungu muda)
+        renderer.fill_gradient((0.4, 0.6, 0.9), (0.8, 0.4, 0.9))
         
-        # Draw animated particles
+        # Transform partikel dibaca saat render (posisi & waktu sudah diinterpolasi)
         for particle in self.particles:
-            ctx.save()
             # Pulsating effect
-            pulse = 0.8 + 0.2 * math.sin(self.time * 2 + particle['x'])
-            
-            ctx.arc(particle['x'], particle['y'], particle['size'] * pulse, 0, 2 * math.pi)
-            ctx.set_source_rgba(
-                particle['color'][0],
-                particle['color'][1],
-                particle['color'][2],
-                0.3
-            )
-            ctx.fill()
-            ctx.restore()
-        
-        # Draw title with shadow
-        ctx.select_font_face("Arial", cairo.FONT_SLANT_NORMAL, cairo.FONT_WEIGHT_BOLD)
-        ctx.set_font_size(72)
-        
-        title = "Petualangan Belajar"
-        text_extents = ctx.text_extents(title)
-        title_x = (self.engine.width - text_extents.width) / 2
-        title_y = 150
-        
-        # Title shadow
-        ctx.set_source_rgba(0, 0, 0, 0.5)
-        ctx.move_to(title_x + 4, title_y + 4)
-        ctx.show_text(title)
-        
-        # Title text
-        ctx.set_source_rgb(1, 1, 1)
-        ctx.move_to(title_x, title_y)
-        ctx.show_text(title)
-        
-        # Subtitle
-        ctx.set_font_size(32)
-        subtitle = "untuk Anak TK"
-        text_extents = ctx.text_extents(subtitle)
-        subtitle_x = (self.engine.width - text_extents.width) / 2
+            pulse = 0.8 + 0.2 * math.sin(self.time * 2 + particle.x)
+            size = particle.size
+            particle.node.set_transform(x=particle.x - size, y=particle.y - size, scale=pulse)
         
-        ctx.set_source_rgba(1, 1, 1, 0.9)
-        ctx.move_to(subtitle_x, title_y + 50)
-        ctx.show_text(subtitle)
-        
-        # Draw buttons
-        for button in self.buttons:
-            button.render(ctx)
-        
-        # Draw stars info (progress)
-        self._draw_progress_info(ctx)
-    
-    def _draw_progress_info(self, ctx):
-        """Draw progress stars"""
-        ctx.set_font_size(24)
-        
-        # Stars angka
-        stars_angka = self.engine.game_state.get("stars_angka", 0)
-        text = f"⭐ Angka: {stars_angka}"
-        ctx.set_source_rgb(1, 1, 1)
-        ctx.move_to(50, self.engine.height - 100)
-        ctx.show_text(text)
-        
-        # Stars huruf
-        stars_huruf = self.engine.game_state.get("stars_huruf", 0)
-        text = f"⭐ Huruf: {stars_huruf}"
-        ctx.move_to(50, self.engine.height - 60)
-        ctx.show_text(text)
+        # Particles, title, buttons & progress (retained scene graph)
+        renderer.draw_graph(self.graph)
     
     def _get_random_color(self, seed):
         """Generate random pastel color"""
@@ -0,0 +1,85 @@
+"""
+Analytics Report - Ringkasan cepat file log event pembelajaran
+
+Pemakaian:
+    python -m tools.analytics_report logs/analytics.evlog
+"""
+
+import sys
+import numpy as np
+from core.analytics import (
+    read_log, decode_content, SOURCE_NAMES,
+    EVENT_DRAG_START, EVENT_SNAP_OK, EVENT_SNAP_FAIL,
+    EVENT_TIME_TO_SOLVE, EVENT_ROUND_COMPLETE,
+)
+
+
+def summarize(columns):
+    """Hitung statistik per (sumber, isi tile) secara vektor"""
+    kind = columns["kind"]
+    source = columns["source"].astype(np.int64)
+    content = columns["content"].astype(np.int64)
+    value = columns["value"].astype(np.float64)
+
+    # Gabungkan sumber dan isi jadi satu kunci supaya bisa pakai bincount
+    key = source * 256 + content
+    size = int(key.max()) + 1 if len(key) else 1
+
+    def count(event):
+        return np.bincount(key[kind == event], minlength=size)
+
+    drags = count(EVENT_DRAG_START)
+    ok = count(EVENT_SNAP_OK)
+    fail = count(EVENT_SNAP_FAIL)
+
+    solve_mask = kind == EVENT_TIME_TO_SOLVE
+    solve_count = np.bincount(key[solve_mask], minlength=size)
+    solve_sum = np.bincount(key[solve_mask], weights=value[solve_mask], minlength=size)
+
+    rows = []
+    for k in np.nonzero(drags + ok + fail + solve_count)[0]:
+        attempts = ok[k] + fail[k]
+        rows.append({
+            "source": SOURCE_NAMES.get(k // 256, str(k // 256)),
+            "content": decode_content(k % 256),
+            "drags": int(drags[k]),
+            "snap_ok": int(ok[k]),
+            "snap_fail": int(fail[k]),
+            "fail_rate": fail[k] / attempts if attempts else 0.0,
+            "mean_solve": solve_sum[k] / solve_count[k] if solve_count[k] else 0.0,
+        })
+
+    # Yang paling sering gagal di atas
+    rows.sort(key=lambda r: r["fail_rate"], reverse=True)
+
+    rounds = {}
+    rounds_mask = kind == EVENT_ROUND_COMPLETE
+    for s in np.unique(source[rounds_mask]):
+        times = value[rounds_mask & (source == s)]
+        rounds[SOURCE_NAMES.get(int(s), str(s))] = (len(times), float(times.mean()))
+    return rows, rounds
+
+
+def main(argv):
+    if len(argv) < 2:
+        print(__doc__)
+        return 1
+
+    columns = read_log(argv[1])
+    rows, rounds = summarize(columns)
+
+    print(f"Total event: {len(columns['kind'])}")
+    print()
+    print(f"{'Level':<8}{'Isi':<6}{'Drag':>7}{'Benar':>7}{'Salah':>7}{'% Salah':>9}{'Rata2 (s)':>11}")
+    for r in rows:
+        print(f"{r['source']:<8}{r['content']:<6}{r['drags']:>7}{r['snap_ok']:>7}"
+              f"{r['snap_fail']:>7}{r['fail_rate'] * 100:>8.1f}%{r['mean_solve']:>11.2f}")
+
+    print()
+    for source, (n, mean_time) in rounds.items():
+        print(f"Ronde selesai ({source}): {n}, rata-rata {mean_time:.1f} detik")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
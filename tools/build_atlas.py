@@ -0,0 +1,65 @@
+"""
+Build Atlas - Bangun sprite atlas tile & tombol (langkah build)
+
+main.py membangun atlas sendiri jika file belum ada atau hash-nya basi;
+tool ini untuk membangunnya lebih dulu (mis. saat instalasi di komputer
+kelas) supaya startup pertama pun tidak perlu merasterisasi apa pun.
+
+Pemakaian:
+    python -m tools.build_atlas [--output cache/sprites.atlas] [--force]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from core.atlas import SpriteAtlas, build_atlas, collect_variants, content_hash
+from game_engine import GameEngine
+from scenes.menu import MenuScene
+from scenes.level_angka import LevelAngkaScene
+from scenes.level_huruf import LevelHurufScene
+from scenes.level_hitung import LevelHitungScene
+
+SCENES = (
+    ("menu", MenuScene),
+    ("level_angka", LevelAngkaScene),
+    ("level_huruf", LevelHurufScene),
+    ("level_hitung", LevelHitungScene),
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", default=os.path.join("cache", "sprites.atlas"))
+    parser.add_argument("--force", action="store_true", help="bangun ulang walaupun atlas masih cocok")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    engine = GameEngine(1024, 768, 60)
+    for name, scene_class in SCENES:
+        engine.register_scene(name, scene_class(engine))
+
+    variants = collect_variants(engine)
+    atlas = SpriteAtlas(args.output, content_hash(key for key, _, _, _ in variants))
+    if not args.force and atlas.load():
+        print(f"Atlas {args.output} sudah terbaru ({len(atlas)} sprite)")
+        pygame.quit()
+        return 0
+
+    start = time.perf_counter()
+    count = build_atlas(args.output, variants)
+    elapsed = time.perf_counter() - start
+    size = os.path.getsize(args.output)
+    print(f"Atlas {args.output}: {count} sprite, {size / 1024 / 1024:.1f} MB, "
+          f"dibangun dalam {elapsed:.2f} detik")
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,225 @@
+"""
+Determinism Check - Simulasi fixed-timestep harus sama di semua laju render
+
+Setiap level (angka, huruf, hitung) dimasuki dari menu lewat SlideTransition
+lalu dimainkan dengan urutan input yang sama (mouse: ambil tile/benda,
+geser, jatuhkan; satu ke lapangan, satu salah, sisanya benar) pada beberapa
+laju render, mis. 30 dan 144 FPS, dengan late-latch dan prediksi pointer
+aktif. Input dikirim pada batas waktu yang jatuh tepat di awal frame untuk
+semua laju, jadi setiap input tiba setelah jumlah langkah simulasi yang
+sama. Di setiap batas input, state simulasi (scene & transisi aktif,
+posisi/rotasi/skala tile, target, skor, timer, game_state) harus identik
+persis; render dengan interpolasi atau posisi prediksi tidak boleh
+mengubahnya. Gagal (exit code 1) jika ada yang berbeda.
+
+Pemakaian:
+    python -m tools.determinism_check [--rates 30 144] [--levels level_angka ...] [--seed 0]
+"""
+
+import argparse
+import os
+import random
+import sys
+from fractions import Fraction
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from core.render_backend import BACKENDS
+from core.transition import SlideTransition
+from game_engine import GameEngine
+from scenes.menu import MenuScene
+from scenes.level_angka import LevelAngkaScene
+from scenes.level_huruf import LevelHurufScene
+from scenes.level_hitung import LevelHitungScene
+
+LEVELS = ("level_angka", "level_huruf", "level_hitung")
+
+# Jarak antar input (detik); harus kelipatan 1/laju untuk semua laju render
+INPUT_INTERVAL = Fraction(1, 6)
+SETTLE_TIME = 1   # Detik setelah kembali ke menu (transisi & animasi selesai)
+TIME_LIMIT = 90   # Detik simulasi maksimum per level
+PREDICT_MS = 16
+
+
+def _mouse(kind, x, y):
+    if kind == pygame.MOUSEMOTION:
+        return pygame.event.Event(kind, pos=(x, y), rel=(0, 0), buttons=(1, 0, 0))
+    return pygame.event.Event(kind, pos=(x, y), button=1)
+
+
+def _center(piece):
+    return piece.x + piece.width / 2, piece.y + piece.height / 2
+
+
+def plan_drops(scene):
+    """Drag untuk papan sekarang: [(benda, titik jatuh)]
+
+    Satu ke lapangan (kembali ke asal), satu ke target yang salah, lalu
+    semua jawaban yang benar.
+    """
+    if hasattr(scene, "baskets"):
+        free = [item for item in scene.items if not item.placed]
+        drops = []
+        for basket in scene.baskets:
+            target = (basket['x'] + 110, basket['y'] + 75)
+            matching = [item for item in free if item.content == basket['expected']]
+            drops += [(item, target) for item in matching[:basket['required'] - basket['filled']]]
+        wrong = [item for item in free if item.content != scene.baskets[0]['expected']]
+        if wrong:
+            drops.insert(0, (wrong[-1], (scene.baskets[0]['x'] + 110, scene.baskets[0]['y'] + 75)))
+    else:
+        free = [tile for tile in scene.draggables if tile.snap_target and not tile.snapped]
+        drops = [(tile, (tile.snap_target['x'] + tile.width / 2, tile.snap_target['y'] + tile.height / 2))
+                 for tile in free]
+        if len(free) > 1:
+            drops.insert(0, (free[1], drops[0][1]))
+    if free:
+        x, y = _center(free[0])
+        drops.insert(0, (free[0], (x + 80, y - 40)))
+    return drops
+
+
+def drag_events(piece, target):
+    """Event per tick input untuk satu drag: tekan, dua gerakan, lepas"""
+    x, y = _center(piece)
+    tx, ty = target
+    return [
+        [_mouse(pygame.MOUSEBUTTONDOWN, x, y)],
+        [_mouse(pygame.MOUSEMOTION, (x + tx) / 2, (y + ty) / 2 - 30)],
+        [_mouse(pygame.MOUSEMOTION, tx, ty)],
+        [_mouse(pygame.MOUSEBUTTONUP, tx, ty)],
+    ]
+
+
+def idle(engine, scene):
+    """Papan level siap menerima drag baru"""
+    return (engine.current_scene is scene and engine.transition is None
+            and scene.celebration_timer <= 0 and not scene.round_pending)
+
+
+def snapshot(engine, scene):
+    """State simulasi yang harus identik (float dibandingkan persis)"""
+    transition = engine.transition
+    if hasattr(scene, "baskets"):
+        pieces = scene.items
+        targets = [(b['expected'], b['required'], b['filled']) for b in scene.baskets]
+    else:
+        pieces = scene.draggables
+        targets = [(t['expected'], t['filled']) for t in scene.targets]
+    return {
+        "sim_steps": engine.sim_steps,
+        "scene": next(name for name, s in engine.scenes.items() if s is engine.current_scene),
+        "transition": transition and (type(transition).__name__, transition.ready, transition.elapsed),
+        "score": scene.score,
+        "celebration_timer": scene.celebration_timer,
+        "celebration_scale": scene.celebration_scale,
+        "targets": targets,
+        "pieces": [(p.content, p.x, p.y, p.rotation, p.scale, p.snapped, p.dragging) for p in pieces],
+        "tweens": engine.tweens.count,
+        "game_state": dict(engine.game_state),
+    }
+
+
+def run(level, rate, seed, backend, width, height):
+    """Mainkan satu level pada satu laju render; return (snapshot per tick, frame dirender)"""
+    engine = GameEngine(width, height, rate, backend=backend)
+    engine.latency.late_latch = True
+    engine.latency.predict_ms = PREDICT_MS
+    engine.register_scene("menu", MenuScene(engine))
+    engine.register_scene("level_angka", LevelAngkaScene(engine))
+    engine.register_scene("level_huruf", LevelHurufScene(engine))
+    engine.register_scene("level_hitung", LevelHitungScene(engine, tier=0))
+    random.seed(seed)
+    engine.change_scene("menu")
+    engine.step(0.0, ())
+    scene = engine.scenes[level]
+    engine.change_scene(level, SlideTransition())
+
+    frames_per_input = int(INPUT_INTERVAL * rate)
+    ticks_per_second = int(1 / INPUT_INTERVAL)
+    pending = []    # Event drag yang sedang berjalan, satu entri per tick
+    drops = None    # Sisa drag untuk papan sekarang
+    settle = None   # Tick tersisa setelah level selesai
+    states = []
+    rendered = 0
+    for tick in range(TIME_LIMIT * ticks_per_second):
+        states.append(snapshot(engine, scene))
+        if settle is not None:
+            settle -= 1
+            if settle < 0:
+                break
+        elif engine.current_scene is not scene and engine.transition is None:
+            settle = SETTLE_TIME * ticks_per_second
+
+        if not pending and idle(engine, scene):
+            if not drops:
+                drops = plan_drops(scene)
+            if drops:
+                pending = drag_events(*drops.pop(0))
+        elif not pending:
+            drops = None  # Papan berganti (perayaan, kata berikutnya): rencanakan ulang
+        events = pending.pop(0) if pending else []
+
+        for frame in range(frames_per_input):
+            rendered += engine.step(1.0 / rate, events if frame == 0 else ())
+    return states, rendered
+
+
+def compare(base_rate, base_states, rate, states):
+    """Cetak titik pertama yang berbeda; return True jika identik"""
+    if len(states) != len(base_states):
+        print(f"BERBEDA ({base_rate} vs {rate} FPS): {len(base_states)} vs {len(states)} tick")
+    for tick, (base, state) in enumerate(zip(base_states, states)):
+        diff = [key for key in base if state[key] != base[key]]
+        if diff:
+            print(f"BERBEDA ({base_rate} vs {rate} FPS) pada tick input {tick}:")
+            for key in diff:
+                print(f"    {key}: {base[key]!r}")
+                print(f"    {' ' * len(key)}  {state[key]!r}")
+            return False
+    return len(states) == len(base_states)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rates", type=int, nargs="+", default=[30, 144],
+                        help="laju render yang dibandingkan (FPS)")
+    parser.add_argument("--levels", nargs="+", choices=LEVELS, default=list(LEVELS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="cairo")
+    parser.add_argument("--width", type=int, default=1024)
+    parser.add_argument("--height", type=int, default=768)
+    args = parser.parse_args(argv)
+
+    for rate in args.rates:
+        if (INPUT_INTERVAL * rate).denominator != 1:
+            parser.error(f"{rate} FPS: jarak input {INPUT_INTERVAL} detik bukan kelipatan frame")
+
+    pygame.init()
+    failed = False
+    for level in args.levels:
+        results = []
+        for rate in args.rates:
+            states, rendered = run(level, rate, args.seed, args.backend, args.width, args.height)
+            results.append((rate, states))
+            final = states[-1]
+            print(f"{level} {rate:>4} FPS: {rendered} frame dirender, {final['sim_steps']} langkah "
+                  f"simulasi, skor {final['score']}, scene akhir {final['scene']}")
+            if final["scene"] != "menu":
+                failed = True
+                print(f"    {level} tidak selesai dalam {TIME_LIMIT} detik")
+
+        base_rate, base_states = results[0]
+        for rate, states in results[1:]:
+            if not compare(base_rate, base_states, rate, states):
+                failed = True
+    pygame.quit()
+
+    print("GAGAL: simulasi bergantung pada laju render" if failed else "OK: state simulasi identik")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
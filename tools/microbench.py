@@ -0,0 +1,375 @@
+"""
+Microbenchmark - Biaya tiap komponen, per jumlah objek dan resolusi
+
+Setiap benchmark dijalankan untuk tiap jumlah objek. Benchmark render juga
+diulang per resolusi: resolusi diterapkan sebagai skala context (layar
+HiDPI/proyektor: objek digambar lebih besar) dan ukuran surface/layar.
+Benchmark non-render (pointer, update, snap, logika scene) tidak
+bergantung resolusi dan hanya dijalankan pada resolusi pertama. Hasil
+dicetak sebagai kurva skala (waktu per panggilan vs jumlah objek, plus
+eksponen log-log) dan bisa disimpan sebagai baseline lalu dibandingkan di
+run berikutnya.
+
+Pemakaian:
+    python -m tools.microbench                       # jalankan semua
+    python -m tools.microbench --filter Draggable    # sebagian
+    python -m tools.microbench --save                # simpan baseline
+    python -m tools.microbench --compare             # bandingkan dengan baseline
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import cairo
+import numpy as np
+import pygame
+from components.button import Button
+from components.draggable import DraggableObject
+from core.pointer import PointerEvent, POINTER_MOVE
+from game_engine import GameEngine
+from scenes.level_angka import LevelAngkaScene
+from scenes.level_huruf import LevelHurufScene
+
+COUNTS = (1, 10, 100)
+RESOLUTIONS = ((1024, 768), (1920, 1080), (3840, 2160))
+BASE_WIDTH = 1024  # Resolusi desain game
+
+BASELINE = os.path.join("benchmarks", "microbench_baseline.json")
+REGRESSION = 1.2  # > 20% lebih lambat dari baseline = regresi
+
+
+def time_case(run, reset=None, min_time=0.2, repeat=5):
+    """Waktu terbaik satu panggilan run() (detik); reset() tidak ikut diukur"""
+    def timed(number):
+        total = 0.0
+        for _ in range(number):
+            if reset is not None:
+                reset()
+            start = time.perf_counter()
+            run()
+            total += time.perf_counter() - start
+        return total
+
+    number = 1
+    while timed(number) < min_time / repeat and number < 100000:
+        number *= 4
+    return min(timed(number) for _ in range(repeat)) / number
+
+
+# --- Fixture ---
+
+def _surface(resolution):
+    width, height = resolution
+    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
+    ctx = cairo.Context(surface)
+    ctx.scale(width / BASE_WIDTH, width / BASE_WIDTH)
+    return surface, ctx
+
+
+def _buttons(count):
+    return [Button(50 + (i % 8) * 120, 50 + (i // 8) * 70, 110, 60, f"Tombol {i}", (255, 107, 107))
+            for i in range(count)]
+
+
+def _tiles(count):
+    tiles = []
+    for i in range(count):
+        tile = DraggableObject(20 + (i % 9) * 110, 20 + (i // 9) * 110, 100, 100, i % 10,
+                               color=(random.randint(100, 255), 150, 200))
+        tile.set_snap_target(tile.x + 30, tile.y + 30, tolerance=60)
+        tiles.append(tile)
+    return tiles
+
+
+_engine = None
+
+
+def _scene(scene_class):
+    """Scene di satu GameEngine headless (layout scene selalu di resolusi desain)"""
+    global _engine
+    if _engine is None:
+        _engine = GameEngine(BASE_WIDTH, BASE_WIDTH * 3 // 4, 60)
+    scene = scene_class(_engine)
+    scene.enter()
+    return scene
+
+
+# --- Benchmark: setup(count, resolution) -> (run, reset) ---
+
+def bench_button_render(count, resolution):
+    _, ctx = _surface(resolution)
+    buttons = _buttons(count)
+
+    def run():
+        for button in buttons:
+            button.render(ctx)
+    return run, None
+
+
+def bench_button_handle_pointer(count, resolution):
+    buttons = _buttons(count)
+    event = PointerEvent(POINTER_MOVE, 0, 100, 80, 0.0)
+
+    def run():
+        for button in buttons:
+            button.handle_pointer(event)
+    return run, None
+
+
+def bench_draggable_render(count, resolution):
+    _, ctx = _surface(resolution)
+    tiles = _tiles(count)
+    for i, tile in enumerate(tiles):
+        tile.rotation = 0.1 * (i % 3)
+
+    def run():
+        for tile in tiles:
+            tile.render(ctx)
+    return run, None
+
+
+def bench_draggable_update(count, resolution):
+    tiles = _tiles(count)
+    for tile in tiles[::2]:
+        tile.dragging = True
+
+    def run():
+        for tile in tiles:
+            tile.update(1.0 / 60)
+    return run, None
+
+
+def bench_draggable_is_point_inside(count, resolution):
+    tiles = _tiles(count)
+
+    def run():
+        for tile in tiles:
+            tile.is_point_inside(500, 400)
+    return run, None
+
+
+def bench_draggable_is_point_inside_rotated(count, resolution):
+    """Tile diputar & di-scale, titik di dalam bounding box (uji path penuh)"""
+    tiles = _tiles(count)
+    for i, tile in enumerate(tiles):
+        tile.rotation = 0.3 * (i % 5)
+        tile.scale = 1.2
+
+    def run():
+        for tile in tiles:
+            tile.is_point_inside(tile.x + 5, tile.y + 5)
+    return run, None
+
+
+def bench_draggable_check_snap(count, resolution):
+    tiles = _tiles(count)
+
+    def run():
+        for tile in tiles:
+            tile._check_snap()
+    return run, None
+
+
+def bench_draggable_check_snap_overlap(count, resolution):
+    tiles = _tiles(count)
+    for tile in tiles:
+        tile.set_snap_target(tile.x + 30, tile.y + 30, overlap=0.5)
+
+    def run():
+        for tile in tiles:
+            tile._check_snap()
+    return run, None
+
+
+def _bench_draw_target(scene_class):
+    def bench(count, resolution):
+        scene = _scene(scene_class)
+        _, ctx = _surface(resolution)
+        targets = [dict(scene.targets[i % len(scene.targets)], filled=bool(i % 2))
+                   for i in range(count)]
+
+        def run():
+            for target in targets:
+                scene._draw_target(ctx, target)
+        return run, None
+    return bench
+
+
+def _bench_check_answer(scene_class):
+    def bench(count, resolution):
+        scene = _scene(scene_class)
+        # Perbanyak target: _check_answer memindai semua target
+        base = scene.targets
+        scene.targets = [dict(base[i % len(base)]) for i in range(max(count, len(base)))]
+        tile = scene.draggables[0]
+        target = next(t for t in scene.targets if t['expected'] == tile.content)
+        tile.x, tile.y, tile.snapped = target['x'], target['y'], True
+
+        def reset():
+            # Skor tidak pernah mencapai max_score: perayaan tidak ikut terukur
+            scene.score = 0
+            target['filled'] = False
+
+        def run():
+            scene._check_answer(tile)
+        return run, reset
+    return bench
+
+
+def _bench_generate_puzzle(scene_class):
+    """count = jumlah puzzle; papan dikosongkan sebelum tiap puzzle (ukuran puzzle tetap)"""
+    def bench(count, resolution):
+        scene = _scene(scene_class)
+
+        def run():
+            for _ in range(count):
+                scene.draggables = []
+                scene.targets = []
+                scene.tile_layer.children = []
+                scene.target_layer.children = []
+                scene._generate_puzzle()
+        return run, None
+    return bench
+
+
+def bench_cairo_to_pygame(count, resolution):
+    width, height = resolution
+    surface, ctx = _surface(resolution)
+    ctx.set_source_rgb(0.5, 0.7, 0.9)
+    ctx.paint()
+    screen = pygame.Surface(resolution)
+
+    def run():
+        for _ in range(count):
+            surface.flush()
+            image = pygame.image.frombuffer(surface.get_data(), (width, height), 'ARGB')
+            screen.blit(image, (0, 0))
+    return run, None
+
+
+BENCHMARKS = {
+    "Button.render": bench_button_render,
+    "Button.handle_pointer": bench_button_handle_pointer,
+    "DraggableObject.render": bench_draggable_render,
+    "DraggableObject.update": bench_draggable_update,
+    "DraggableObject.is_point_inside": bench_draggable_is_point_inside,
+    "DraggableObject.is_point_inside (rotasi)": bench_draggable_is_point_inside_rotated,
+    "DraggableObject._check_snap": bench_draggable_check_snap,
+    "DraggableObject._check_snap (overlap)": bench_draggable_check_snap_overlap,
+    "LevelAngkaScene._draw_target": _bench_draw_target(LevelAngkaScene),
+    "LevelAngkaScene._check_answer": _bench_check_answer(LevelAngkaScene),
+    "LevelAngkaScene._generate_puzzle": _bench_generate_puzzle(LevelAngkaScene),
+    "LevelHurufScene._draw_target": _bench_draw_target(LevelHurufScene),
+    "LevelHurufScene._check_answer": _bench_check_answer(LevelHurufScene),
+    "LevelHurufScene._generate_puzzle": _bench_generate_puzzle(LevelHurufScene),
+    "cairo_to_pygame": bench_cairo_to_pygame,
+}
+
+# Hanya benchmark ini yang biayanya bergantung pada resolusi
+RENDER_BENCHMARKS = (
+    "Button.render",
+    "DraggableObject.render",
+    "LevelAngkaScene._draw_target",
+    "LevelHurufScene._draw_target",
+    "cairo_to_pygame",
+)
+
+
+def scaling_exponent(counts, times):
+    """Kemiringan log-log waktu total vs jumlah objek (1.0 = linear)"""
+    if len(counts) < 2:
+        return float("nan")
+    return float(np.polyfit(np.log(counts), np.log(times), 1)[0])
+
+
+def run_all(names, counts, resolutions):
+    """Hasil: {benchmark: {"WxH": {count: mikrodetik per panggilan}}}"""
+    results = {}
+    for name in names:
+        bench = BENCHMARKS[name]
+        results[name] = {}
+        for resolution in (resolutions if name in RENDER_BENCHMARKS else resolutions[:1]):
+            key = f"{resolution[0]}x{resolution[1]}"
+            row = {}
+            for count in counts:
+                random.seed(0)
+                run, reset = bench(count, resolution)
+                row[str(count)] = time_case(run, reset) * 1e6
+            results[name][key] = row
+    return results
+
+
+def print_results(results, baseline=None):
+    regressions = []
+    for name, per_resolution in results.items():
+        print(f"\n{name}")
+        for resolution, row in per_resolution.items():
+            counts = [int(c) for c in row]
+            times = [row[c] for c in row]
+            exponent = scaling_exponent(counts, times)
+            curve = "  ".join(f"n={c}: {t:9.1f} us" for c, t in zip(counts, times))
+            line = f"  {resolution:>10}  {curve}  | per objek {times[-1] / counts[-1]:.2f} us, skala n^{exponent:.2f}"
+
+            old = (baseline or {}).get(name, {}).get(resolution)
+            if old:
+                ratios = [row[c] / old[c] for c in row if c in old and old[c] > 0]
+                if ratios:
+                    worst = max(ratios)
+                    line += f"  | vs baseline x{worst:.2f}"
+                    if worst > REGRESSION:
+                        line += "  REGRESI"
+                        regressions.append((name, resolution, worst))
+            print(line)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--filter", default="", help="hanya benchmark yang namanya memuat teks ini")
+    parser.add_argument("--counts", default=",".join(map(str, COUNTS)))
+    parser.add_argument("--resolutions", default=",".join(f"{w}x{h}" for w, h in RESOLUTIONS))
+    parser.add_argument("--baseline", default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="simpan hasil sebagai baseline")
+    parser.add_argument("--compare", action="store_true", help="exit 1 jika ada regresi")
+    args = parser.parse_args(argv)
+
+    counts = [int(c) for c in args.counts.split(",")]
+    resolutions = [tuple(int(v) for v in r.split("x")) for r in args.resolutions.split(",")]
+    names = [name for name in BENCHMARKS if args.filter in name]
+
+    pygame.init()
+    results = run_all(names, counts, resolutions)
+    pygame.quit()
+
+    baseline = None
+    if args.compare and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    regressions = print_results(results, baseline)
+
+    if args.save:
+        stored = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                stored = json.load(f)
+        stored.update(results)
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+        print(f"\nBaseline disimpan ke {args.baseline}")
+
+    if regressions:
+        print(f"\n{len(regressions)} regresi terhadap baseline")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""
+Render Benchmark - Bandingkan waktu frame backend Cairo vs pygame
+
+Jalan headless (SDL dummy driver). Setiap scene dirender N frame penuh
+(update + render + present), sekali dalam keadaan diam dan sekali dengan
+satu tile sedang di-drag (tile berputar = cache sprite terus berganti).
+
+Pemakaian:
+    python -m tools.render_benchmark [jumlah_frame]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+from core.render_backend import BACKENDS
+from game_engine import GameEngine
+from scenes.menu import MenuScene
+from scenes.level_angka import LevelAngkaScene
+from scenes.level_huruf import LevelHurufScene
+
+SCENES = (
+    ("menu", MenuScene, False),
+    ("level_angka", LevelAngkaScene, False),
+    ("level_angka+drag", LevelAngkaScene, True),
+    ("level_huruf", LevelHurufScene, False),
+    ("level_huruf+drag", LevelHurufScene, True),
+)
+
+
+def measure(backend, scene_class, drag, frames, width=1024, height=768, fps=60):
+    """Waktu per frame (ms) untuk satu scene pada satu backend"""
+    engine = GameEngine(width, height, fps, backend=backend)
+    engine.register_scene("bench", scene_class(engine))
+    engine.change_scene("bench")
+    scene = engine.current_scene
+
+    if drag and scene.draggables:
+        scene.draggables[0].dragging = True
+
+    dt = 1.0 / fps
+    # Pemanasan: isi cache raster/sprite sebelum diukur
+    for _ in range(10):
+        engine.tweens.step(dt)
+        scene.update(dt)
+        engine.render_frame()
+
+    times = np.empty(frames)
+    for i in range(frames):
+        start = time.perf_counter()
+        engine.tweens.step(dt)
+        scene.update(dt)
+        engine.render_frame()
+        times[i] = time.perf_counter() - start
+    return times * 1000
+
+
+def main(argv):
+    frames = int(argv[1]) if len(argv) > 1 else 300
+    pygame.init()
+
+    results = {}
+    print(f"{'Scene':<20}{'Backend':<10}{'Rata2 (ms)':>12}{'p95 (ms)':>10}")
+    for label, scene_class, drag in SCENES:
+        for backend in sorted(BACKENDS):
+            times = measure(backend, scene_class, drag, frames)
+            results[(label, backend)] = times
+            print(f"{label:<20}{backend:<10}{times.mean():>12.2f}{np.percentile(times, 95):>10.2f}")
+
+    print()
+    totals = {
+        backend: np.mean([results[(label, backend)].mean() for label, _, _ in SCENES])
+        for backend in BACKENDS
+    }
+    best = min(totals, key=totals.get)
+    for backend, mean in sorted(totals.items()):
+        print(f"Rata-rata semua scene ({backend}): {mean:.2f} ms")
+    print(f"Rekomendasi: --backend {best}")
+
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,151 @@
+"""
+Soak Test - Main ribuan ronde headless dan deteksi drift memori/frame time
+
+Ronde dimainkan lewat GameEngine.step() seperti game loop asli: masuk
+level dari menu (dengan transisi), tile/benda di-drag dengan event mouse
+sintetis (tekan, geser, lepas; termasuk drop yang salah) sampai semua
+jawaban benar, perayaan berjalan sampai selesai, lalu kembali ke menu.
+Level angka, huruf dan hitung dimainkan bergantian. Setiap blok ronde
+dicatat memori yang dilacak tracemalloc (setelah gc) dan rata-rata waktu
+frame. Gagal (exit code 1) jika tren keduanya naik melewati toleransi.
+
+Pemakaian:
+    python -m tools.soak_test [--rounds 2000] [--block 50] [--backend cairo]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+from core.memory import object_counts, count_diff
+from core.render_backend import BACKENDS
+from core.transition import SlideTransition
+from game_engine import GameEngine
+from scenes.menu import MenuScene
+from scenes.level_angka import LevelAngkaScene
+from scenes.level_huruf import LevelHurufScene
+from scenes.level_hitung import LevelHitungScene
+from tools.determinism_check import plan_drops, drag_events, idle
+
+LEVELS = ("level_angka", "level_huruf", "level_hitung")
+MAX_ROUND_FRAMES = 3000
+
+
+def play_round(engine, level, dt, frame_times):
+    """Satu ronde penuh: menu -> level -> perayaan -> menu
+
+    Input lewat event mouse (capture pointer, hit-test, callback drag &
+    tween berjalan seperti aslinya), satu event per frame. Level bisa
+    berisi beberapa papan (mis. 3 kata di level huruf); drag direncanakan
+    ulang untuk setiap papan sampai scene berganti.
+    """
+    engine.change_scene(level, SlideTransition())
+    scene = engine.current_scene
+    pending = []  # Event drag yang sedang berjalan
+    drops = None  # Sisa drag untuk papan sekarang
+
+    for _ in range(MAX_ROUND_FRAMES):
+        events = ()
+        if engine.current_scene is not scene:
+            # Sudah kembali ke menu; tunggu transisinya selesai
+            if engine.transition is None:
+                return True
+        elif pending:
+            events = pending.pop(0)
+        elif idle(engine, scene):
+            if not drops:
+                drops = plan_drops(scene)
+            if drops:
+                pending = drag_events(*drops.pop(0))
+                events = pending.pop(0)
+        else:
+            drops = None  # Perayaan / papan berikutnya: rencanakan ulang
+
+        if engine.step(dt, events):
+            frame_times.append(engine.frame_time)
+    return False
+
+
+def trend(values):
+    """Pertambahan total sepanjang run menurut garis regresi linear"""
+    x = np.arange(len(values))
+    slope = np.polyfit(x, values, 1)[0]
+    return slope * (len(values) - 1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=2000)
+    parser.add_argument("--block", type=int, default=50, help="ronde per sampel")
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="cairo")
+    parser.add_argument("--memory-tolerance", type=float, default=512,
+                        help="batas pertambahan memori (KiB) sepanjang run")
+    parser.add_argument("--frame-tolerance", type=float, default=0.2,
+                        help="batas kenaikan relatif waktu frame (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    engine = GameEngine(1024, 768, 60, backend=args.backend)
+    engine.register_scene("menu", MenuScene(engine))
+    for name, scene_class in zip(LEVELS, (LevelAngkaScene, LevelHurufScene, LevelHitungScene)):
+        engine.register_scene(name, scene_class(engine))
+    engine.change_scene("menu")
+
+    dt = 1.0 / engine.fps
+    tracemalloc.start()
+    memory = []
+    frame_ms = []
+    first_counts = None
+    counts = None
+
+    blocks = max(1, args.rounds // args.block)
+    for block in range(blocks):
+        frame_times = []
+        for i in range(args.block):
+            level = LEVELS[(block * args.block + i) % len(LEVELS)]
+            if not play_round(engine, level, dt, frame_times):
+                print(f"GAGAL: ronde {block * args.block + i} di {level} tidak selesai")
+                return 1
+
+        gc.collect()
+        memory.append(tracemalloc.get_traced_memory()[0] / 1024)
+        frame_ms.append(np.mean(frame_times) * 1000 if frame_times else 0.0)
+        counts = object_counts()
+        if first_counts is None:
+            first_counts = counts
+        print(f"blok {block + 1}/{blocks}: memori {memory[-1]:.0f} KiB, "
+              f"frame {frame_ms[-1]:.2f} ms", flush=True)
+
+    tracemalloc.stop()
+    pygame.quit()
+
+    # Blok pertama = pemanasan (cache raster, font, pool tween) tidak dinilai
+    memory = memory[1:]
+    frame_ms = frame_ms[1:]
+    if len(memory) < 3:
+        print("Terlalu sedikit blok untuk menilai tren (naikkan --rounds)")
+        return 0
+
+    memory_growth = trend(memory)
+    frame_growth = trend(frame_ms) / max(np.mean(frame_ms[:max(1, len(frame_ms) // 4)]), 1e-9)
+
+    print()
+    print(f"Tren memori: {memory_growth:+.1f} KiB (batas {args.memory_tolerance:.0f} KiB)")
+    print(f"Tren waktu frame: {frame_growth * 100:+.1f}% (batas {args.frame_tolerance * 100:.0f}%)")
+    for name, diff, total in count_diff(first_counts, counts):
+        print(f"    {diff:+8d} obj   {name} (total {total})")
+
+    failed = memory_growth > args.memory_tolerance or frame_growth > args.frame_tolerance
+    print("GAGAL: memori/waktu frame terus naik" if failed else "LULUS")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
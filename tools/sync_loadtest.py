@@ -0,0 +1,141 @@
+"""
+Sync Load Test - Satu kelas virtual: N SyncClient + server referensi
+
+Server referensi dijalankan di thread sendiri, lalu N klien (masing-masing
+dengan thread asyncio sendiri, seperti di game) menerima delta acak dari
+"game loop" simulasi. Di tengah tes server bisa dimatikan sebentar untuk
+menguji retry/backoff. Di akhir, total di server dibandingkan dengan
+jumlah semua delta yang dikirim klien, dan biaya add() di game loop
+dicetak (harus tetap mikrodetik walaupun jaringan mati).
+
+Pemakaian:
+    python -m tools.sync_loadtest [--clients 30] [--duration 20] [--outage 5]
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import threading
+import time
+import numpy as np
+from core.sync import SyncClient, result_key
+from tools.sync_server import SyncServer
+
+CONTENTS = [str(n) for n in range(1, 10)] + [chr(c) for c in range(ord("A"), ord("Z") + 1)]
+
+
+class ServerThread:
+    """SyncServer dengan event loop di thread terpisah"""
+
+    def __init__(self):
+        self.server = SyncServer()
+        self.loop = asyncio.new_event_loop()
+        self.port = 0
+        self._thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def call(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def start(self, port=0):
+        self.port = self.call(self.server.start("127.0.0.1", port))
+
+    def stop(self):
+        self.call(self.server.close())
+
+    def shutdown(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+
+
+def play(client, rng, expected, add_times, until):
+    """Game loop simulasi 60 FPS: sesekali ada jawaban/bintang baru"""
+    while time.perf_counter() < until:
+        if rng.random() < 0.3:
+            source = rng.choice(("angka", "huruf"))
+            key = result_key(source, rng.choice(CONTENTS), rng.random() < 0.8)
+            if rng.random() < 0.05:
+                key = f"stars_{source}"
+            start = time.perf_counter()
+            client.add(key)
+            add_times.append(time.perf_counter() - start)
+            expected[key] = expected.get(key, 0) + 1
+        time.sleep(1 / 60)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=30)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--interval", type=float, default=1.0, help="interval kirim klien (detik)")
+    parser.add_argument("--outage", type=float, default=5.0, help="lama server mati di tengah tes (0 = tidak)")
+    args = parser.parse_args(argv)
+
+    server = ServerThread()
+    server.start()
+    url = f"http://127.0.0.1:{server.port}"
+
+    clients = []
+    expected = []
+    add_times = []
+    until = time.perf_counter() + args.duration
+    players = []
+    for i in range(args.clients):
+        client = SyncClient(interval=args.interval, max_backoff=4 * args.interval)
+        client.start(url, f"pc-{i:02d}")
+        totals = {}
+        clients.append(client)
+        expected.append(totals)
+        player = threading.Thread(target=play, args=(client, random.Random(i), totals, add_times, until))
+        player.start()
+        players.append(player)
+
+    if args.outage > 0:
+        time.sleep(max(0.0, (args.duration - args.outage) / 2))
+        server.stop()
+        print(f"Server dimatikan {args.outage:.1f} detik...")
+        time.sleep(args.outage)
+        server.start(server.port)
+        print("Server hidup lagi")
+
+    for player in players:
+        player.join()
+    for client in clients:
+        client.stop()
+    server.stop()
+
+    truth = {}
+    for totals in expected:
+        for key, amount in totals.items():
+            truth[key] = truth.get(key, 0) + amount
+    received = server.server.totals
+    missing = sum(truth.values()) - sum(received.values())
+    mismatched = [key for key in truth if received.get(key, 0) != truth[key]]
+
+    stats = server.server.stats()
+    batches = sum(c.batches for c in clients)
+    retries = sum(c.retries for c in clients)
+    connects = sum(c.connects for c in clients)
+    compression = np.mean([c.stats()["compression"] for c in clients if c.raw_bytes])
+    upload_ms = np.mean([c.stats()["upload_ms"] for c in clients if c.batches])
+    times = np.array(add_times) * 1e6
+
+    print(f"{args.clients} klien, {args.duration:.0f} detik, {sum(truth.values())} delta")
+    print(f"Server: {stats['batches']} batch, {stats['duplicates']} kiriman ulang dibuang, "
+          f"{stats['bytes_in'] / 1024:.1f} KB diterima")
+    print(f"Klien: {batches} batch, {retries} retry, {connects} koneksi "
+          f"({connects / args.clients:.1f} per klien), ukuran gzip {compression * 100:.0f}%, "
+          f"upload rata-rata {upload_ms:.2f} ms")
+    print(f"add() di game loop: rata-rata {times.mean():.1f} us, maks {times.max():.1f} us")
+    server.shutdown()
+
+    if missing or mismatched:
+        print(f"GAGAL: {missing} delta hilang, {len(mismatched)} kunci tidak cocok")
+        return 1
+    print("OK: total server sama dengan semua delta klien")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
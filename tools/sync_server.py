@@ -0,0 +1,183 @@
+"""
+Sync Server - Server referensi pengumpul progres kelas (lokal)
+
+Menerima batch delta dari SyncClient (core/sync.py) lewat HTTP/1.1
+keep-alive, membuang kiriman ulang berdasarkan (machine, session, seq),
+lalu menjumlah delta per mesin dan untuk seluruh kelas. Semua state ada
+di memori (dict penghitung); opsional disimpan ke file JSON berkala.
+
+    POST /sync      batch gzip JSON dari game
+    GET  /summary   total kelas + per mesin (untuk dashboard guru)
+
+Pemakaian:
+    python -m tools.sync_server [--host 0.0.0.0] [--port 8765] [--state kelas.json]
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import sys
+from core.sync import SYNC_PATH, read_message
+
+SUMMARY_PATH = "/summary"
+SAVE_INTERVAL = 10.0
+
+
+class SyncServer:
+    def __init__(self, state_path=None):
+        self.state_path = state_path
+        self.totals = {}
+        self.machines = {}
+        self._last_seq = {}
+        self._server = None
+        self._writers = set()
+        self._dirty = False
+
+        self.requests = 0
+        self.batches = 0
+        self.duplicates = 0
+        self.bytes_in = 0
+        self._load()
+
+    async def start(self, host="0.0.0.0", port=8765):
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        """Tutup server dan semua koneksi keep-alive yang masih terbuka"""
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+        self.save()
+
+    def apply(self, batch):
+        """Jumlahkan satu batch; return False jika batch ini kiriman ulang"""
+        machine = batch["machine"]
+        stream = f"{machine}/{batch['session']}"
+        seq = batch["seq"]
+        if seq <= self._last_seq.get(stream, 0):
+            self.duplicates += 1
+            return False
+        self._last_seq[stream] = seq
+
+        per_machine = self.machines.setdefault(machine, {})
+        totals = self.totals
+        for key, amount in batch["deltas"].items():
+            totals[key] = totals.get(key, 0) + amount
+            per_machine[key] = per_machine.get(key, 0) + amount
+        self.batches += 1
+        self._dirty = True
+        return True
+
+    def summary(self):
+        return {"totals": self.totals, "machines": self.machines}
+
+    def stats(self):
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "duplicates": self.duplicates,
+            "machines": len(self.machines),
+            "bytes_in": self.bytes_in,
+        }
+
+    async def _handle(self, reader, writer):
+        """Satu koneksi: layani request berurutan sampai klien menutup"""
+        self._writers.add(writer)
+        try:
+            while True:
+                try:
+                    request, headers, body = await read_message(reader)
+                except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+                    break
+                self.requests += 1
+                self.bytes_in += len(body)
+                method, _, rest = request.partition(" ")
+                path = rest.split(" ", 1)[0]
+                status, payload = self._route(method, path, headers, body)
+
+                data = json.dumps(payload).encode("utf-8")
+                writer.write((
+                    f"HTTP/1.1 {status}\r\n"
+                    "Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    "Connection: keep-alive\r\n\r\n"
+                ).encode("ascii") + data)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    def _route(self, method, path, headers, body):
+        if method == "POST" and path == SYNC_PATH:
+            try:
+                if headers.get("content-encoding") == "gzip":
+                    body = gzip.decompress(body)
+                batch = json.loads(body)
+                applied = self.apply(batch)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                return "400 Bad Request", {"error": str(e)}
+            return "200 OK", {"applied": applied}
+        if method == "GET" and path == SUMMARY_PATH:
+            return "200 OK", self.summary()
+        return "404 Not Found", {"error": path}
+
+    # --- State di disk ---
+
+    def _load(self):
+        if not self.state_path or not os.path.exists(self.state_path):
+            return
+        with open(self.state_path) as f:
+            state = json.load(f)
+        self.totals = state["totals"]
+        self.machines = state["machines"]
+        self._last_seq = state["last_seq"]
+
+    def save(self):
+        if not self.state_path or not self._dirty:
+            return
+        tmp = self.state_path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump({"totals": self.totals, "machines": self.machines,
+                       "last_seq": self._last_seq}, f)
+        os.replace(tmp, self.state_path)
+        self._dirty = False
+
+
+async def serve(host, port, state_path):
+    server = SyncServer(state_path)
+    port = await server.start(host, port)
+    print(f"Sync server di http://{host}:{port}{SYNC_PATH} (ringkasan: {SUMMARY_PATH})")
+    try:
+        while True:
+            await asyncio.sleep(SAVE_INTERVAL)
+            server.save()
+    finally:
+        await server.close()
+        stats = server.stats()
+        print(f"{stats['batches']} batch dari {stats['machines']} mesin, "
+              f"{stats['duplicates']} kiriman ulang dibuang")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--state", help="file JSON untuk menyimpan total antar restart")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.state))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Tile Benchmark - Skala rasterisasi paralel 1..N thread
+
+Setiap scene ditata pada resolusi desain (1024x768) lalu di-scale
+(ctx.scale) ke resolusi tinggi (default 3840x2160), jadi isi scene
+mengisi seluruh target seperti di layar besar. Dirender dengan
+backend cairo biasa sebagai pembanding, lalu dengan cairo-tiled untuk
+1, 2, 4, ... N thread. Dicetak waktu frame rata-rata, speedup terhadap
+1 thread, dan efisiensi (speedup / thread).
+
+Pemakaian:
+    python -m tools.tile_benchmark [--width 3840] [--height 2160] [--frames 60] [--max-threads N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+from game_engine import GameEngine
+from scenes.menu import MenuScene
+from scenes.level_angka import LevelAngkaScene
+from scenes.level_huruf import LevelHurufScene
+
+DESIGN_WIDTH, DESIGN_HEIGHT = 1024, 768
+
+SCENES = (
+    ("menu", MenuScene),
+    ("level_angka", LevelAngkaScene),
+    ("level_huruf", LevelHurufScene),
+)
+
+
+def thread_counts(maximum):
+    """1, 2, 4, ... sampai maximum (maximum selalu ikut)"""
+    counts = []
+    n = 1
+    while n < maximum:
+        counts.append(n)
+        n *= 2
+    counts.append(maximum)
+    return counts
+
+
+def render_scaled(engine, scale):
+    """Seperti engine.render_frame, dengan scene di-scale ke resolusi target"""
+    backend = engine.backend
+    backend.begin_frame()
+    backend.ctx.scale(scale, scale)
+    engine.current_scene.render(backend)
+    backend.present(engine.screen)
+
+
+def measure(backend, threads, scene_class, width, height, frames):
+    """Waktu render frame rata-rata (ms) untuk satu konfigurasi"""
+    engine = GameEngine(width, height, 60, backend=backend, render_threads=threads)
+    # Backend tetap di resolusi target; scene menata diri di resolusi desain
+    engine.width, engine.height = DESIGN_WIDTH, DESIGN_HEIGHT
+    scale = min(width / DESIGN_WIDTH, height / DESIGN_HEIGHT)
+    engine.register_scene("bench", scene_class(engine))
+    engine.change_scene("bench")
+    scene = engine.current_scene
+
+    dt = 1.0 / 60
+    for _ in range(5):
+        scene.update(dt)
+        render_scaled(engine, scale)
+
+    times = np.empty(frames)
+    for i in range(frames):
+        scene.update(dt)
+        start = time.perf_counter()
+        render_scaled(engine, scale)
+        times[i] = time.perf_counter() - start
+
+    pool = getattr(engine.backend, "pool", None)
+    if pool is not None:
+        pool.shutdown()
+    return times.mean() * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--width", type=int, default=3840)
+    parser.add_argument("--height", type=int, default=2160)
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--max-threads", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args(argv)
+
+    pygame.init()
+    print(f"Resolusi {args.width}x{args.height}, {args.frames} frame per konfigurasi")
+    for label, scene_class in SCENES:
+        print()
+        baseline = measure("cairo", None, scene_class, args.width, args.height, args.frames)
+        print(f"{label}: cairo (tanpa tile) {baseline:.2f} ms")
+        print(f"{'Thread':>8}{'ms/frame':>10}{'Speedup':>9}{'Efisiensi':>11}{'FPS':>7}")
+        single = None
+        for threads in thread_counts(args.max_threads):
+            ms = measure("cairo-tiled", threads, scene_class, args.width, args.height, args.frames)
+            single = single or ms
+            speedup = single / ms
+            print(f"{threads:>8}{ms:>10.2f}{speedup:>8.2f}x{speedup / threads * 100:>10.0f}%{1000 / ms:>7.1f}")
+
+    pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())